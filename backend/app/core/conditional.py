@@ -0,0 +1,161 @@
+"""
+HTTP conditional GETs (ETag / Last-Modified) for tenant-scoped reads.
+
+A read endpoint declares the tenant resources its response is built from:
+
+    _: None = Depends(conditional_get(TenantResource.PLANS))
+
+The dependency reads their write versions (one small query) and either
+answers If-None-Match / If-Modified-Since with 304 before the endpoint body
+runs, or attaches ETag and Last-Modified to the response. Declare it after
+the endpoint's own auth dependency so permission errors still win.
+"""
+
+import hashlib
+from datetime import date, datetime, time, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_async_db, get_db
+from app.core.deps import get_current_user, get_current_user_async
+from app.core.exceptions import NotModifiedException
+from app.models.tenant_resource_version import TenantResource
+from app.models.users import User
+from app.services.resource_version_service import get_resource_versions
+
+# Responses that also depend on today's date (member status is derived from it)
+DATE_DEPENDENT_RESOURCES = {TenantResource.MEMBERS}
+
+
+def _utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def resource_validators(
+    request: Request,
+    tenant_id: int,
+    resources: Sequence[TenantResource],
+    versions: Dict[TenantResource, Tuple[int, datetime]],
+) -> Tuple[str, Optional[datetime]]:
+    """
+    Strong ETag and Last-Modified for a response built from these resources.
+
+    The ETag covers the tenant, each resource version and the request path
+    and query (each page/filter is its own representation). Last-Modified
+    is only known once every resource has been written since versioning
+    started.
+    """
+    today = date.today()
+    daily = any(resource in DATE_DEPENDENT_RESOURCES for resource in resources)
+
+    parts = [str(tenant_id), request.url.path]
+    parts += [
+        f"{key}={value}" for key, value in sorted(request.query_params.multi_items())
+    ]
+    parts += [f"{r.value}:{versions.get(r, (0, None))[0]}" for r in resources]
+    if daily:
+        parts.append(today.isoformat())
+    etag = f'"{hashlib.sha1("|".join(parts).encode()).hexdigest()}"'
+
+    last_modified = None
+    if resources and all(resource in versions for resource in resources):
+        last_modified = max(_utc(versions[resource][1]) for resource in resources)
+        if daily:
+            midnight = datetime.combine(today, time.min).astimezone(timezone.utc)
+            last_modified = max(last_modified, midnight)
+
+    return etag, last_modified
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 specifies for it)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _not_modified_since(request: Request, last_modified: Optional[datetime]) -> bool:
+    # If-Modified-Since is ignored when If-None-Match is present
+    header = request.headers.get("if-modified-since")
+    if last_modified is None or not header or "if-none-match" in request.headers:
+        return False
+    try:
+        since = _utc(parsedate_to_datetime(header))
+    except (TypeError, ValueError):
+        return False
+    return last_modified.replace(microsecond=0) <= since
+
+
+def apply_conditional(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+) -> None:
+    """
+    Raise NotModifiedException (304) if the client's copy is current,
+    otherwise set the validators on the response.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+
+    if etag_matches(request, etag) or _not_modified_since(request, last_modified):
+        raise NotModifiedException(headers=headers)
+
+    response.headers.update(headers)
+
+
+def _check(
+    db: Session,
+    request: Request,
+    response: Response,
+    tenant_id: Optional[int],
+    resources: Sequence[TenantResource],
+) -> None:
+    if not tenant_id:
+        return  # the endpoint rejects tenant-less users itself
+    versions = get_resource_versions(db, tenant_id, resources)
+    apply_conditional(
+        request, response, *resource_validators(request, tenant_id, resources, versions)
+    )
+
+
+def conditional_get(*resources: TenantResource):
+    """
+    Dependency factory for conditional GETs on sync routes.
+
+    Usage: _: None = Depends(conditional_get(TenantResource.PLANS))
+    """
+
+    def _conditional(
+        request: Request,
+        response: Response,
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db),
+    ) -> None:
+        _check(db, request, response, current_user.tenant_id, resources)
+
+    return _conditional
+
+
+def conditional_get_async(*resources: TenantResource):
+    """Async variant of conditional_get for async def routes."""
+
+    async def _conditional(
+        request: Request,
+        response: Response,
+        current_user: User = Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ) -> None:
+        await db.run_sync(_check, request, response, current_user.tenant_id, resources)
+
+    return _conditional
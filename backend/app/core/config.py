@@ -16,16 +16,75 @@ class Settings(BaseSettings):
     DATABASE_NAME: str
     DATABASE_USER: str
     DATABASE_PASSWORD: str
+    # asyncpg URL for async routes; derived from DATABASE_URL when unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Connection pool (applied to both the sync and async engines)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800  # seconds, -1 disables
 
     # JWT Configuration
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
 
+    # Auth: trust signed JWT claims instead of loading the user per request.
+    # Revocation is checked against a short-TTL cache of is_active/token_version.
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False
+    USER_CACHE_TTL_SECONDS: int = 30
+
+    # bcrypt hashing/verification process pool (workers 0 = CPU count, -1 = inline)
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_MAX_PENDING: int = 64  # queued + running; beyond this, 503
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 10.0
+
+    # Subscription plan catalog: in-memory copy re-read this often (seconds)
+    PLAN_CATALOG_TTL_SECONDS: int = 300
+
+    # Subscription entitlement cache (seconds, 0 disables)
+    ENTITLEMENT_CACHE_TTL_SECONDS: int = 60
+
     # WhatsApp Configuration (WPPConnect Server)
     WPPCONNECT_BASE_URL: str = "http://localhost:21465"
     WPPCONNECT_SECRET_KEY: str = ""  # Optional, for API authentication
     WHATSAPP_ENABLED: bool = True
+    # Shared pooled client used for all WPPConnect calls
+    WHATSAPP_HTTP_TIMEOUT_SECONDS: float = 30.0
+    WHATSAPP_MAX_CONNECTIONS: int = 100
+    WHATSAPP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    WHATSAPP_HTTP2: bool = False  # requires httpx[http2]
+    # Concurrent in-flight sends per tenant session
+    WHATSAPP_SESSION_CONCURRENCY: int = 10
+    # Messages of a batch materialised/in flight at once
+    WHATSAPP_BATCH_WINDOW: int = 200
+    # Per-session pacing (token bucket; rate 0 disables) and circuit breaker
+    WHATSAPP_RATE_PER_SECOND: float = 5.0
+    WHATSAPP_RATE_BURST: int = 10
+    WHATSAPP_BREAKER_FAILURE_THRESHOLD: int = 5
+    WHATSAPP_BREAKER_COOLDOWN_SECONDS: int = 60
+
+    # Notification outbox worker
+    NOTIFICATION_BATCH_SIZE: int = 100
+    NOTIFICATION_POLL_INTERVAL_SECONDS: float = 5.0
+    NOTIFICATION_MAX_ATTEMPTS: int = 6
+    NOTIFICATION_RETRY_BASE_SECONDS: int = 30  # doubled per attempt
+    NOTIFICATION_RETRY_MAX_SECONDS: int = 3600
+    # A claimed row becomes visible again if its worker dies mid-send
+    NOTIFICATION_CLAIM_LEASE_SECONDS: int = 300
+
+    # Reminder scheduler (app.workers.scheduler)
+    SCHEDULER_INTERVAL_SECONDS: int = 300
+    SCHEDULER_PAGE_SIZE: int = 500  # members enqueued per checkpointed transaction
+    EXPIRY_REMINDER_DAYS: list[int] = [7]  # days before expiry to remind
+    DUE_REMINDER_DAY_OF_MONTH: int = 15
+
+    # Request metrics: Server-Timing header and Prometheus /metrics
+    METRICS_ENABLED: bool = True
+    METRICS_QUERY_WARN_THRESHOLD: int = 50  # log requests issuing more SQL statements, 0 disables
+    # Test/CI: raise QueryBudgetExceeded when a route exceeds its query_budget
+    QUERY_BUDGET_ENFORCE: bool = False
 
     # CORS Configuration
     ALLOWED_ORIGINS: list[str] = [
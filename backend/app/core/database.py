@@ -1,11 +1,59 @@
-from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy import create_engine
+from typing import Callable
+
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from app.core.config import settings
 
+pool_options = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+}
+
+
+# Async driver for each sync backend get_async_database_url can derive from
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url() -> str:
+    """
+    ASYNC_DATABASE_URL, or DATABASE_URL switched to its backend's async
+    driver (asyncpg for PostgreSQL, aiosqlite for SQLite).
+    """
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(str(settings.DATABASE_URL))
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(
+            f"No async driver known for '{backend}' databases; "
+            "set ASYNC_DATABASE_URL explicitly"
+        )
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
 
-engine = create_engine(str(settings.DATABASE_URL))
+
+engine = create_engine(str(settings.DATABASE_URL), **pool_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async stack for async def routes. Service code stays sync and is run with
+# AsyncSession.run_sync, so it does not occupy the threadpool.
+async_engine = create_async_engine(get_async_database_url(), **pool_options)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
@@ -15,3 +63,31 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop("after_commit", []):
+        callback()
+
+
+def _drop_after_commit(session: Session) -> None:
+    session.info.pop("after_commit", None)
+
+
+def after_commit(db: Session, callback: Callable[[], None]) -> None:
+    """
+    Run callback once the session's current transaction commits.
+
+    For dropping in-process caches from code that runs inside the caller's
+    transaction: invalidating before the commit lets a concurrent request
+    re-cache the old rows. Nothing runs if the transaction rolls back.
+    """
+    if not event.contains(db, "after_commit", _run_after_commit):
+        event.listen(db, "after_commit", _run_after_commit)
+        event.listen(db, "after_rollback", _drop_after_commit)
+    db.info.setdefault("after_commit", []).append(callback)
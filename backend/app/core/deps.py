@@ -2,10 +2,13 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_db, get_async_db
+from app.core.config import settings
 from app.core.security import SECRET_KEY, ALGORITHM
 from app.models.users import User, UserRole
 from app.core.exceptions import InactiveUserException, InsufficientPermissionsException
+from app.core.metrics import set_request_tenant
 from loguru import logger
 
 
@@ -25,6 +28,30 @@ def get_current_user(
     Returns:
         User object if token is valid
 
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    return resolve_user_from_token(db, token)
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """Async variant of get_current_user for async def routes."""
+    return await db.run_sync(resolve_user_from_token, token)
+
+
+def resolve_user_from_token(db: Session, token: str) -> User:
+    """
+    Validate JWT token and load (or, in trusted-claims mode, build) the user.
+
+    Args:
+        db: Database session
+        token: JWT access token
+
+    Returns:
+        User object if token is valid
+
     Raises:
         HTTPException: If token is invalid or user not found
     """
@@ -46,15 +73,51 @@ def get_current_user(
         logger.warning(f"JWT validation error: {str(e)}")
         raise credentials_exception
 
+    user_id = payload.get("uid")
+    token_version = payload.get("ver")
+    set_request_tenant(payload.get("tenant_id"))
+
+    # Stateless mode: trust the signed claims, only check revocation state
+    if (
+        settings.AUTH_TRUST_TOKEN_CLAIMS
+        and user_id is not None
+        and token_version is not None
+    ):
+        from app.services.auth_service import get_user_auth_state
+
+        state = get_user_auth_state(db, user_id)
+        if not state or state.token_version != token_version:
+            logger.warning(f"Revoked or unknown token for user: {username}")
+            raise credentials_exception
+
+        if not state.is_active:
+            logger.warning(f"Inactive user attempted access: {username}")
+            raise InactiveUserException()
+
+        # Transient user built from claims (not attached to the session)
+        return User(
+            id=user_id,
+            username=username,
+            role=payload.get("role"),
+            tenant_id=payload.get("tenant_id"),
+            is_active=True,
+            token_version=token_version,
+        )
+
     user = db.query(User).filter(User.username == username).first()
     if not user:
         logger.warning(f"User not found: {username}")
         raise credentials_exception
 
+    if token_version is not None and user.token_version != token_version:
+        logger.warning(f"Revoked token used for user: {username}")
+        raise credentials_exception
+
     if not user.is_active:
         logger.warning(f"Inactive user attempted access: {username}")
         raise InactiveUserException()
 
+    set_request_tenant(user.tenant_id)
     return user
 
 
@@ -84,6 +147,13 @@ def get_current_gym_owner(current_user: User = Depends(get_current_user)) -> Use
     return current_user
 
 
+async def get_current_gym_owner_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """Async variant of get_current_gym_owner."""
+    return get_current_gym_owner(current_user)
+
+
 def get_current_superuser(current_user: User = Depends(get_current_user)) -> User:
     """
     Verify that current user has SUPERADMIN role.
@@ -113,15 +183,17 @@ def get_current_superuser(current_user: User = Depends(get_current_user)) -> Use
 # ============================================================================
 
 
-def check_subscription_active(
+def get_entitlement(
     current_user: User = Depends(get_current_gym_owner), db: Session = Depends(get_db)
-) -> User:
+):
     """
-    Check if tenant's subscription is active (trial or paid).
+    Resolve the tenant's subscription entitlement once per request.
 
-    Raises HTTPException if subscription is expired/suspended.
+    FastAPI caches dependency results within a request, so
+    check_subscription_active and check_feature_access share this object
+    (itself backed by a process-wide TTL cache).
     """
-    from app.services.subscription_service import should_block_access
+    from app.services.entitlement_service import get_tenant_entitlement
 
     if not current_user.tenant_id:
         raise HTTPException(
@@ -129,7 +201,35 @@ def check_subscription_active(
             detail="User must be associated with a tenant",
         )
 
-    should_block, reason = should_block_access(db, current_user.tenant_id)
+    return get_tenant_entitlement(db, current_user.tenant_id)
+
+
+async def get_entitlement_async(
+    current_user: User = Depends(get_current_gym_owner_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async variant of get_entitlement."""
+    from app.services.entitlement_service import get_tenant_entitlement
+
+    if not current_user.tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User must be associated with a tenant",
+        )
+
+    return await db.run_sync(get_tenant_entitlement, current_user.tenant_id)
+
+
+def check_subscription_active(
+    current_user: User = Depends(get_current_gym_owner),
+    entitlement=Depends(get_entitlement),
+) -> User:
+    """
+    Check if tenant's subscription is active (trial or paid).
+
+    Raises HTTPException if subscription is expired/suspended.
+    """
+    should_block, reason = entitlement.block_reason()
 
     if should_block:
         logger.warning(f"Blocked access for tenant {current_user.tenant_id}: {reason}")
@@ -214,29 +314,27 @@ def check_feature_access(feature: str):
     Usage: Depends(check_feature_access("whatsapp"))
     """
 
-    def _check_feature(
-        current_user: User = Depends(get_current_gym_owner),
-        db: Session = Depends(get_db),
-    ) -> None:
-        from app.services.subscription_service import (
-            check_feature_access as check_access,
-        )
+    def _check_feature(entitlement=Depends(get_entitlement)) -> None:
+        _ensure_feature(entitlement, feature)
+
+    return _check_feature
 
-        if not current_user.tenant_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="User must be associated with a tenant",
-            )
 
-        has_access = check_access(db, current_user.tenant_id, feature)
+def check_feature_access_async(feature: str):
+    """Async variant of check_feature_access for async def routes."""
 
-        if not has_access:
-            logger.warning(
-                f"Feature '{feature}' not available for tenant {current_user.tenant_id}"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Feature '{feature}' is not available in your current plan. Please upgrade.",
-            )
+    async def _check_feature(entitlement=Depends(get_entitlement_async)) -> None:
+        _ensure_feature(entitlement, feature)
 
     return _check_feature
+
+
+def _ensure_feature(entitlement, feature: str) -> None:
+    if not entitlement.has_feature(feature):
+        logger.warning(
+            f"Feature '{feature}' not available for tenant {entitlement.tenant_id}"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Feature '{feature}' is not available in your current plan. Please upgrade.",
+        )
@@ -58,3 +58,21 @@ class ValidationException(CustomHTTPException):
     
     def __init__(self, detail: str = "Validation error"):
         super().__init__(detail=detail, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+
+class ServiceOverloadedException(HTTPException):
+    """Raised when a bounded worker pool is saturated; clients should retry."""
+    
+    def __init__(self, detail: str = "Server is busy, please retry shortly", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class NotModifiedException(HTTPException):
+    """Answers a conditional GET whose validators still match (304, no body)."""
+    
+    def __init__(self, headers: dict):
+        super().__init__(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
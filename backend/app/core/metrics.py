@@ -0,0 +1,291 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from loguru import logger
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+@dataclass
+class RequestStats:
+    """SQL work done on behalf of the current request."""
+
+    query_count: int = 0
+    db_seconds: float = 0.0
+    tenant_id: Optional[int] = None
+    query_budget: Optional[int] = None
+
+
+class QueryBudgetExceeded(Exception):
+    """A request or block issued more SQL statements than its budget."""
+
+
+# Set per request by MetricsMiddleware. The object is shared (not copied)
+# with threadpool workers and run_sync greenlets, so their queries count too.
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def set_request_tenant(tenant_id: Optional[int]) -> None:
+    """Tag the current request's metrics with the authenticated tenant."""
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.tenant_id = tenant_id
+
+
+def query_budget(limit: int):
+    """
+    Route dependency declaring the most SQL statements a request may issue.
+
+    Over-budget requests are logged; with QUERY_BUDGET_ENFORCE (test/CI)
+    the statement that crosses the budget raises QueryBudgetExceeded.
+    """
+
+    def _set_budget() -> None:
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.query_budget = limit
+
+    return _set_budget
+
+
+@contextmanager
+def count_queries(budget: Optional[int] = None):
+    """Count statements run inside the block; raise if budget is exceeded."""
+    stats = RequestStats(query_budget=budget)
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+    if budget is not None and stats.query_count > budget:
+        raise QueryBudgetExceeded(
+            f"{stats.query_count} queries issued, budget is {budget}"
+        )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    stats.query_count += 1
+    stats.db_seconds += time.perf_counter() - started
+
+    if (
+        settings.QUERY_BUDGET_ENFORCE
+        and stats.query_budget is not None
+        and stats.query_count > stats.query_budget
+    ):
+        raise QueryBudgetExceeded(
+            f"Query #{stats.query_count} exceeds budget of {stats.query_budget}: "
+            f"{statement[:200]}"
+        )
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """Count statements and DB time per request (pass async_engine.sync_engine for asyncpg)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus exposition layout."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+    """
+    In-process request metrics for this API worker.
+
+    Updated only from the event loop (by the middleware), so no locking.
+    With several uvicorn workers each process exposes its own series;
+    scrape every worker or aggregate in Prometheus.
+    """
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.queries: Dict[Tuple[str, str], Histogram] = {}
+        self.db_seconds: Dict[Tuple[str, str], float] = {}
+        self.tenant_requests: Dict[str, int] = {}
+        self.tenant_queries: Dict[str, int] = {}
+        self.tenant_db_seconds: Dict[str, float] = {}
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        seconds: float,
+        stats: RequestStats,
+    ) -> None:
+        key = (method, route)
+        tenant = str(stats.tenant_id) if stats.tenant_id is not None else "none"
+
+        status_key = (method, route, str(status_code))
+        self.requests[status_key] = self.requests.get(status_key, 0) + 1
+        self.latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+        self.queries.setdefault(key, Histogram(QUERY_COUNT_BUCKETS)).observe(
+            stats.query_count
+        )
+        self.db_seconds[key] = self.db_seconds.get(key, 0.0) + stats.db_seconds
+
+        self.tenant_requests[tenant] = self.tenant_requests.get(tenant, 0) + 1
+        self.tenant_queries[tenant] = (
+            self.tenant_queries.get(tenant, 0) + stats.query_count
+        )
+        self.tenant_db_seconds[tenant] = (
+            self.tenant_db_seconds.get(tenant, 0.0) + stats.db_seconds
+        )
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name: str, series: Dict[Tuple[str, str], Histogram]) -> None:
+            for (method, route), hist in sorted(series.items()):
+                labels = f'method="{method}",route="{route}"'
+                for bound, count in zip(hist.buckets, hist.counts):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {hist.count}')
+                lines.append(f"{name}_sum{{{labels}}} {hist.sum}")
+                lines.append(f"{name}_count{{{labels}}} {hist.count}")
+
+        def tenant_counter(name: str, values: Dict[str, float]) -> None:
+            for tenant, value in sorted(values.items()):
+                lines.append(f'{name}{{tenant="{tenant}"}} {value}')
+
+        header("http_requests_total", "counter", "HTTP requests by route and status")
+        for (method, route, code), value in sorted(self.requests.items()):
+            lines.append(
+                f'http_requests_total{{method="{method}",route="{route}",'
+                f'status="{code}"}} {value}'
+            )
+
+        header("http_request_duration_seconds", "histogram", "HTTP request latency")
+        histogram("http_request_duration_seconds", self.latency)
+
+        header("http_request_db_queries", "histogram", "SQL statements per request")
+        histogram("http_request_db_queries", self.queries)
+
+        header("http_request_db_seconds_total", "counter", "Time spent in SQL by route")
+        for (method, route), value in sorted(self.db_seconds.items()):
+            lines.append(
+                f'http_request_db_seconds_total{{method="{method}",route="{route}"}} '
+                f"{value}"
+            )
+
+        header("tenant_http_requests_total", "counter", "HTTP requests by tenant")
+        tenant_counter("tenant_http_requests_total", self.tenant_requests)
+        header("tenant_db_queries_total", "counter", "SQL statements by tenant")
+        tenant_counter("tenant_db_queries_total", self.tenant_queries)
+        header("tenant_db_seconds_total", "counter", "Time spent in SQL by tenant")
+        tenant_counter("tenant_db_seconds_total", self.tenant_db_seconds)
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def _route_template(scope) -> str:
+    """Matched route path ("/api/members/{member_id}"), not the raw URL."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def _server_timing(stats: RequestStats, elapsed: float) -> bytes:
+    return (
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.query_count} queries", '
+        f"app;dur={elapsed * 1000:.1f}"
+    ).encode()
+
+
+class MetricsMiddleware:
+    """
+    Per-request latency, SQL statement count and DB time.
+
+    Adds a Server-Timing header (db and total time so far when the response
+    starts) and records the request in the registry once the body is sent.
+    Requests issuing more than METRICS_QUERY_WARN_THRESHOLD statements, or
+    more than their route's query_budget, are logged; that is where N+1
+    loops show up.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (
+                        b"server-timing",
+                        _server_timing(stats, time.perf_counter() - started),
+                    )
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            elapsed = time.perf_counter() - started
+            route = _route_template(scope)
+            registry.record(scope["method"], route, status_code, elapsed, stats)
+
+            threshold = settings.METRICS_QUERY_WARN_THRESHOLD
+            over_budget = (
+                stats.query_budget is not None
+                and stats.query_count > stats.query_budget
+            )
+            if over_budget or (threshold and stats.query_count > threshold):
+                logger.warning(
+                    f"{scope['method']} {route} issued {stats.query_count} queries "
+                    f"({stats.db_seconds * 1000:.1f}ms DB, {elapsed * 1000:.1f}ms total, "
+                    f"tenant {stats.tenant_id})"
+                )
@@ -0,0 +1,117 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import DateTime, func, literal, tuple_
+from sqlalchemy.engine import Row
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """
+    Build an opaque cursor for the row after which the next page starts.
+
+    Args:
+        sort_value: Value of the sort column (date or datetime)
+        row_id: Primary key (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(sort_value, datetime):
+        key = {"dt": sort_value.isoformat()}
+    elif isinstance(sort_value, date):
+        key = {"d": sort_value.isoformat()}
+    else:
+        key = {"v": sort_value}
+
+    raw = json.dumps({"k": key, "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        Tuple of (sort_value, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key = data["k"]
+        row_id = int(data["id"])
+
+        if "dt" in key:
+            return datetime.fromisoformat(key["dt"]), row_id
+        if "d" in key:
+            return date.fromisoformat(key["d"]), row_id
+        return key["v"], row_id
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+
+
+def _sort_key(query, sort_column):
+    """
+    Expression to order and compare on, and a function binding cursor values
+    to the same form.
+
+    SQLite keeps DateTime values as text: server defaults (CURRENT_TIMESTAMP)
+    have no fractional seconds while Python-side values have microseconds,
+    so equal instants compare unequal as strings. There both sides are
+    normalised with strftime; other backends compare the column directly.
+    """
+    if query.session.get_bind().dialect.name == "sqlite" and isinstance(
+        sort_column.type, DateTime
+    ):
+        fmt = "%Y-%m-%d %H:%M:%f"
+        return func.strftime(fmt, sort_column), lambda value: func.strftime(
+            fmt, literal(value, DateTime())
+        )
+    return sort_column, lambda value: value
+
+
+def paginate_keyset(
+    query,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+):
+    """
+    Fetch one page ordered by (sort_column DESC, id_column DESC).
+
+    With a cursor, rows strictly after it are returned (no OFFSET); without
+    one, skip is applied so page-number clients keep working.
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+    """
+    sort_key, bind_sort_value = _sort_key(query, sort_column)
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(sort_key, id_column) < tuple_(bind_sort_value(sort_value), row_id)
+        )
+
+    query = query.order_by(sort_key.desc(), id_column.desc())
+    if skip and not cursor:
+        query = query.offset(skip)
+
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        # Rows may be entities or (entity, extra...) tuples
+        entity = last[0] if isinstance(last, Row) else last
+        next_cursor = encode_cursor(
+            getattr(entity, sort_column.key), getattr(entity, id_column.key)
+        )
+
+    return rows, next_cursor
@@ -0,0 +1,151 @@
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.core.exceptions import ServiceOverloadedException
+from loguru import logger
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# Run inside pool workers (module-level so they can be pickled by reference)
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+class PasswordHasher:
+    """
+    bcrypt off the API process: a ProcessPoolExecutor sized to the cores.
+
+    Each bcrypt call is ~250 ms of pure CPU; run inline it holds the GIL and
+    stalls every other request of the worker. Here callers block on a future
+    instead (GIL released). At most max_pending calls may be queued or
+    running; beyond that, and on timeout, ServiceOverloadedException (503
+    with Retry-After) is raised rather than letting logins pile up.
+    workers=-1 runs inline (scripts, single-core boxes).
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self._workers = workers
+        self._max_pending = max_pending
+        self._timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        # Moving average of an unqueued call's duration, for Retry-After
+        self._avg_seconds = 0.25
+
+    @property
+    def workers(self) -> int:
+        workers = (
+            self._workers
+            if self._workers is not None
+            else settings.PASSWORD_HASH_WORKERS
+        )
+        return workers if workers != 0 else (os.cpu_count() or 1)
+
+    @property
+    def max_pending(self) -> int:
+        return self._max_pending or settings.PASSWORD_HASH_MAX_PENDING
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout or settings.PASSWORD_HASH_TIMEOUT_SECONDS
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # forkserver: never fork the threaded API process itself
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context(
+                    "forkserver" if "forkserver" in methods else "spawn"
+                )
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=context
+                )
+                logger.info(f"Started password hashing pool ({self.workers} workers)")
+            return self._executor
+
+    def _retry_after(self) -> int:
+        return max(1, math.ceil(self._pending * self._avg_seconds / self.workers))
+
+    def _release(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _pool_broken(self) -> ServiceOverloadedException:
+        logger.error("Password hashing pool broke; restarting it")
+        self.shutdown(wait=False)
+        return ServiceOverloadedException(retry_after=1)
+
+    def _run(self, fn: Callable, *args):
+        if self.workers < 0:
+            return fn(*args)
+
+        with self._lock:
+            if self._pending >= self.max_pending:
+                retry_after = self._retry_after()
+                logger.warning(
+                    f"Password hashing pool saturated ({self._pending} pending)"
+                )
+                raise ServiceOverloadedException(retry_after=retry_after)
+            self._pending += 1
+            queued = self._pending > self.workers
+
+        started = time.perf_counter()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            self._release()
+            raise self._pool_broken()
+        except BaseException:
+            self._release()
+            raise
+        # A call stays pending until the worker is done with it, even if the
+        # caller timed out: cancel() cannot stop a call that is running
+        future.add_done_callback(self._release)
+
+        try:
+            result = future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()  # only takes effect while still queued
+            raise ServiceOverloadedException(retry_after=self._retry_after())
+        except BrokenProcessPool:
+            raise self._pool_broken()
+
+        if not queued:
+            elapsed = time.perf_counter() - started
+            self._avg_seconds = 0.9 * self._avg_seconds + 0.1 * elapsed
+        return result
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(_verify, plain_password, hashed_password)
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+password_hasher = PasswordHasher()
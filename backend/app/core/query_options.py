@@ -0,0 +1,22 @@
+"""
+Eager-loading presets per use case.
+
+Pass to Query.options(*PRESET) wherever the caller is known to walk these
+relationships, instead of letting each access lazy-load one row at a time.
+Many-to-one hops use joinedload (one extra JOIN, no extra query); add
+collections with selectinload (one extra IN query, whatever the row count).
+"""
+
+from sqlalchemy.orm import joinedload
+
+from app.models.diet_plan import DietPlanAssignment
+from app.models.member import Member
+
+# Member profile: plan details are always rendered
+MEMBER_PROFILE = (joinedload(Member.plan),)
+
+# Diet plan WhatsApp send: template, member and the member's gym
+DIET_ASSIGNMENT_SEND = (
+    joinedload(DietPlanAssignment.template),
+    joinedload(DietPlanAssignment.member).joinedload(Member.tenant),
+)
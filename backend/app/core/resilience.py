@@ -0,0 +1,125 @@
+import asyncio
+import enum
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """
+    Async token bucket: rate tokens per second, up to burst.
+
+    Callers that find the bucket empty sleep until a token is due; waiting
+    counts them (queue depth). A rate of 0 or less disables limiting. Not
+    bound to an event loop, so one bucket can outlive the loop it was
+    first used on.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.waiting = 0
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+
+        self.waiting += 1
+        try:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        self._refill()
+        return {"tokens": round(self.tokens, 2), "waiting": self.waiting}
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After failure_threshold consecutive failures the circuit opens and
+    calls are refused for cooldown_seconds. Then a single trial call is let
+    through (half-open): success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown_seconds: float):
+        self.failure_threshold = max(failure_threshold, 1)
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.total_rejected = 0
+        self._trial_in_flight = False
+
+    def allow_request(self) -> bool:
+        """Return True if a call may proceed (reserving the half-open trial)."""
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self.opened_at < self.cooldown_seconds:
+                self.total_rejected += 1
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._trial_in_flight:
+                self.total_rejected += 1
+                return False
+            self._trial_in_flight = True
+
+        return True
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        # Late failures from calls started before the circuit opened must
+        # not push the cooldown out
+        if self.state == CircuitState.OPEN:
+            return
+
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if (
+            self.state == CircuitState.HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit allows a trial call (0 otherwise)."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(self.cooldown_seconds - (time.monotonic() - self.opened_at), 0.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_after_seconds": round(self.retry_after(), 1),
+            "total_rejected": self.total_rejected,
+        }
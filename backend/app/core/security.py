@@ -1,22 +1,22 @@
-from passlib.context import CryptContext
 from jose import jwt, JWTError
 from datetime import UTC, datetime, timedelta
 from .config import settings
+from .password_hasher import password_hasher
 
 
 SECRET_KEY = str(settings.SECRET_KEY)
 ALGORITHM = str(settings.ALGORITHM)
 ACCESS_TOKEN_EXPIRE_MINUTES = int(str(settings.ACCESS_TOKEN_EXPIRE_MINUTES))
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 def verify_password(plain_password: str, hashed_password: str):
-    return pwd_context.verify(plain_password, hashed_password)
+    """bcrypt verify on the hashing pool (may raise ServiceOverloadedException)."""
+    return password_hasher.verify(plain_password, hashed_password)
 
 
 def hash_password(password: str):
-    return pwd_context.hash(password)
+    """bcrypt hash on the hashing pool (may raise ServiceOverloadedException)."""
+    return password_hasher.hash(password)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
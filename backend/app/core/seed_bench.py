@@ -0,0 +1,328 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from datetime import date, timedelta
+from decimal import Decimal
+import random
+
+from app.core.security import hash_password
+from app.core.seed_subscription_plans import create_subscription_plans
+from app.models.diet_plan import DietPlanAssignment, DietPlanTemplate
+from app.models.expenses import Expense, ExpenseCategory, PaymentMethod
+from app.models.member import Member, MemberStatus
+from app.models.member_fee import MemberFee
+from app.models.membership_plan import MembershipPlan
+from app.models.subscription_plans import SubscriptionPlan
+from app.models.tenant import Tenant
+from app.models.tenant_subscription import SubscriptionStatus, TenantSubscription
+from app.models.users import User, UserRole
+from app.services.ledger_service import rebuild_ledger
+from app.services.usage_service import reconcile_usage
+from loguru import logger
+
+BENCH_TENANT_PREFIX = "Bench Gym"
+BENCH_USERNAME_PREFIX = "bench_owner_"
+BENCH_PASSWORD = "benchpass123"
+
+FIRST_NAMES = [
+    "Aarav",
+    "Vivaan",
+    "Aditya",
+    "Arjun",
+    "Sai",
+    "Rohan",
+    "Karthik",
+    "Rahul",
+    "Ananya",
+    "Diya",
+    "Priya",
+    "Sneha",
+    "Meera",
+    "Kavya",
+    "Lakshmi",
+    "Nisha",
+    "Farhan",
+    "Joseph",
+    "Anjali",
+    "Vikram",
+    "Deepak",
+    "Pooja",
+    "Suresh",
+    "Amit",
+]
+LAST_NAMES = [
+    "Sharma",
+    "Verma",
+    "Nair",
+    "Menon",
+    "Reddy",
+    "Iyer",
+    "Patel",
+    "Khan",
+    "Das",
+    "Gupta",
+    "Pillai",
+    "Joshi",
+    "Kumar",
+    "Singh",
+    "Thomas",
+    "Rao",
+]
+MEMBERSHIP_PLANS = [
+    ("Monthly", 30, 1500),
+    ("Quarterly", 90, 4000),
+    ("Yearly", 365, 12000),
+]
+FEE_METHODS = ["cash", "upi", "card", "bank_transfer"]
+
+
+def _next_bench_index(db: Session) -> int:
+    """Bench tenants are numbered; new runs continue after existing ones."""
+    return (
+        db.query(Tenant).filter(Tenant.name.like(f"{BENCH_TENANT_PREFIX} %")).count()
+        + 1
+    )
+
+
+def _seed_tenant(
+    db: Session,
+    rng: random.Random,
+    index: int,
+    subscription_plan_id: int,
+    hashed_password: str,
+    members: int,
+    fees_per_member: int,
+    expenses: int,
+) -> dict:
+    today = date.today()
+
+    tenant_id = db.scalar(
+        insert(Tenant)
+        .returning(Tenant.id)
+        .values(name=f"{BENCH_TENANT_PREFIX} {index}", is_active=True)
+    )
+    owner_id = db.scalar(
+        insert(User)
+        .returning(User.id)
+        .values(
+            name=f"Bench Owner {index}",
+            username=f"{BENCH_USERNAME_PREFIX}{index}",
+            email=f"{BENCH_USERNAME_PREFIX}{index}@bench.local",
+            phone_number=f"7{index:09d}",
+            hashed_password=hashed_password,
+            role=UserRole.GYMOWNER.value,
+            is_active=True,
+            tenant_id=tenant_id,
+        )
+    )
+    db.execute(
+        insert(TenantSubscription).values(
+            tenant_id=tenant_id,
+            plan_id=subscription_plan_id,
+            status=SubscriptionStatus.ACTIVE,
+            is_trial_used=True,
+            subscription_start_date=today - timedelta(days=30),
+            subscription_end_date=today + timedelta(days=365),
+            auto_renew=True,
+        )
+    )
+
+    plan_rows = [
+        {
+            "tenant_id": tenant_id,
+            "name": name,
+            "duration_days": days,
+            "price": Decimal(price),
+            "is_active": True,
+        }
+        for name, days, price in MEMBERSHIP_PLANS
+    ]
+    plan_ids = db.scalars(
+        insert(MembershipPlan).returning(
+            MembershipPlan.id, sort_by_parameter_order=True
+        ),
+        plan_rows,
+    ).all()
+    plans = list(zip(plan_ids, plan_rows))
+
+    # Members, with their fee history generated alongside
+    member_rows, member_fees = [], []
+    for n in range(members):
+        plan_id, plan = rng.choice(plans)
+        joining_date = today - timedelta(days=rng.randint(0, 720))
+        renewals = rng.randint(
+            1, max(1, (today - joining_date).days // plan["duration_days"] + 1)
+        )
+        expiry_date = joining_date + timedelta(days=plan["duration_days"] * renewals)
+
+        fees = []
+        for _ in range(fees_per_member):
+            paid = plan["price"] if rng.random() > 0.1 else plan["price"] / 2
+            fees.append(
+                {
+                    "tenant_id": tenant_id,
+                    "plan_id": plan_id,
+                    "original_amount": plan["price"],
+                    "amount_paid": paid,
+                    "payment_method": rng.choice(FEE_METHODS),
+                    "payment_date": joining_date
+                    + timedelta(
+                        days=rng.randint(0, max((today - joining_date).days, 0))
+                    ),
+                    "payment_status": "paid" if rng.random() > 0.03 else "pending",
+                    "created_by": owner_id,
+                }
+            )
+        member_fees.append(fees)
+
+        member_rows.append(
+            {
+                "tenant_id": tenant_id,
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": rng.choice(LAST_NAMES),
+                "phone_number": f"9{index % 1000:03d}{n:06d}",
+                "email": None,
+                "joining_date": joining_date,
+                "membership_expiry_date": expiry_date,
+                "status": (
+                    MemberStatus.EXPIRED if expiry_date < today else MemberStatus.ACTIVE
+                ),
+                "plan_id": plan_id,
+                "current_plan_start_date": expiry_date
+                - timedelta(days=plan["duration_days"]),
+                "total_fees_paid": sum(
+                    (
+                        fee["amount_paid"]
+                        for fee in fees
+                        if fee["payment_status"] == "paid"
+                    ),
+                    Decimal(0),
+                ),
+                "outstanding_dues": (
+                    Decimal(rng.randint(1, 20) * 100)
+                    if rng.random() < 0.1
+                    else Decimal(0)
+                ),
+                "is_active": rng.random() > 0.02,
+            }
+        )
+
+    member_ids = db.scalars(
+        insert(Member).returning(Member.id, sort_by_parameter_order=True), member_rows
+    ).all()
+
+    fee_rows = [
+        {**fee, "member_id": member_id}
+        for member_id, fees in zip(member_ids, member_fees)
+        for fee in fees
+    ]
+    if fee_rows:
+        db.execute(insert(MemberFee), fee_rows)
+
+    expense_rows = [
+        {
+            "tenant_id": tenant_id,
+            "category": rng.choice(list(ExpenseCategory)),
+            "amount": Decimal(rng.randint(5, 500) * 100),
+            "payment_method": rng.choice(list(PaymentMethod)),
+            "expense_date": today - timedelta(days=rng.randint(0, 720)),
+            "description": "Bench expense",
+            "created_by": owner_id,
+            "is_deleted": False,
+        }
+        for _ in range(expenses)
+    ]
+    if expense_rows:
+        db.execute(insert(Expense), expense_rows)
+
+    template_id = db.scalar(
+        insert(DietPlanTemplate)
+        .returning(DietPlanTemplate.id)
+        .values(
+            tenant_id=tenant_id,
+            created_by=owner_id,
+            name="Bench Weight Loss Plan",
+            category="weight_loss",
+            meals=[
+                {"time": "08:00", "name": "Breakfast", "items": ["Oats", "Banana"]},
+                {"time": "13:00", "name": "Lunch", "items": ["Dal", "Rice", "Salad"]},
+            ],
+            is_active=True,
+        )
+    )
+    assignment_rows = [
+        {
+            "tenant_id": tenant_id,
+            "template_id": template_id,
+            "member_id": member_id,
+            "assigned_by": owner_id,
+            "sent_via_whatsapp": False,
+        }
+        for member_id in member_ids[: max(members // 10, 1)]
+    ]
+    if assignment_rows:
+        db.execute(insert(DietPlanAssignment), assignment_rows)
+
+    db.commit()
+    rebuild_ledger(db, tenant_id)
+    reconcile_usage(db, tenant_id)
+
+    return {
+        "tenant_id": tenant_id,
+        "members": len(member_ids),
+        "fees": len(fee_rows),
+        "expenses": len(expense_rows),
+    }
+
+
+def seed_bench(
+    db: Session,
+    tenants: int = 10,
+    members_per_tenant: int = 500,
+    fees_per_member: int = 4,
+    expenses_per_tenant: int = 200,
+    password: str = BENCH_PASSWORD,
+    seed: int = 42,
+) -> dict:
+    """
+    Generate a synthetic multi-tenant dataset for benchmarks and load tests.
+
+    Each tenant gets an owner (bench_owner_<n>), an active Pro subscription,
+    membership plans, members with fee histories, expenses and a diet plan
+    assigned to a tenth of its members. Rows are written with bulk INSERTs,
+    one transaction per tenant. Running again adds more tenants.
+
+    Returns:
+        Summary with tenant ids, row counts and owner usernames
+    """
+    create_subscription_plans(db)
+    subscription_plan = (
+        db.query(SubscriptionPlan)
+        .filter(SubscriptionPlan.is_active == True)
+        .order_by(SubscriptionPlan.whatsapp_enabled.desc(), SubscriptionPlan.id)
+        .first()
+    )
+
+    rng = random.Random(seed)
+    hashed_password = hash_password(password)
+    start = _next_bench_index(db)
+
+    summary = {"tenants": [], "members": 0, "fees": 0, "expenses": 0, "usernames": []}
+    for index in range(start, start + tenants):
+        result = _seed_tenant(
+            db,
+            rng,
+            index,
+            subscription_plan.id,
+            hashed_password,
+            members_per_tenant,
+            fees_per_member,
+            expenses_per_tenant,
+        )
+        summary["tenants"].append(result["tenant_id"])
+        summary["members"] += result["members"]
+        summary["fees"] += result["fees"]
+        summary["expenses"] += result["expenses"]
+        summary["usernames"].append(f"{BENCH_USERNAME_PREFIX}{index}")
+        logger.info(f"Seeded bench tenant {index}: {result}")
+
+    return summary
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from app.models.subscription_plans import SubscriptionPlan
+from app.services.plan_catalog import plan_catalog
 from loguru import logger
 
 
@@ -41,6 +42,7 @@ def create_subscription_plans(db: Session):
         db.add(plan)
 
     db.commit()
+    plan_catalog.invalidate()
     logger.info(
         f"✅ Created {len(plans)} subscription plans: Starter (₹1,499) and Pro (₹3,499)"
     )
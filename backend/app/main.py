@@ -1,9 +1,10 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from loguru import logger
 import sys
-from app.core.database import engine
+from app.core.database import SessionLocal, engine, async_engine
 from app.models import *
 from app.routers import (
     users,
@@ -19,9 +20,29 @@ from app.routers import (
     reports,
 )
 from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, install_query_hooks, registry
+from app.core.password_hasher import password_hasher
+from app.services.plan_catalog import plan_catalog
+from app.services.whatsapp_service import whatsapp_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the plan catalog; on failure it loads on first use instead
+    try:
+        with SessionLocal() as db:
+            plan_catalog.load(db)
+    except Exception as e:
+        logger.warning(f"Could not load subscription plan catalog at startup: {e}")
+    yield
+    # Release pooled asyncpg/WPPConnect connections and hashing workers on shutdown
+    await async_engine.dispose()
+    await whatsapp_service.aclose()
+    password_hasher.shutdown()
 
 
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.PROJECT_NAME,
     version=settings.PROJECT_VERSION,
     description="Multi-tenant gym management SaaS platform",
@@ -50,6 +71,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.METRICS_ENABLED:
+    install_query_hooks(engine)
+    install_query_hooks(async_engine.sync_engine)
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """Prometheus metrics for this worker process."""
+        return PlainTextResponse(
+            registry.render(), media_type="text/plain; version=0.0.4"
+        )
+
 
 @app.get("/", tags=["Health"])
 def health_check():
@@ -9,3 +9,8 @@ from app.models.subscription_plans import SubscriptionPlan
 from app.models.tenant_subscription import TenantSubscription
 from app.models.subscription_payment import SubscriptionPayment
 from app.models.diet_plan import DietPlanTemplate, DietPlanAssignment
+from app.models.tenant_daily_ledger import TenantDailyLedger, LedgerSource
+from app.models.notification_outbox import NotificationOutbox, NotificationStatus
+from app.models.scheduler_checkpoint import SchedulerCheckpoint
+from app.models.tenant_usage import TenantUsage
+from app.models.tenant_resource_version import TenantResourceVersion, TenantResource
@@ -1,10 +1,20 @@
 from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, DateTime, Enum, Numeric, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 import enum
 from app.core.database import Base
 
 
+def full_name_expression(first_name, last_name):
+    """
+    first_name || ' ' || last_name, as indexed by ix_members_full_name_trgm.
+
+    The space is inlined rather than bound so queries built from this stay
+    identical to the index expression under prepared statements.
+    """
+    return first_name + literal_column("' '") + last_name
+
+
 class MemberStatus(str, enum.Enum):
     ACTIVE = "active"
     EXPIRED = "expired"
@@ -48,6 +58,42 @@ class Member(Base):
     __table_args__ = (
         UniqueConstraint('tenant_id', 'phone_number', name='unique_member_per_tenant'),
         Index('ix_members_tenant_active', 'tenant_id', 'is_active'),
+        # Cross-tenant reminder sweeps (app.workers.scheduler)
+        Index('ix_members_status_expiry', 'status', 'membership_expiry_date'),
+        # Expiring-soon / status counts per tenant
+        Index(
+            'ix_members_tenant_status_expiry',
+            'tenant_id',
+            'status',
+            'membership_expiry_date',
+        ),
+        # Outstanding dues report (few members owe money; ordered by amount)
+        Index(
+            'ix_members_tenant_dues',
+            'tenant_id',
+            outstanding_dues.desc(),
+            postgresql_where=(outstanding_dues > 0) & (is_active == True),
+            sqlite_where=(outstanding_dues > 0) & (is_active == True),
+        ),
+        # Member search (PostgreSQL only; needs the pg_trgm extension, see manage.py migrate)
+        Index(
+            'ix_members_full_name_trgm',
+            full_name_expression(first_name, last_name).label('full_name'),
+            postgresql_using='gin',
+            postgresql_ops={'full_name': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
+        Index(
+            'ix_members_phone_prefix',
+            'tenant_id',
+            'phone_number',
+            postgresql_ops={'phone_number': 'text_pattern_ops'},
+        ).ddl_if(dialect='postgresql'),
+        Index(
+            'ix_members_phone_suffix',
+            'tenant_id',
+            func.reverse(phone_number).label('phone_reversed'),
+            postgresql_ops={'phone_reversed': 'text_pattern_ops'},
+        ).ddl_if(dialect='postgresql'),
     )
     
     def __repr__(self) -> str:
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, Text, Numeric, Date, ForeignKey, DateTime, CheckConstraint, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, synonym
 from datetime import datetime
 from app.core.database import Base
 
@@ -17,6 +17,7 @@ class MemberFee(Base):
     plan_id = Column(Integer, ForeignKey("membership_plans.id"))
     original_amount = Column(Numeric(10, 2), nullable=False)
     amount_paid = Column(Numeric(10, 2), nullable=False)
+    amount = synonym("amount_paid")  # API/schemas refer to the paid amount as "amount"
     payment_method = Column(String(50))  # cash, upi, card, bank_transfer
     payment_date = Column(Date, nullable=False)
     payment_status = Column(String(20), default='paid')  # paid, pending, refunded
@@ -37,6 +38,16 @@ class MemberFee(Base):
         Index('idx_fees_member', 'member_id'),
         Index('idx_fees_tenant', 'tenant_id'),
         Index('idx_fees_date', 'payment_date'),
+        # fee_service.get_financial_report: tenant + status + date range, totals
+        # per method (get_fee_statistics reads the daily ledger instead).
+        # INCLUDE lets PostgreSQL answer it with an index-only scan.
+        Index(
+            'ix_fees_tenant_status_date',
+            'tenant_id',
+            'payment_status',
+            'payment_date',
+            postgresql_include=['payment_method', 'amount_paid', 'member_id'],
+        ),
     )
     
     def __repr__(self):
@@ -0,0 +1,67 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    ForeignKey,
+    DateTime,
+    Index,
+)
+from sqlalchemy.sql import func
+import enum
+from app.core.database import Base
+
+
+class NotificationStatus(str, enum.Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"  # gave up after NOTIFICATION_MAX_ATTEMPTS
+    SKIPPED = "skipped"  # tenant could not send WhatsApp when it was due
+
+
+class NotificationOutbox(Base):
+    """
+    Outbound WhatsApp messages waiting to be delivered.
+
+    Rows are inserted in the same transaction as the change that triggers
+    them (fee recorded, diet plan assigned) and drained by
+    app.workers.notification_worker. The message is rendered at enqueue
+    time; idempotency_key stops the same notification being queued twice.
+    """
+
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tenant_id = Column(
+        Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+    )
+    idempotency_key = Column(String(120), nullable=False, unique=True)
+    channel = Column(String(20), nullable=False, default="whatsapp")
+    phone_number = Column(String(20), nullable=False)
+    message = Column(Text, nullable=True)
+    image_url = Column(String(500), nullable=True)
+    caption = Column(Text, nullable=True)
+
+    # What triggered the notification, e.g. ("diet_plan_assignment", 42)
+    source_type = Column(String(50), nullable=True)
+    source_id = Column(Integer, nullable=True)
+
+    status = Column(
+        String(20), nullable=False, default=NotificationStatus.PENDING.value
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    # Also used as the claim lease while a worker is sending
+    next_attempt_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_notification_outbox_due", "status", "next_attempt_at"),
+        Index("ix_notification_outbox_tenant", "tenant_id", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<NotificationOutbox(id={self.id}, tenant_id={self.tenant_id}, key='{self.idempotency_key}', status='{self.status}')>"
@@ -0,0 +1,47 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    DateTime,
+    UniqueConstraint,
+)
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class SchedulerCheckpoint(Base):
+    """
+    Progress of one scheduled job run for one scheduler shard.
+
+    Jobs walk members in id order and store the last processed id in the
+    same transaction as the notifications they enqueue, so a restarted
+    scheduler resumes where it stopped instead of starting over.
+    """
+
+    __tablename__ = "scheduler_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String(100), nullable=False)  # e.g. expiry_reminder:7
+    run_date = Column(Date, nullable=False)
+    shard_index = Column(Integer, nullable=False, default=0)
+    shard_count = Column(Integer, nullable=False, default=1)
+    last_member_id = Column(Integer, nullable=False, default=0)
+    processed_count = Column(Integer, nullable=False, default=0)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "job_name",
+            "run_date",
+            "shard_index",
+            "shard_count",
+            name="unique_scheduler_checkpoint",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SchedulerCheckpoint(job='{self.job_name}', run_date='{self.run_date}', shard={self.shard_index}/{self.shard_count}, last_member_id={self.last_member_id})>"
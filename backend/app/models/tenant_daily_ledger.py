@@ -0,0 +1,64 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    ForeignKey,
+    DateTime,
+    Numeric,
+    UniqueConstraint,
+    Index,
+)
+from sqlalchemy.sql import func
+import enum
+from app.core.database import Base
+
+
+class LedgerSource(str, enum.Enum):
+    FEE = "fee"
+    EXPENSE = "expense"
+
+
+class TenantDailyLedger(Base):
+    """
+    Daily rollup of fee and expense totals per tenant.
+
+    One row per (tenant, day, source, category, payment method, status) bucket.
+    Rows are maintained incrementally by fee/expense writes (see
+    app.services.ledger_service) so reports scale with days, not rows.
+    Columns that do not apply to a source are stored as "" so they can take
+    part in the unique constraint.
+    """
+
+    __tablename__ = "tenant_daily_ledger"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tenant_id = Column(
+        Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+    )
+    ledger_date = Column(Date, nullable=False)
+    source = Column(String(10), nullable=False)  # fee, expense
+    category = Column(String(30), nullable=False, default="")  # expense category
+    payment_method = Column(String(50), nullable=False, default="")
+    payment_status = Column(String(20), nullable=False, default="")  # fee status
+    total_amount = Column(Numeric(14, 2), nullable=False, default=0)
+    entry_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "ledger_date",
+            "source",
+            "category",
+            "payment_method",
+            "payment_status",
+            name="unique_ledger_bucket",
+        ),
+        Index("ix_ledger_tenant_source_date", "tenant_id", "source", "ledger_date"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TenantDailyLedger(tenant_id={self.tenant_id}, date='{self.ledger_date}', source='{self.source}', total={self.total_amount})>"
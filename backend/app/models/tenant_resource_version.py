@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy.sql import func
+import enum
+from app.core.database import Base
+
+
+class TenantResource(str, enum.Enum):
+    MEMBERS = "members"
+    PLANS = "plans"
+    DIET_TEMPLATES = "diet_templates"
+    TENANT = "tenant"
+
+
+class TenantResourceVersion(Base):
+    """
+    Write counter for one kind of tenant-owned resource.
+
+    Bumped in the same transaction as every write to the resource (see
+    app.services.resource_version_service); read endpoints derive their
+    ETag/Last-Modified from it and answer conditional requests without
+    running the list query.
+    """
+
+    __tablename__ = "tenant_resource_versions"
+
+    tenant_id = Column(
+        Integer, ForeignKey("tenants.id", ondelete="CASCADE"), primary_key=True
+    )
+    resource = Column(String(30), primary_key=True)  # members, plans, ...
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TenantResourceVersion(tenant_id={self.tenant_id}, resource='{self.resource}', version={self.version})>"
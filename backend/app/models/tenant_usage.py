@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class TenantUsage(Base):
+    """
+    Running counts of a tenant's active members, staff and membership plans.
+
+    One row per tenant, adjusted in the same transaction as the writes that
+    create or soft-delete those rows (see app.services.usage_service), so
+    plan-limit checks read a single row instead of counting tables.
+    """
+
+    __tablename__ = "tenant_usage"
+
+    tenant_id = Column(
+        Integer, ForeignKey("tenants.id", ondelete="CASCADE"), primary_key=True
+    )
+    member_count = Column(Integer, nullable=False, default=0)
+    staff_count = Column(Integer, nullable=False, default=0)
+    plan_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<TenantUsage(tenant_id={self.tenant_id}, members={self.member_count}, staff={self.staff_count}, plans={self.plan_count})>"
@@ -22,6 +22,7 @@ class User(Base):
     hashed_password = Column(String, nullable=False)
     role = Column(String(20), default=UserRole.GYMOWNER.value, index=True)
     is_active = Column(Boolean, default=True, index=True)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)  # Bumped to revoke issued tokens
     tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=True, index=True)
     tenant = relationship("Tenant", back_populates="users")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -25,6 +25,7 @@ from app.services.tenant_service import (
     update_subscription,
     get_tenant_stats,
 )
+from app.services.member_service import reconcile_member_statuses
 from app.schemas.users import UserResponse, UserUpdate, UserListResponse, UserCreate
 from app.schemas.tenant import (
     TenantCreate,
@@ -238,6 +239,40 @@ def admin_get_tenant_stats(
     return stats
 
 
+@router.post("/members/reconcile-status", status_code=status.HTTP_200_OK)
+def admin_reconcile_member_statuses(
+    tenant_id: Optional[int] = Query(
+        None, description="Only reconcile this tenant (default: all tenants)"
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_superuser),
+):
+    """
+    Persist expired/renewed member statuses now (SUPERADMIN only).
+
+    Same job as the nightly `python manage.py reconcile-members`.
+    """
+    updated = reconcile_member_statuses(db, tenant_id)
+
+    logger.info(
+        f"Admin {current_user.username} reconciled member statuses ({updated} updated)"
+    )
+    return {"updated": updated}
+
+
+@router.get("/whatsapp/metrics", status_code=status.HTTP_200_OK)
+def admin_whatsapp_metrics(current_user: User = Depends(get_current_superuser)):
+    """
+    WPPConnect session metrics for this API process (SUPERADMIN only).
+
+    Per session: sends in flight, sends queued on the rate limiter and
+    circuit breaker state. Notification worker processes log their own.
+    """
+    from app.services.whatsapp_service import whatsapp_service
+
+    return {"sessions": whatsapp_service.session_metrics()}
+
+
 # ==================== GYM OWNER & STAFF MANAGEMENT ====================
 
 
@@ -5,15 +5,12 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.security import create_access_token
 from app.core.deps import get_current_user
-from app.services.auth_service import authenticate_user
+from app.services.auth_service import authenticate_login
 from app.services.user_service import change_password
 from app.schemas.token import Token
 from app.schemas.users import ChangePassword
 from app.models.users import User
-from app.services.subscription_service import (
-    get_current_subscription,
-    get_subscription_plan,
-)
+from app.services.subscription_service import get_subscription_plan
 from loguru import logger
 
 
@@ -27,30 +24,31 @@ def login_for_access_token(
     """
     Login with username and password to get access token.
     """
-    user = authenticate_user(db, form_data.username, form_data.password)
-    if not user:
+    result = authenticate_login(db, form_data.username, form_data.password)
+    if not result:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    user, subscription = result
 
-    # Fetch subscription info to include in token
+    # Subscription info to include in token (plan name from the plan catalog)
     plan_name = "Trial"
     subscription_status = "trial"
 
-    if user.tenant_id:
-        subscription = get_current_subscription(db, user.tenant_id)
-        if subscription:
-            subscription_status = subscription.status.value
-            if subscription.plan_id:
-                plan = get_subscription_plan(db, subscription.plan_id)
-                if plan:
-                    plan_name = plan.name
+    if user.tenant_id and subscription:
+        subscription_status = subscription.status.value
+        if subscription.plan_id:
+            plan = get_subscription_plan(db, subscription.plan_id)
+            if plan:
+                plan_name = plan.name
 
     access_token = create_access_token(
         data={
             "sub": user.username,
+            "uid": user.id,
+            "ver": user.token_version,
             "role": user.role,
             "tenant_id": user.tenant_id,
             "plan_name": plan_name,
@@ -3,6 +3,8 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.deps import get_current_user, get_db
 from app.core.deps import check_feature_access
+from app.core.conditional import conditional_get
+from app.models.tenant_resource_version import TenantResource
 from app.models.users import User
 from app.schemas.diet_plan import (
     DietPlanTemplateCreate,
@@ -46,6 +48,7 @@ def list_diet_plan_templates(
     active_only: bool = True,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    _: None = Depends(conditional_get(TenantResource.DIET_TEMPLATES)),
 ):
     """
     List all diet plan templates for the gym.
@@ -63,6 +66,7 @@ def get_diet_plan_template(
     template_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    _: None = Depends(conditional_get(TenantResource.DIET_TEMPLATES)),
 ):
     """Get a specific diet plan template by ID"""
     template = diet_plan_service.get_template(db, current_user.tenant_id, template_id)
@@ -26,6 +26,12 @@ from app.services.expense_service import (
     get_monthly_expenses,
     get_category_breakdown,
 )
+from app.services.export_service import (
+    ExportFormat,
+    EXPENSE_EXPORT_COLUMNS,
+    export_response,
+    iter_expense_rows,
+)
 from loguru import logger
 
 
@@ -69,6 +75,38 @@ def create_new_expense(
         )
 
 
+# Registered before /{expense_id} so "export" is not read as an id
+@router.get("/export", status_code=status.HTTP_200_OK)
+def export_expenses(
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv or xlsx"),
+    category: Optional[ExpenseCategory] = Query(None, description="Filter by category"),
+    start_date: Optional[date] = Query(None, description="Filter from this date"),
+    end_date: Optional[date] = Query(None, description="Filter until this date"),
+    payment_method: Optional[PaymentMethod] = Query(
+        None, description="Filter by payment method"
+    ),
+    current_user: User = Depends(get_current_gym_owner),
+):
+    """
+    Download all expenses matching the filters as CSV or XLSX (streamed).
+    """
+    if current_user.tenant_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User must be associated with a tenant",
+        )
+
+    tenant_id = current_user.tenant_id
+    return export_response(
+        format,
+        f"expenses-{date.today().isoformat()}",
+        EXPENSE_EXPORT_COLUMNS,
+        lambda db: iter_expense_rows(
+            db, tenant_id, category, start_date, end_date, payment_method
+        ),
+    )
+
+
 @router.get(
     "/{expense_id}", response_model=ExpenseResponse, status_code=status.HTTP_200_OK
 )
@@ -105,6 +143,12 @@ def list_all_expenses(
     payment_method: Optional[PaymentMethod] = Query(
         None, description="Filter by payment method"
     ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides page)"
+    ),
+    include_total: bool = Query(
+        True, description="Include total/total_pages (skips the count query when false)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_gym_owner),
 ):
@@ -124,18 +168,25 @@ def list_all_expenses(
         )
 
     skip = (page - 1) * page_size
-    expenses, total = list_expenses(
-        db,
-        current_user.tenant_id,  # type: ignore
-        skip=skip,
-        limit=page_size,
-        category=category,
-        start_date=start_date,
-        end_date=end_date,
-        payment_method=payment_method,
-    )
+    try:
+        expenses, total, next_cursor = list_expenses(
+            db,
+            current_user.tenant_id,  # type: ignore
+            skip=skip,
+            limit=page_size,
+            category=category,
+            start_date=start_date,
+            end_date=end_date,
+            payment_method=payment_method,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    total_pages = ceil(total / page_size) if total > 0 else 1
+    total_pages = None
+    if total is not None:
+        total_pages = ceil(total / page_size) if total > 0 else 1
 
     return ExpenseListResponse(
         expenses=[ExpenseResponse.from_orm(e) for e in expenses],
@@ -143,6 +194,7 @@ def list_all_expenses(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
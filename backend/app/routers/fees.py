@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from math import ceil
 from datetime import date
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.models.users import User
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_current_user_async
 from app.schemas.member_fee import (
     FeeCreate,
     FeeResponse,
@@ -22,6 +23,12 @@ from app.services.fee_service import (
     get_financial_report,
     get_fee_statistics,
 )
+from app.services.export_service import (
+    ExportFormat,
+    FEE_EXPORT_COLUMNS,
+    export_response,
+    iter_fee_rows,
+)
 from loguru import logger
 
 
@@ -73,6 +80,12 @@ def get_member_payment_history(
     member_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides page)"
+    ),
+    include_total: bool = Query(
+        True, description="Include total/total_pages (skips the count query when false)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -88,11 +101,22 @@ def get_member_payment_history(
         )
 
     skip = (page - 1) * page_size
-    fees, total, total_amount = get_member_fees(
-        db, member_id, current_user.tenant_id, skip=skip, limit=page_size
-    )
+    try:
+        fees, total, total_amount, next_cursor = get_member_fees(
+            db,
+            member_id,
+            current_user.tenant_id,
+            skip=skip,
+            limit=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    total_pages = ceil(total / page_size) if total > 0 else 1
+    total_pages = None
+    if total is not None:
+        total_pages = ceil(total / page_size) if total > 0 else 1
 
     return FeeListResponse(
         fees=fees,
@@ -101,11 +125,12 @@ def get_member_payment_history(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/", response_model=FeeListResponse, status_code=status.HTTP_200_OK)
-def list_all_fees(
+async def list_all_fees(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     start_date: Optional[date] = Query(None, description="Filter from date"),
@@ -113,8 +138,14 @@ def list_all_fees(
     payment_method: Optional[PaymentMethod] = Query(
         None, description="Filter by payment method"
     ),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides page)"
+    ),
+    include_total: bool = Query(
+        True, description="Include total/total_pages (skips the count query when false)"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
     """
     List all fee payments for the gym.
@@ -127,18 +158,50 @@ def list_all_fees(
             detail="User must be associated with a tenant",
         )
 
+    try:
+        return await db.run_sync(
+            _fee_list_response,
+            current_user.tenant_id,
+            page,
+            page_size,
+            start_date,
+            end_date,
+            payment_method,
+            cursor,
+            include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _fee_list_response(
+    db: Session,
+    tenant_id: int,
+    page: int,
+    page_size: int,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    payment_method: Optional[PaymentMethod],
+    cursor: Optional[str],
+    include_total: bool,
+) -> FeeListResponse:
+    """Build the fee list page (runs on the sync side of the async session)."""
     skip = (page - 1) * page_size
-    fees, total, total_amount = get_tenant_fees(
+    fees, total, total_amount, next_cursor = get_tenant_fees(
         db,
-        current_user.tenant_id,
+        tenant_id,
         start_date=start_date,
         end_date=end_date,
         payment_method=payment_method,
         skip=skip,
         limit=page_size,
+        cursor=cursor,
+        include_total=include_total,
     )
 
-    total_pages = ceil(total / page_size) if total > 0 else 1
+    total_pages = None
+    if total is not None:
+        total_pages = ceil(total / page_size) if total > 0 else 1
 
     return FeeListResponse(
         fees=fees,
@@ -147,6 +210,39 @@ def list_all_fees(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+def export_fees(
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv or xlsx"),
+    start_date: Optional[date] = Query(None, description="Filter from date"),
+    end_date: Optional[date] = Query(None, description="Filter to date"),
+    payment_method: Optional[PaymentMethod] = Query(
+        None, description="Filter by payment method"
+    ),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Download all fee payments matching the filters as CSV or XLSX.
+
+    Rows are streamed from a server-side cursor, so the download starts
+    immediately and any date range can be exported in one request.
+    """
+    if not current_user.tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User must be associated with a tenant",
+        )
+
+    tenant_id = current_user.tenant_id
+    method = payment_method.value if payment_method else None
+    return export_response(
+        format,
+        f"fees-{date.today().isoformat()}",
+        FEE_EXPORT_COLUMNS,
+        lambda db: iter_fee_rows(db, tenant_id, start_date, end_date, method),
     )
 
 
@@ -1,13 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, TYPE_CHECKING
 from math import ceil
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.models.users import User
 from app.models.member import MemberStatus
-from app.core.deps import get_current_gym_owner, check_member_limit
+from app.core.deps import (
+    get_current_gym_owner,
+    get_current_gym_owner_async,
+    check_member_limit,
+)
 from app.core.exceptions import UserAlreadyExistsException
+from app.core.metrics import query_budget
+from app.core.conditional import conditional_get, conditional_get_async
+from app.models.tenant_resource_version import TenantResource
 from app.schemas.members import (
     MemberCreate,
     MemberUpdate,
@@ -15,6 +24,8 @@ from app.schemas.members import (
     MemberListResponse,
     MemberRenew,
     MemberProfileResponse,
+    MemberSearchResponse,
+    MemberImportResponse,
 )
 from app.services.member_service import (
     create_member,
@@ -26,11 +37,15 @@ from app.services.member_service import (
     update_member_photo,
     get_member_profile_detailed,
 )
+from app.services.member_search_service import search_members
+from app.services.member_import_service import iter_import_rows, import_members
 from loguru import logger
 
-
 router = APIRouter(prefix="/members", tags=["members"])
 
+# Member responses also carry their plan's name (membership_type)
+MEMBER_RESOURCES = (TenantResource.MEMBERS, TenantResource.PLANS)
+
 
 @router.post("/", response_model=MemberResponse, status_code=status.HTTP_201_CREATED)
 def create_new_member(
@@ -65,6 +80,85 @@ def create_new_member(
         )
 
 
+@router.post(
+    "/import", response_model=MemberImportResponse, status_code=status.HTTP_200_OK
+)
+def import_members_file(
+    file: UploadFile = File(..., description="CSV or XLSX file with a header row"),
+    dry_run: bool = Query(False, description="Validate only, do not insert"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_gym_owner),
+):
+    """
+    Bulk import members from a CSV or XLSX file.
+
+    Columns: first_name, last_name, phone_number, joining_date, and one of
+    plan_id / plan_name / membership_type; email is optional. Valid rows are
+    inserted in batches; invalid rows are reported with their row number.
+    If an unexpected error stops the import after some batches were
+    committed, the partial report is returned with status 500.
+    """
+    if current_user.tenant_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User must be associated with a tenant to import members",
+        )
+
+    try:
+        rows = iter_import_rows(file.file, file.filename)
+        report = import_members(db, current_user.tenant_id, rows, dry_run=dry_run)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error importing members: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while importing members",
+        )
+
+    if report["aborted"]:
+        # Earlier batches were committed: send the report so the client
+        # knows which rows to retry
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content=MemberImportResponse(**report).model_dump(mode="json"),
+        )
+
+    logger.info(
+        f"Member import by user {current_user.username}: "
+        f"{report['imported']} imported, {report['failed']} failed"
+    )
+    return report
+
+
+@router.get(
+    "/search", response_model=MemberSearchResponse, status_code=status.HTTP_200_OK
+)
+async def search_members_typeahead(
+    q: str = Query(..., min_length=1, max_length=100, description="Name or phone"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum results"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_gym_owner_async),
+):
+    """
+    Ranked member search for the front-desk typeahead.
+
+    Matches name prefixes, substrings and close spellings, or phone
+    number prefixes/last digits.
+    """
+    if current_user.tenant_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User must be associated with a tenant",
+        )
+
+    results = await db.run_sync(search_members, current_user.tenant_id, q, limit)
+    return MemberSearchResponse(query=q, results=results)
+
+
 @router.get(
     "/{member_id}", response_model=MemberResponse, status_code=status.HTTP_200_OK
 )
@@ -72,6 +166,7 @@ def get_member(
     member_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_gym_owner),
+    _: None = Depends(conditional_get(*MEMBER_RESOURCES)),
 ):
     if current_user.tenant_id is None:
         raise HTTPException(
@@ -94,13 +189,20 @@ def get_member(
 
 
 @router.get("/", response_model=MemberListResponse, status_code=status.HTTP_200_OK)
-def list_members(
+async def list_members(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search by name or phone"),
     status_filter: Optional[MemberStatus] = Query(None, description="Filter by status"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_gym_owner),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides page)"
+    ),
+    include_total: bool = Query(
+        True, description="Include total/total_pages (skips the count query when false)"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_gym_owner_async),
+    _: None = Depends(conditional_get_async(*MEMBER_RESOURCES)),
 ):
     if current_user.tenant_id is None:
         raise HTTPException(
@@ -108,17 +210,47 @@ def list_members(
             detail="User must be associated with a tenant",
         )
 
+    try:
+        return await db.run_sync(
+            _member_list_response,
+            current_user.tenant_id,
+            page,
+            page_size,
+            search,
+            status_filter,
+            cursor,
+            include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _member_list_response(
+    db: Session,
+    tenant_id: int,
+    page: int,
+    page_size: int,
+    search: Optional[str],
+    status_filter: Optional[MemberStatus],
+    cursor: Optional[str],
+    include_total: bool,
+) -> MemberListResponse:
+    """Build the member list page (runs on the sync side of the async session)."""
     skip = (page - 1) * page_size
-    members, total = get_members_by_tenant(
+    members, total, next_cursor = get_members_by_tenant(
         db,
-        current_user.tenant_id,  # type: ignore
+        tenant_id,
         skip=skip,
         limit=page_size,
         search=search,
         status=status_filter,
+        cursor=cursor,
+        include_total=include_total,
     )
 
-    total_pages = ceil(total / page_size) if total > 0 else 1
+    total_pages = None
+    if total is not None:
+        total_pages = ceil(total / page_size) if total > 0 else 1
 
     # Build member responses with computed membership_type
     member_responses = []
@@ -135,6 +267,7 @@ def list_members(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -243,7 +376,12 @@ def renew_member_membership(
         )
 
 
-@router.get("/{member_id}/profile", response_model=dict, status_code=status.HTTP_200_OK)
+@router.get(
+    "/{member_id}/profile",
+    response_model=dict,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(query_budget(5))],
+)
 def get_member_detailed_profile(
     member_id: int,
     db: Session = Depends(get_db),
@@ -6,6 +6,8 @@ from math import ceil
 from app.core.database import get_db
 from app.models.users import User
 from app.core.deps import get_current_user, check_plan_limit
+from app.core.conditional import conditional_get
+from app.models.tenant_resource_version import TenantResource
 from app.schemas.membership_plan import (
     PlanCreate,
     PlanUpdate,
@@ -67,6 +69,7 @@ def list_membership_plans(
     active_only: bool = Query(True, description="Show only active plans"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    _: None = Depends(conditional_get(TenantResource.PLANS)),
 ):
     if not current_user.tenant_id:
         raise HTTPException(
@@ -95,6 +98,7 @@ def get_membership_plan_by_id(
     plan_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    _: None = Depends(conditional_get(TenantResource.PLANS)),
 ):
     if not current_user.tenant_id:
         raise HTTPException(
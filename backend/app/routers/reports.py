@@ -1,58 +1,116 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date, timedelta
 from typing import List, Optional
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.models.users import User
-from app.core.deps import get_current_user, check_feature_access
+from app.core.deps import (
+    get_current_user,
+    get_current_user_async,
+    check_feature_access,
+    check_feature_access_async,
+)
+from app.core.metrics import query_budget
 from app.schemas.reports import (
     FinancialReportResponse,
     MemberReportResponse,
     DuesReportItem,
     FinancialSummary,
+    TrendGranularity,
 )
 from app.services.report_service import report_service
+from app.services.export_service import (
+    ExportFormat,
+    DUES_EXPORT_COLUMNS,
+    export_response,
+    iter_dues_rows,
+)
 
 router = APIRouter(prefix="/reports", tags=["Advanced Analytics"])
 
+DEFAULT_TREND_PERIODS = {
+    TrendGranularity.MONTH: 6,
+    TrendGranularity.WEEK: 12,
+    TrendGranularity.DAY: 30,
+}
+
 
 # ENFORCE PRO PLAN ACCESS
 # All endpoints in this router require "advanced_analytics" feature
 # which is only enabled in Pro plans (or trials).
 @router.get("/financial", response_model=FinancialReportResponse)
-def get_financial_report(
+async def get_financial_report(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    _: None = Depends(check_feature_access("advanced_analytics")),
+    granularity: TrendGranularity = Query(
+        TrendGranularity.MONTH, description="Trend bucket size (day, week, month)"
+    ),
+    trend_periods: Optional[int] = Query(
+        None,
+        ge=1,
+        le=366,
+        description="Number of trend buckets ending at end_date, when start_date "
+        "is not given (defaults: 6 months, 12 weeks, 30 days)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+    _: None = Depends(check_feature_access_async("advanced_analytics")),
 ):
     """
     Get detailed financial analytics (Revenue, Expenses, Trends).
 
+    Trends cover start_date to end_date when start_date is given, otherwise
+    the last trend_periods buckets ending at end_date.
+
     **Pro Plan Only**.
     """
+    trend_start = start_date
     if not start_date:
         start_date = date.today().replace(day=1)  # Start of this month
     if not end_date:
         end_date = date.today()
 
+    try:
+        return await db.run_sync(
+            _financial_report,
+            current_user.tenant_id,
+            start_date,
+            end_date,
+            granularity,
+            trend_periods or DEFAULT_TREND_PERIODS[granularity],
+            trend_start,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _financial_report(
+    db: Session,
+    tenant_id: int,
+    start_date: date,
+    end_date: date,
+    granularity: TrendGranularity,
+    trend_periods: int,
+    trend_start: Optional[date] = None,
+) -> FinancialReportResponse:
     # 1. Summary
-    summary = report_service.get_financial_summary(
-        db, current_user.tenant_id, start_date, end_date
-    )
-
-    # 2. Trends (Last 6 months)
-    rev_trend, exp_trend = report_service.get_monthly_trends(
-        db, current_user.tenant_id, months=6
+    summary = report_service.get_financial_summary(db, tenant_id, start_date, end_date)
+
+    # 2. Trends (the requested range, or the last N buckets up to end_date)
+    rev_trend, exp_trend = report_service.get_trends(
+        db,
+        tenant_id,
+        periods=trend_periods,
+        granularity=granularity,
+        end_date=end_date,
+        start_date=trend_start,
     )
 
     # 3. Breakdowns
-    rev_by_method = report_service.get_payment_method_breakdown(
-        db, current_user.tenant_id
-    )
-    exp_by_cat = report_service.get_category_breakdown(db, current_user.tenant_id)
+    rev_by_method = report_service.get_payment_method_breakdown(db, tenant_id)
+    exp_by_cat = report_service.get_category_breakdown(db, tenant_id)
 
     return FinancialReportResponse(
         summary=summary,
@@ -64,21 +122,25 @@ def get_financial_report(
 
 
 @router.get("/members", response_model=MemberReportResponse)
-def get_member_analytics(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    _: None = Depends(check_feature_access("advanced_analytics")),
+async def get_member_analytics(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+    _: None = Depends(check_feature_access_async("advanced_analytics")),
 ):
     """
     Get detailed member growth and retention analytics.
 
     **Pro Plan Only**.
     """
+    return await db.run_sync(_member_report, current_user.tenant_id)
+
+
+def _member_report(db: Session, tenant_id: int) -> MemberReportResponse:
     # 1. Stats
-    stats = report_service.get_member_stats(db, current_user.tenant_id)
+    stats = report_service.get_member_stats(db, tenant_id)
 
     # 2. Plan Distribution
-    distribution = report_service.get_plan_distribution(db, current_user.tenant_id)
+    distribution = report_service.get_plan_distribution(db, tenant_id)
 
     # 3. Growth Trend (using mock for now or implement similar to financial)
     # Reusing financial trend logic for member growth requires complex date queries
@@ -93,15 +155,41 @@ def get_member_analytics(
     )
 
 
-@router.get("/dues", response_model=List[DuesReportItem])
-def get_outstanding_dues_report(
-    db: Session = Depends(get_db),
+@router.get(
+    "/dues",
+    response_model=List[DuesReportItem],
+    dependencies=[Depends(query_budget(6))],
+)
+async def get_outstanding_dues_report(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+    _: None = Depends(check_feature_access_async("advanced_analytics")),
+):
+    """
+    Get list of all members with outstanding dues.
+
+    **Pro Plan Only**.
+    """
+    return await db.run_sync(
+        report_service.get_outstanding_dues, current_user.tenant_id
+    )
+
+
+@router.get("/dues/export")
+def export_outstanding_dues(
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv or xlsx"),
     current_user: User = Depends(get_current_user),
     _: None = Depends(check_feature_access("advanced_analytics")),
 ):
     """
-    Get list of all members with outstanding dues.
+    Download the outstanding dues report as CSV or XLSX (streamed).
 
     **Pro Plan Only**.
     """
-    return report_service.get_outstanding_dues(db, current_user.tenant_id)
+    tenant_id = current_user.tenant_id
+    return export_response(
+        format,
+        f"dues-{date.today().isoformat()}",
+        DUES_EXPORT_COLUMNS,
+        lambda db: iter_dues_rows(db, tenant_id),
+    )
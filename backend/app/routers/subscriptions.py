@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
+from app.core.conditional import apply_conditional
 from app.models.users import User
-from app.core.deps import get_current_gym_owner, get_current_superuser
+from app.core.deps import (
+    get_current_gym_owner,
+    get_current_gym_owner_async,
+    get_current_superuser,
+)
 from app.schemas.subscriptions import (
     SubscriptionPlanResponse,
     TenantSubscriptionResponse,
@@ -17,7 +23,7 @@ from app.schemas.subscriptions import (
 from app.services.subscription_service import (
     get_all_plans,
     get_current_subscription,
-    get_subscription_status_detail,
+    get_subscription_status_snapshot,
     cancel_subscription,
     activate_subscription,
 )
@@ -67,8 +73,11 @@ def get_my_subscription(
 
 
 @router.get("/me/status", response_model=dict, status_code=status.HTTP_200_OK)
-def get_subscription_status(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_gym_owner)
+async def get_subscription_status(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_gym_owner_async),
 ):
     """
     Get detailed subscription status with usage limits and features.
@@ -79,6 +88,9 @@ def get_subscription_status(
     - Current usage (members, staff, plans)
     - Plan limits
     - Available features (WhatsApp, analytics)
+
+    Responses carry an ETag; polls sending it back in If-None-Match get
+    304 Not Modified while the status is unchanged.
     """
     if not current_user.tenant_id:
         raise HTTPException(
@@ -86,8 +98,11 @@ def get_subscription_status(
             detail="User must be associated with a tenant",
         )
 
-    status_detail = get_subscription_status_detail(db, current_user.tenant_id)
-    return status_detail
+    snapshot = await db.run_sync(
+        get_subscription_status_snapshot, current_user.tenant_id
+    )
+    apply_conditional(request, response, snapshot.etag)
+    return snapshot.body
 
 
 @router.post("/cancel", status_code=status.HTTP_200_OK)
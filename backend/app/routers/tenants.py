@@ -4,6 +4,8 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.models.users import User
 from app.core.deps import get_current_user
+from app.core.conditional import conditional_get
+from app.models.tenant_resource_version import TenantResource
 from app.services.tenant_service import (
     get_tenant_by_id,
     update_tenant,
@@ -20,7 +22,9 @@ router = APIRouter(prefix="/tenants", tags=["Tenants"])
 
 @router.get("/me", response_model=TenantResponse, status_code=status.HTTP_200_OK)
 def get_my_tenant(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    _: None = Depends(conditional_get(TenantResource.TENANT)),
 ):
     if not current_user.tenant_id:
         raise HTTPException(
@@ -5,6 +5,7 @@ from typing import Optional
 from math import ceil
 
 from app.core.database import get_db
+from app.core.config import settings
 from app.models.users import User, UserRole
 from app.services.user_service import (
     create_user,
@@ -30,9 +31,14 @@ router = APIRouter(prefix="/gym-owners", tags=["Gym Owners & Staff"])
 
 
 @router.get("/me", response_model=UserResponse, status_code=status.HTTP_200_OK)
-def read_user_me(current_user: User = Depends(get_current_user)):
+def read_user_me(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+):
 
     logger.info(f"Gym owner/staff {current_user.username} retrieved their profile")
+    if settings.AUTH_TRUST_TOKEN_CLAIMS:
+        # Claims-only user: load the full profile for the response
+        return db.query(User).filter(User.id == current_user.id).first()
     return current_user
 
 
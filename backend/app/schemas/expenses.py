@@ -55,10 +55,11 @@ class ExpenseResponse(ExpenseBase):
 
 class ExpenseListResponse(BaseModel):
     expenses: list[ExpenseResponse]
-    total: int
+    total: Optional[int] = None  # None when include_total=false
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class CategorySummary(BaseModel):
@@ -59,11 +59,12 @@ class FeeResponse(FeeBase):
 class FeeListResponse(BaseModel):
     """Schema for paginated fee list"""
     fees: List[FeeResponse]
-    total: int
-    total_amount: Decimal
+    total: Optional[int] = None  # None when include_total=false
+    total_amount: Optional[Decimal] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class FeeStats(BaseModel):
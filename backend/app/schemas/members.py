@@ -169,10 +169,49 @@ class MemberResponse(MemberBase):
 
 class MemberListResponse(BaseModel):
     members: list[MemberResponse]
-    total: int
+    total: Optional[int] = None  # None when include_total=false
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class MemberSearchResult(BaseModel):
+    """Lightweight member row for the search typeahead"""
+
+    id: int
+    first_name: str
+    last_name: str
+    phone_number: str
+    status: MemberStatus
+    membership_expiry_date: date
+    score: float  # Higher is a better match
+
+    class Config:
+        from_attributes = True
+
+
+class MemberSearchResponse(BaseModel):
+    query: str
+    results: list[MemberSearchResult]
+
+
+class MemberImportRowError(BaseModel):
+    row: int  # Spreadsheet row number (header is row 1)
+    errors: list[str]
+
+
+class MemberImportResponse(BaseModel):
+    total_rows: int
+    imported: int  # Rows committed
+    failed: int
+    dry_run: bool
+    # Set when an unexpected error stopped the import after some rows
+    # were committed; rows from failed_row on were not processed
+    aborted: bool = False
+    error: Optional[str] = None
+    failed_row: Optional[int] = None
+    errors: list[MemberImportRowError]
 
 
 class MemberPaymentRecord(BaseModel):
@@ -2,6 +2,15 @@ from pydantic import BaseModel
 from typing import List, Optional, Dict
 from datetime import date
 from decimal import Decimal
+from enum import Enum
+
+
+class TrendGranularity(str, Enum):
+    """Bucket size for trend charts"""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
 
 
 class ChartPoint(BaseModel):
@@ -1,9 +1,64 @@
 from sqlalchemy.orm import Session
+from typing import Dict, NamedTuple, Optional, Tuple
+import threading
+import time
 from app.models.users import User
-from app.core.security import pwd_context, hash_password
+from app.models.tenant_subscription import TenantSubscription
+from app.core.config import settings
+from app.core.database import after_commit
+from app.core.security import verify_password
 from loguru import logger
 
 
+class UserAuthState(NamedTuple):
+    """Fields needed to accept a token without loading the full user."""
+
+    is_active: bool
+    token_version: int
+
+
+# Process-wide cache: user_id -> (expires_at, state)
+_auth_state_cache: Dict[int, Tuple[float, Optional[UserAuthState]]] = {}
+_auth_state_lock = threading.Lock()
+
+
+class LoginResult(NamedTuple):
+    """Authenticated user with its tenant's subscription (if any)."""
+
+    user: User
+    subscription: Optional[TenantSubscription]
+
+
+def authenticate_login(db: Session, username: str, password: str) -> Optional[LoginResult]:
+    """
+    Authenticate a login, loading the user and its tenant subscription together.
+
+    One joined query instead of a user lookup followed by a subscription
+    lookup; the plan name for the token comes from the plan catalog.
+
+    Returns:
+        LoginResult if authentication successful, None otherwise
+    """
+    row = (
+        db.query(User, TenantSubscription)
+        .outerjoin(
+            TenantSubscription, TenantSubscription.tenant_id == User.tenant_id
+        )
+        .filter(User.username == username)
+        .first()
+    )
+    if not row:
+        return None
+
+    user, subscription = row
+    if not user.is_active:
+        logger.warning(f"Inactive user attempted login: {username}")
+        return None
+    if not verify_password(password, str(user.hashed_password)):
+        return None
+    return LoginResult(user, subscription)
+
+
 def authenticate_user(db: Session, username: str, password: str):
     """
     Authenticate user with username and password.
@@ -16,15 +71,8 @@ def authenticate_user(db: Session, username: str, password: str):
     Returns:
         User object if authentication successful, None otherwise
     """
-    user = db.query(User).filter(User.username == username).first()
-    if not user:
-        return None
-    if not user.is_active:
-        logger.warning(f"Inactive user attempted login: {username}")
-        return None
-    if not pwd_context.verify(password, str(user.hashed_password)):
-        return None
-    return user
+    result = authenticate_login(db, username, password)
+    return result.user if result else None
 
 
 def verify_user_active(db: Session, user_id: int) -> bool:
@@ -42,3 +90,48 @@ def verify_user_active(db: Session, user_id: int) -> bool:
     if not user:
         return False
     return user.is_active
+
+
+def get_user_auth_state(db: Session, user_id: int) -> Optional[UserAuthState]:
+    """
+    Get is_active/token_version for a user, cached for USER_CACHE_TTL_SECONDS.
+
+    Returns:
+        UserAuthState, or None if the user does not exist
+    """
+    ttl = settings.USER_CACHE_TTL_SECONDS
+    now = time.monotonic()
+
+    if ttl > 0:
+        with _auth_state_lock:
+            cached = _auth_state_cache.get(user_id)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    row = (
+        db.query(User.is_active, User.token_version).filter(User.id == user_id).first()
+    )
+    state = UserAuthState(bool(row.is_active), row.token_version) if row else None
+
+    if ttl > 0:
+        with _auth_state_lock:
+            _auth_state_cache[user_id] = (now + ttl, state)
+
+    return state
+
+
+def revoke_user_tokens(db: Session, user: User) -> None:
+    """
+    Invalidate every token issued to the user by bumping token_version.
+
+    The caller commits; the cached auth state is dropped once it has.
+    """
+    user.token_version = (user.token_version or 0) + 1
+    user_id = user.id
+    after_commit(db, lambda: invalidate_user_auth_state(user_id))
+
+
+def invalidate_user_auth_state(user_id: int) -> None:
+    """Drop the cached auth state for a user."""
+    with _auth_state_lock:
+        _auth_state_cache.pop(user_id, None)
@@ -1,6 +1,9 @@
 from sqlalchemy.orm import Session
 from app.models.diet_plan import DietPlanTemplate, DietPlanAssignment
 from app.models.member import Member
+from app.models.tenant_resource_version import TenantResource
+from app.core.query_options import DIET_ASSIGNMENT_SEND
+from app.services.resource_version_service import bump_resource_version
 from app.schemas.diet_plan import (
     DietPlanTemplateCreate,
     DietPlanTemplateUpdate,
@@ -56,6 +59,7 @@ class DietPlanService:
             instructions=data.instructions,
         )
         db.add(template)
+        bump_resource_version(db, tenant_id, TenantResource.DIET_TEMPLATES)
         db.commit()
         db.refresh(template)
         return template
@@ -115,6 +119,7 @@ class DietPlanService:
             setattr(template, field, value)
 
         template.updated_at = datetime.utcnow()
+        bump_resource_version(db, tenant_id, TenantResource.DIET_TEMPLATES)
         db.commit()
         db.refresh(template)
         return template
@@ -126,6 +131,7 @@ class DietPlanService:
             return False
 
         template.is_active = False
+        bump_resource_version(db, tenant_id, TenantResource.DIET_TEMPLATES)
         db.commit()
         return True
 
@@ -141,21 +147,33 @@ class DietPlanService:
             notes=data.notes,
         )
         db.add(assignment)
-        db.commit()
+        db.flush()
 
-        # Send via WhatsApp if requested
+        # Queue via WhatsApp if requested (same transaction as the assignment)
         if data.send_whatsapp:
             self.send_diet_plan_whatsapp(db, assignment)
 
+        db.commit()
         db.refresh(assignment)
         return assignment
 
     def send_diet_plan_whatsapp(self, db: Session, assignment: DietPlanAssignment):
-        """Send diet plan to member via WhatsApp"""
-        from app.services.whatsapp_service import whatsapp_service
+        """
+        Queue the diet plan for WhatsApp delivery to the member.
+
+        The caller commits. sent_via_whatsapp/whatsapp_sent_at are set by the
+        notification worker once the message is actually delivered.
+        """
+        from app.services.notification_service import enqueue_notification
         from loguru import logger
-        import asyncio
 
+        # Template, member and gym in one query instead of three lazy loads
+        assignment = (
+            db.query(DietPlanAssignment)
+            .options(*DIET_ASSIGNMENT_SEND)
+            .filter(DietPlanAssignment.id == assignment.id)
+            .one()
+        )
         template = assignment.template
         member = assignment.member
         gym = member.tenant
@@ -163,31 +181,19 @@ class DietPlanService:
         # Format diet plan message
         message = self.format_diet_plan_message(template, member, gym, assignment.notes)
 
-        # Send via WhatsApp (non-blocking)
-        try:
-            asyncio.create_task(
-                whatsapp_service.send_diet_plan(
-                    db=db,
-                    tenant_id=gym.id,
-                    phone_number=member.phone_number,
-                    member_name=f"{member.first_name} {member.last_name}",
-                    diet_plan_name=template.name,
-                    diet_plan_content=message,
-                    gym_name=gym.name,
-                )
-            )
-
-            # Update assignment
-            assignment.sent_via_whatsapp = True
-            assignment.whatsapp_sent_at = datetime.utcnow()
-            db.commit()
+        enqueue_notification(
+            db,
+            tenant_id=gym.id,
+            phone_number=member.phone_number,
+            idempotency_key=f"diet_plan_assignment:{assignment.id}",
+            message=message,
+            source_type="diet_plan_assignment",
+            source_id=assignment.id,
+        )
 
-            logger.info(
-                f"Diet plan '{template.name}' sent to {member.first_name} {member.last_name} via WhatsApp"
-            )
-        except Exception as e:
-            logger.error(f"Failed to send diet plan via WhatsApp: {e}")
-            # Don't raise - we still want to save the assignment
+        logger.info(
+            f"Diet plan '{template.name}' queued for {member.first_name} {member.last_name} via WhatsApp"
+        )
 
     def format_diet_plan_message(
         self,
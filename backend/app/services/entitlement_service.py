@@ -0,0 +1,158 @@
+from sqlalchemy.orm import Session
+from dataclasses import dataclass, replace
+from datetime import date
+from typing import Dict, Optional, Tuple
+import threading
+import time
+
+from app.core.config import settings
+from app.models.tenant_subscription import TenantSubscription, SubscriptionStatus
+from app.services.plan_catalog import plan_catalog
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class TenantEntitlement:
+    """
+    Snapshot of what a tenant's subscription allows.
+
+    Resolved with a single subscription query (plan flags from the plan
+    catalog) and shared by the subscription/feature dependencies of a request.
+    """
+
+    tenant_id: int
+    has_subscription: bool
+    status: Optional[SubscriptionStatus] = None
+    plan_id: Optional[int] = None
+    trial_end_date: Optional[date] = None
+    subscription_end_date: Optional[date] = None
+    whatsapp_enabled: bool = False
+    advanced_analytics: bool = False
+
+    def is_lapsed(self, today: Optional[date] = None) -> bool:
+        """Trial/active status whose end date has passed (not yet written back)."""
+        today = today or date.today()
+        if self.status == SubscriptionStatus.TRIAL:
+            return not self.trial_end_date or today > self.trial_end_date
+        if self.status == SubscriptionStatus.ACTIVE:
+            return not self.subscription_end_date or today > self.subscription_end_date
+        return False
+
+    @property
+    def is_active(self) -> bool:
+        """True if trial or paid subscription is currently active."""
+        if self.status not in (SubscriptionStatus.TRIAL, SubscriptionStatus.ACTIVE):
+            return False
+        return not self.is_lapsed()
+
+    def block_reason(self) -> Tuple[bool, str]:
+        """
+        Returns:
+            Tuple of (should_block, reason)
+        """
+        if not self.has_subscription:
+            return (True, "No subscription found")
+
+        if self.is_active:
+            return (False, "")
+
+        if self.status == SubscriptionStatus.EXPIRED:
+            return (True, "Subscription expired. Please renew to continue.")
+
+        if self.status == SubscriptionStatus.SUSPENDED:
+            return (True, "Account suspended. Please contact support.")
+
+        if self.status == SubscriptionStatus.CANCELLED:
+            return (True, "Subscription cancelled. Please reactivate to continue.")
+
+        return (True, "Subscription inactive")
+
+    def has_feature(self, feature: str) -> bool:
+        """
+        Check access to a feature ("whatsapp", "advanced_analytics").
+
+        During trial WhatsApp is disabled and analytics is available; active
+        subscriptions use the plan flags.
+        """
+        if self.status == SubscriptionStatus.TRIAL:
+            if feature == "whatsapp":
+                return False
+            if feature == "advanced_analytics":
+                return True
+
+        if self.plan_id and self.status == SubscriptionStatus.ACTIVE:
+            if feature == "whatsapp":
+                return self.whatsapp_enabled
+            if feature == "advanced_analytics":
+                return self.advanced_analytics
+
+        return False
+
+
+# Process-wide cache: tenant_id -> (expires_at, entitlement)
+_cache: Dict[int, Tuple[float, TenantEntitlement]] = {}
+_cache_lock = threading.Lock()
+
+
+def _load_entitlement(db: Session, tenant_id: int) -> TenantEntitlement:
+    """Load the subscription; its (active) plan comes from the plan catalog."""
+    subscription = (
+        db.query(TenantSubscription)
+        .filter(TenantSubscription.tenant_id == tenant_id)
+        .first()
+    )
+
+    if not subscription:
+        return TenantEntitlement(tenant_id=tenant_id, has_subscription=False)
+
+    plan = plan_catalog.get(db, subscription.plan_id) if subscription.plan_id else None
+    entitlement = TenantEntitlement(
+        tenant_id=tenant_id,
+        has_subscription=True,
+        status=subscription.status,
+        plan_id=plan.id if plan else None,
+        trial_end_date=subscription.trial_end_date,
+        subscription_end_date=subscription.subscription_end_date,
+        whatsapp_enabled=bool(plan and plan.whatsapp_enabled),
+        advanced_analytics=bool(plan and plan.advanced_analytics),
+    )
+
+    if entitlement.is_lapsed():
+        # Trial or paid period ended: persist the EXPIRED status
+        subscription.status = SubscriptionStatus.EXPIRED
+        db.commit()
+        logger.info(f"Subscription expired for tenant {tenant_id}")
+        entitlement = replace(entitlement, status=SubscriptionStatus.EXPIRED)
+
+    return entitlement
+
+
+def get_tenant_entitlement(db: Session, tenant_id: int) -> TenantEntitlement:
+    """
+    Get tenant entitlement, served from the TTL cache when possible.
+
+    Cached entries whose trial/subscription end date has since passed are
+    reloaded so the expiry is written back as before.
+    """
+    ttl = settings.ENTITLEMENT_CACHE_TTL_SECONDS
+    now = time.monotonic()
+
+    if ttl > 0:
+        with _cache_lock:
+            cached = _cache.get(tenant_id)
+        if cached and cached[0] > now and not cached[1].is_lapsed():
+            return cached[1]
+
+    entitlement = _load_entitlement(db, tenant_id)
+
+    if ttl > 0:
+        with _cache_lock:
+            _cache[tenant_id] = (now + ttl, entitlement)
+
+    return entitlement
+
+
+def invalidate_entitlement(tenant_id: int) -> None:
+    """Drop the cached entitlement after a subscription change."""
+    with _cache_lock:
+        _cache.pop(tenant_id, None)
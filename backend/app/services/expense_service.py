@@ -4,7 +4,10 @@ from datetime import date
 from typing import Optional
 from decimal import Decimal
 from app.models.expenses import Expense, ExpenseCategory, PaymentMethod
+from app.models.tenant_daily_ledger import TenantDailyLedger, LedgerSource
 from app.schemas.expenses import ExpenseCreate, ExpenseUpdate
+from app.core.pagination import paginate_keyset
+from app.services.ledger_service import record_expense_entry
 from loguru import logger
 
 
@@ -34,6 +37,7 @@ def create_expense(
     )
 
     db.add(db_expense)
+    record_expense_entry(db, db_expense)
     db.commit()
     db.refresh(db_expense)
 
@@ -79,9 +83,12 @@ def list_expenses(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     payment_method: Optional[PaymentMethod] = None,
-) -> tuple[list[Expense], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> tuple[list[Expense], Optional[int], Optional[str]]:
     """
-    Get all expenses for a tenant with pagination and filtering.
+    Get all expenses for a tenant with keyset pagination on (expense_date, id)
+    and filtering.
 
     Args:
         db: Database session
@@ -92,9 +99,11 @@ def list_expenses(
         start_date: Filter expenses from this date
         end_date: Filter expenses until this date
         payment_method: Filter by payment method
+        cursor: next_cursor from the previous page (skip is ignored)
+        include_total: Whether to run the count query
 
     Returns:
-        Tuple of (expenses list, total count)
+        Tuple of (expenses list, total count or None, next_cursor)
     """
     query = db.query(Expense).filter(
         and_(Expense.tenant_id == tenant_id, Expense.is_deleted == False)
@@ -114,14 +123,14 @@ def list_expenses(
         query = query.filter(Expense.payment_method == payment_method)
 
     # Get total count
-    total = query.count()
+    total = query.count() if include_total else None
 
     # Get paginated results
-    expenses = (
-        query.order_by(Expense.expense_date.desc()).offset(skip).limit(limit).all()
+    expenses, next_cursor = paginate_keyset(
+        query, Expense.expense_date, Expense.id, limit, cursor=cursor, skip=skip
     )
 
-    return expenses, total
+    return expenses, total, next_cursor
 
 
 def update_expense(
@@ -143,11 +152,15 @@ def update_expense(
     if not expense:
         return None
 
+    # Move the expense out of its old ledger bucket and into the new one
+    record_expense_entry(db, expense, sign=-1)
+
     # Update fields
     update_data = expense_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(expense, field, value)
 
+    record_expense_entry(db, expense)
     db.commit()
     db.refresh(expense)
 
@@ -174,6 +187,7 @@ def delete_expense(db: Session, expense_id: int, tenant_id: int) -> bool:
         return False
 
     expense.is_deleted = True
+    record_expense_entry(db, expense, sign=-1)
     db.commit()
 
     logger.info(
@@ -191,6 +205,8 @@ def get_expense_summary(
     """
     Get expense summary for a date range.
 
+    Read from the daily ledger rollup in a single grouped query.
+
     Args:
         db: Database session
         tenant_id: Tenant ID
@@ -200,73 +216,58 @@ def get_expense_summary(
     Returns:
         Dictionary with expense summary
     """
-    # Get total expenses
-    total_query = (
-        db.query(
-            func.sum(Expense.amount).label("total"),
-            func.count(Expense.id).label("count"),
-        )
-        .filter(
-            and_(
-                Expense.tenant_id == tenant_id,
-                Expense.is_deleted == False,
-                Expense.expense_date >= start_date,
-                Expense.expense_date <= end_date,
-            )
-        )
-        .first()
-    )
-
-    total_amount = total_query.total if total_query.total else Decimal(0)
-    total_count = total_query.count if total_query.count else 0
-
-    # Get expenses by category
-    category_query = (
+    rows = (
         db.query(
-            Expense.category,
-            func.sum(Expense.amount).label("total"),
-            func.count(Expense.id).label("count"),
+            TenantDailyLedger.category,
+            TenantDailyLedger.payment_method,
+            func.sum(TenantDailyLedger.total_amount).label("total"),
+            func.sum(TenantDailyLedger.entry_count).label("count"),
         )
         .filter(
             and_(
-                Expense.tenant_id == tenant_id,
-                Expense.is_deleted == False,
-                Expense.expense_date >= start_date,
-                Expense.expense_date <= end_date,
+                TenantDailyLedger.tenant_id == tenant_id,
+                TenantDailyLedger.source == LedgerSource.EXPENSE.value,
+                TenantDailyLedger.ledger_date >= start_date,
+                TenantDailyLedger.ledger_date <= end_date,
             )
         )
-        .group_by(Expense.category)
+        .group_by(TenantDailyLedger.category, TenantDailyLedger.payment_method)
         .all()
     )
 
-    by_category = [
-        {"category": row.category, "total_amount": row.total, "count": row.count}
-        for row in category_query
-    ]
-
-    # Get expenses by payment method
-    payment_query = (
-        db.query(Expense.payment_method, func.sum(Expense.amount).label("total"))
-        .filter(
-            and_(
-                Expense.tenant_id == tenant_id,
-                Expense.is_deleted == False,
-                Expense.expense_date >= start_date,
-                Expense.expense_date <= end_date,
-            )
+    total_amount = Decimal(0)
+    total_count = 0
+    by_category: dict[str, dict] = {}
+    by_payment_method: dict[str, Decimal] = {}
+
+    for row in rows:
+        if not row.count:
+            continue
+        total = row.total or Decimal(0)
+        total_amount += total
+        total_count += int(row.count)
+
+        category = by_category.setdefault(
+            row.category,
+            {
+                "category": ExpenseCategory(row.category),
+                "total_amount": Decimal(0),
+                "count": 0,
+            },
         )
-        .group_by(Expense.payment_method)
-        .all()
-    )
+        category["total_amount"] += total
+        category["count"] += int(row.count)
 
-    by_payment_method = {row.payment_method: row.total for row in payment_query}
+        by_payment_method[row.payment_method] = (
+            by_payment_method.get(row.payment_method, Decimal(0)) + total
+        )
 
     return {
         "total_expenses": total_amount,
         "total_count": total_count,
         "start_date": start_date,
         "end_date": end_date,
-        "by_category": by_category,
+        "by_category": list(by_category.values()),
         "by_payment_method": by_payment_method,
     }
 
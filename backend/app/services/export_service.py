@@ -0,0 +1,396 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from fastapi.responses import StreamingResponse
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+from xml.sax.saxutils import escape
+import csv
+import enum
+import io
+import re
+import zipfile
+
+from app.core.database import SessionLocal
+from app.models.expenses import Expense, ExpenseCategory, PaymentMethod
+from app.models.member import Member
+from app.models.member_fee import MemberFee
+from app.models.membership_plan import MembershipPlan
+from app.services.report_service import report_service
+
+# Rows fetched per server-side cursor round trip, and per chunk sent
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    XLSX = "xlsx"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.XLSX: (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    ),
+}
+
+FEE_EXPORT_COLUMNS = (
+    "Fee ID",
+    "Payment Date",
+    "Member ID",
+    "Member Name",
+    "Phone Number",
+    "Plan",
+    "Original Amount",
+    "Amount Paid",
+    "Payment Method",
+    "Payment Status",
+    "Transaction ID",
+    "Notes",
+)
+
+EXPENSE_EXPORT_COLUMNS = (
+    "Expense ID",
+    "Expense Date",
+    "Category",
+    "Amount",
+    "Payment Method",
+    "Description",
+)
+
+DUES_EXPORT_COLUMNS = (
+    "Member ID",
+    "Member Name",
+    "Phone Number",
+    "Plan",
+    "Amount Due",
+    "Last Payment Date",
+    "Days Overdue",
+)
+
+
+# ---------------------------------------------------------------------------
+# Row sources (server-side cursors via yield_per)
+# ---------------------------------------------------------------------------
+
+
+def iter_fee_rows(
+    db: Session,
+    tenant_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    payment_method: Optional[str] = None,
+) -> Iterator[tuple]:
+    """Fee payments with member and plan names, oldest first."""
+    query = (
+        db.query(
+            MemberFee.id,
+            MemberFee.payment_date,
+            MemberFee.member_id,
+            (Member.first_name + " " + Member.last_name).label("member_name"),
+            Member.phone_number,
+            MembershipPlan.name,
+            MemberFee.original_amount,
+            MemberFee.amount_paid,
+            MemberFee.payment_method,
+            MemberFee.payment_status,
+            MemberFee.transaction_id,
+            MemberFee.notes,
+        )
+        .join(Member, Member.id == MemberFee.member_id)
+        .outerjoin(MembershipPlan, MembershipPlan.id == MemberFee.plan_id)
+        .filter(MemberFee.tenant_id == tenant_id)
+    )
+
+    if start_date:
+        query = query.filter(MemberFee.payment_date >= start_date)
+    if end_date:
+        query = query.filter(MemberFee.payment_date <= end_date)
+    if payment_method:
+        query = query.filter(MemberFee.payment_method == payment_method)
+
+    for row in query.order_by(MemberFee.payment_date, MemberFee.id).yield_per(
+        EXPORT_BATCH_SIZE
+    ):
+        yield tuple(row)
+
+
+def iter_expense_rows(
+    db: Session,
+    tenant_id: int,
+    category: Optional[ExpenseCategory] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    payment_method: Optional[PaymentMethod] = None,
+) -> Iterator[tuple]:
+    """Non-deleted expenses, oldest first."""
+    query = db.query(
+        Expense.id,
+        Expense.expense_date,
+        Expense.category,
+        Expense.amount,
+        Expense.payment_method,
+        Expense.description,
+    ).filter(and_(Expense.tenant_id == tenant_id, Expense.is_deleted == False))
+
+    if category:
+        query = query.filter(Expense.category == category)
+    if start_date:
+        query = query.filter(Expense.expense_date >= start_date)
+    if end_date:
+        query = query.filter(Expense.expense_date <= end_date)
+    if payment_method:
+        query = query.filter(Expense.payment_method == payment_method)
+
+    for row in query.order_by(Expense.expense_date, Expense.id).yield_per(
+        EXPORT_BATCH_SIZE
+    ):
+        yield tuple(row)
+
+
+def iter_dues_rows(db: Session, tenant_id: int) -> Iterator[tuple]:
+    """The dues report, largest amount due first."""
+    today = date.today()
+    query = report_service.outstanding_dues_query(db, tenant_id)
+
+    for m in query.yield_per(EXPORT_BATCH_SIZE):
+        yield (
+            m.id,
+            f"{m.first_name} {m.last_name}",
+            m.phone_number,
+            m.plan_name,
+            m.outstanding_dues,
+            m.last_payment_date,
+            report_service.days_overdue(m, today),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Encoders
+# ---------------------------------------------------------------------------
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def stream_csv(columns: Sequence[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    """CSV (UTF-8 with BOM, so Excel detects the encoding) in row batches."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(["" if v is None else _plain(v) for v in row])
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode("utf-8")
+
+
+_XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    ),
+    # Style 1: date, style 2: bold header
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font/><font><b/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border/></borders>'
+        '<cellStyleXfs count="1"><xf/></cellStyleXfs>'
+        '<cellXfs count="3"><xf/><xf numFmtId="14" applyNumberFormat="1"/>'
+        '<xf fontId="1" applyFont="1"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+        "</cellStyles>"
+        "</styleSheet>"
+    ),
+}
+
+_XLSX_SHEET_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    "</sheetView></sheetViews><sheetData>"
+)
+_XLSX_SHEET_FOOTER = "</sheetData></worksheet>"
+
+_EXCEL_EPOCH = date(1899, 12, 30)
+_XML_ILLEGAL_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _xlsx_cell(ref: str, value: Any, style: int = 0) -> str:
+    value = _plain(value)
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return f'<c r="{ref}" s="1"><v>{(value - _EXCEL_EPOCH).days}</v></c>'
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    text = escape(_XML_ILLEGAL_CHARS.sub("", str(value)))
+    style_attr = f' s="{style}"' if style else ""
+    return (
+        f'<c r="{ref}" t="inlineStr"{style_attr}>'
+        f'<is><t xml:space="preserve">{text}</t></is></c>'
+    )
+
+
+def _xlsx_row(number: int, values: Sequence[Any], style: int = 0) -> str:
+    cells = "".join(
+        _xlsx_cell(f"{_column_letter(i)}{number}", value, style)
+        for i, value in enumerate(values)
+    )
+    return f'<row r="{number}">{cells}</row>'
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable write target; zipfile then streams with data descriptors."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_xlsx(
+    columns: Sequence[str], rows: Iterable[tuple], sheet_title: str
+) -> Iterator[bytes]:
+    """
+    Single-sheet XLSX written as a streamed zip.
+
+    The worksheet XML is produced row by row into a deflate stream, so only
+    the compressor's window is held in memory, not the workbook.
+    """
+    sink = _ChunkSink()
+    workbook = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets><sheet name="{escape(sheet_title[:31])}" sheetId="1" r:id="rId1"/>'
+        "</sheets></workbook>"
+    )
+
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, xml in {**_XLSX_STATIC_PARTS, "xl/workbook.xml": workbook}.items():
+            archive.writestr(name, xml)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(_XLSX_SHEET_HEADER.encode("utf-8"))
+            sheet.write(_xlsx_row(1, columns, style=2).encode("utf-8"))
+            yield sink.drain()
+
+            for number, row in enumerate(rows, start=2):
+                sheet.write(_xlsx_row(number, row).encode("utf-8"))
+                if number % EXPORT_BATCH_SIZE == 0:
+                    yield sink.drain()
+
+            sheet.write(_XLSX_SHEET_FOOTER.encode("utf-8"))
+
+    yield sink.drain()
+
+
+# ---------------------------------------------------------------------------
+# Response
+# ---------------------------------------------------------------------------
+
+
+def _rows_from_own_session(
+    fetch_rows: Callable[[Session], Iterable[tuple]],
+) -> Iterator[tuple]:
+    """
+    Run the row source on a session owned by the stream.
+
+    The response body is produced after the route returns, so it cannot
+    borrow the request's session.
+    """
+    db = SessionLocal()
+    try:
+        yield from fetch_rows(db)
+    finally:
+        db.close()
+
+
+def export_response(
+    export_format: ExportFormat,
+    filename: str,
+    columns: Sequence[str],
+    fetch_rows: Callable[[Session], Iterable[tuple]],
+) -> StreamingResponse:
+    """
+    Stream an export as CSV or XLSX.
+
+    Args:
+        export_format: csv or xlsx
+        filename: Download name without extension
+        columns: Header row
+        fetch_rows: Called with a fresh session; yields row tuples
+
+    Returns:
+        StreamingResponse whose first bytes are sent before the query runs
+    """
+    rows = _rows_from_own_session(fetch_rows)
+    if export_format == ExportFormat.XLSX:
+        body = stream_xlsx(columns, rows, sheet_title=filename)
+    else:
+        body = stream_csv(columns, rows)
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format.value}"'
+            )
+        },
+    )
@@ -1,18 +1,70 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, case, func, or_
 from typing import Optional, List, Tuple
 from decimal import Decimal
 from datetime import date, datetime
-import asyncio
 
 from app.models.member_fee import MemberFee
 from app.models.member import Member
 from app.models.membership_plan import MembershipPlan
+from app.models.tenant_daily_ledger import TenantDailyLedger, LedgerSource
 from app.schemas.member_fee import PaymentMethod, PaymentStatus
+from app.core.pagination import paginate_keyset
 from app.services.whatsapp_service import whatsapp_service
+from app.services.ledger_service import record_fee_entry
+from app.models.tenant_resource_version import TenantResource
+from app.services.resource_version_service import bump_resource_version
+from app.services.notification_service import enqueue_notification
 from loguru import logger
 
 
+def _enqueue_fee_notifications(db: Session, fee: MemberFee, member: Member) -> None:
+    """
+    Queue the payment confirmation and receipt for a recorded fee.
+
+    Nothing is queued while the tenant cannot send WhatsApp messages
+    (service disabled or not on their plan).
+    """
+    error = whatsapp_service.access_error(db, fee.tenant_id)
+    if error:
+        logger.debug(f"Fee {fee.id} notifications not queued: {error}")
+        return
+
+    member_name = f"{member.first_name} {member.last_name}"
+
+    enqueue_notification(
+        db,
+        tenant_id=fee.tenant_id,
+        phone_number=member.phone_number,
+        idempotency_key=f"fee:{fee.id}:payment_confirmation",
+        message=whatsapp_service.render_payment_confirmation(
+            member_name=member_name,
+            amount=float(fee.amount_paid),
+            payment_method=fee.payment_method,
+            payment_date=fee.payment_date,
+        ),
+        source_type="member_fee",
+        source_id=fee.id,
+    )
+    enqueue_notification(
+        db,
+        tenant_id=fee.tenant_id,
+        phone_number=member.phone_number,
+        idempotency_key=f"fee:{fee.id}:payment_receipt",
+        message=whatsapp_service.render_payment_receipt(
+            member_name=member_name,
+            amount_paid=float(fee.amount_paid),
+            original_amount=float(fee.original_amount),
+            outstanding_dues=float(member.outstanding_dues),
+            payment_method=fee.payment_method,
+            payment_date=fee.payment_date,
+            transaction_id=fee.transaction_id,
+        ),
+        source_type="member_fee",
+        source_id=fee.id,
+    )
+
+
 def record_fee(
     db: Session, member_id: int, tenant_id: int, fee_data, user_id: int
 ) -> MemberFee:
@@ -33,6 +85,7 @@ def record_fee(
         raise ValueError("Member not found")
 
     # Verify plan if provided
+    plan = None
     if fee_data.plan_id:
         plan = (
             db.query(MembershipPlan)
@@ -54,7 +107,8 @@ def record_fee(
         member_id=member_id,
         tenant_id=tenant_id,
         plan_id=fee_data.plan_id,
-        amount=fee_data.amount,
+        original_amount=plan.price if plan else fee_data.amount,
+        amount_paid=fee_data.amount,
         payment_method=fee_data.payment_method.value,
         payment_date=fee_data.payment_date,
         payment_status=PaymentStatus.PAID.value,
@@ -65,6 +119,9 @@ def record_fee(
 
     db.add(db_fee)
 
+    # Keep the daily ledger rollup in step, in the same transaction
+    record_fee_entry(db, db_fee)
+
     # Update member's total fees paid
     member.total_fees_paid = (member.total_fees_paid or Decimal(0)) + fee_data.amount
 
@@ -72,58 +129,37 @@ def record_fee(
     member.outstanding_dues = max(
         Decimal(0), (member.outstanding_dues or Decimal(0)) - fee_data.amount
     )
+    bump_resource_version(db, tenant_id, TenantResource.MEMBERS)
+
+    # Queue WhatsApp confirmation and receipt with the fee (sent by the
+    # notification worker)
+    db.flush()
+    _enqueue_fee_notifications(db, db_fee, member)
 
     db.commit()
     db.refresh(db_fee)
 
-    logger.info(f"Recorded fee: ₹{fee_data.amount} for member {member_id} by user {user_id}")
-
-    # Get plan details for original amount
-    plan = db.query(MembershipPlan).filter(MembershipPlan.id == fee_data.plan_id).first() if fee_data.plan_id else None
-    original_amount = float(plan.price) if plan else float(fee_data.amount)
-
-    # Send WhatsApp payment confirmation (non-blocking)
-    try:
-        asyncio.create_task(
-            whatsapp_service.send_payment_confirmation(
-                db=db,
-                tenant_id=tenant_id,
-                phone_number=member.phone_number,
-                member_name=f"{member.first_name} {member.last_name}",
-                amount=float(fee_data.amount),
-                payment_method=fee_data.payment_method.value,
-                payment_date=fee_data.payment_date,
-            )
-        )
-    except Exception as e:
-        logger.warning(f"Failed to send WhatsApp payment confirmation: {e}")
-
-    # Send detailed payment receipt (non-blocking)
-    try:
-        asyncio.create_task(
-            whatsapp_service.send_payment_receipt(
-                db=db,
-                tenant_id=tenant_id,
-                phone_number=member.phone_number,
-                member_name=f"{member.first_name} {member.last_name}",
-                amount_paid=float(fee_data.amount),
-                original_amount=original_amount,
-                outstanding_dues=float(member.outstanding_dues),
-                payment_method=fee_data.payment_method.value,
-                payment_date=fee_data.payment_date,
-                transaction_id=fee_data.transaction_id,
-            )
-        )
-    except Exception as e:
-        logger.warning(f"Failed to send WhatsApp payment receipt: {e}")
+    logger.info(
+        f"Recorded fee: ₹{fee_data.amount} for member {member_id} by user {user_id}"
+    )
 
     return db_fee
 
 
 def get_member_fees(
-    db: Session, member_id: int, tenant_id: int, skip: int = 0, limit: int = 100
-) -> Tuple[List[MemberFee], int, Decimal]:
-    """Get all fee payments for a member."""
+    db: Session,
+    member_id: int,
+    tenant_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> Tuple[List[MemberFee], Optional[int], Optional[Decimal], Optional[str]]:
+    """
+    Get fee payments for a member, keyset-paginated on (payment_date, id).
+
+    total and total_amount are None when include_total is False.
+    """
     # Verify member belongs to tenant
     member = (
         db.query(Member)
@@ -138,14 +174,20 @@ def get_member_fees(
     )
 
     if not member:
-        return [], 0, Decimal(0)
+        return [], 0, Decimal(0), None
 
     query = db.query(MemberFee).filter(
         and_(MemberFee.member_id == member_id, MemberFee.tenant_id == tenant_id)
     )
 
+    fees, next_cursor = paginate_keyset(
+        query, MemberFee.payment_date, MemberFee.id, limit, cursor=cursor, skip=skip
+    )
+
+    if not include_total:
+        return fees, None, None, next_cursor
+
     total = query.count()
-    fees = query.order_by(MemberFee.payment_date.desc()).offset(skip).limit(limit).all()
 
     # Calculate total amount
     total_amount = db.query(func.sum(MemberFee.amount)).filter(
@@ -156,7 +198,7 @@ def get_member_fees(
         )
     ).scalar() or Decimal(0)
 
-    return fees, total, total_amount
+    return fees, total, total_amount, next_cursor
 
 
 def get_tenant_fees(
@@ -167,8 +209,15 @@ def get_tenant_fees(
     payment_method: Optional[PaymentMethod] = None,
     skip: int = 0,
     limit: int = 100,
-) -> Tuple[List[MemberFee], int, Decimal]:
-    """Get all fee payments for a tenant with filters."""
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> Tuple[List[MemberFee], Optional[int], Optional[Decimal], Optional[str]]:
+    """
+    Get fee payments for a tenant with filters, keyset-paginated on
+    (payment_date, id).
+
+    total and total_amount are None when include_total is False.
+    """
     query = db.query(MemberFee).filter(MemberFee.tenant_id == tenant_id)
 
     # Apply date filters
@@ -181,8 +230,14 @@ def get_tenant_fees(
     if payment_method:
         query = query.filter(MemberFee.payment_method == payment_method.value)
 
+    fees, next_cursor = paginate_keyset(
+        query, MemberFee.payment_date, MemberFee.id, limit, cursor=cursor, skip=skip
+    )
+
+    if not include_total:
+        return fees, None, None, next_cursor
+
     total = query.count()
-    fees = query.order_by(MemberFee.payment_date.desc()).offset(skip).limit(limit).all()
 
     # Calculate total amount for paid fees
     amount_query = db.query(func.sum(MemberFee.amount)).filter(
@@ -201,7 +256,7 @@ def get_tenant_fees(
 
     total_amount = amount_query.scalar() or Decimal(0)
 
-    return fees, total, total_amount
+    return fees, total, total_amount, next_cursor
 
 
 def calculate_outstanding_dues(db: Session, member_id: int, tenant_id: int) -> Decimal:
@@ -227,76 +282,34 @@ def calculate_outstanding_dues(db: Session, member_id: int, tenant_id: int) -> D
 def get_financial_report(
     db: Session, tenant_id: int, start_date: date, end_date: date
 ) -> dict:
-    """Generate financial report for a tenant."""
-    # Total revenue
-    total_revenue = db.query(func.sum(MemberFee.amount)).filter(
-        and_(
-            MemberFee.tenant_id == tenant_id,
-            MemberFee.payment_date >= start_date,
-            MemberFee.payment_date <= end_date,
-            MemberFee.payment_status == PaymentStatus.PAID.value,
-        )
-    ).scalar() or Decimal(0)
-
-    # Revenue by payment method
-    cash_payments = db.query(func.sum(MemberFee.amount)).filter(
-        and_(
-            MemberFee.tenant_id == tenant_id,
-            MemberFee.payment_date >= start_date,
-            MemberFee.payment_date <= end_date,
-            MemberFee.payment_method == PaymentMethod.CASH.value,
-            MemberFee.payment_status == PaymentStatus.PAID.value,
-        )
-    ).scalar() or Decimal(0)
-
-    upi_payments = db.query(func.sum(MemberFee.amount)).filter(
-        and_(
-            MemberFee.tenant_id == tenant_id,
-            MemberFee.payment_date >= start_date,
-            MemberFee.payment_date <= end_date,
-            MemberFee.payment_method == PaymentMethod.UPI.value,
-            MemberFee.payment_status == PaymentStatus.PAID.value,
-        )
-    ).scalar() or Decimal(0)
-
-    card_payments = db.query(func.sum(MemberFee.amount)).filter(
-        and_(
-            MemberFee.tenant_id == tenant_id,
-            MemberFee.payment_date >= start_date,
-            MemberFee.payment_date <= end_date,
-            MemberFee.payment_method == PaymentMethod.CARD.value,
-            MemberFee.payment_status == PaymentStatus.PAID.value,
+    """
+    Generate financial report for a tenant.
+
+    All figures are computed in a single scan of the tenant's paid fees for
+    the date range, using conditional aggregates for the per-method totals.
+    """
+
+    def _method_total(method: PaymentMethod):
+        return func.coalesce(
+            func.sum(
+                case(
+                    (MemberFee.payment_method == method.value, MemberFee.amount_paid),
+                    else_=0,
+                )
+            ),
+            0,
         )
-    ).scalar() or Decimal(0)
 
-    bank_transfer_payments = db.query(func.sum(MemberFee.amount)).filter(
-        and_(
-            MemberFee.tenant_id == tenant_id,
-            MemberFee.payment_date >= start_date,
-            MemberFee.payment_date <= end_date,
-            MemberFee.payment_method == PaymentMethod.BANK_TRANSFER.value,
-            MemberFee.payment_status == PaymentStatus.PAID.value,
+    row = (
+        db.query(
+            func.coalesce(func.sum(MemberFee.amount_paid), 0).label("total_revenue"),
+            _method_total(PaymentMethod.CASH).label("cash_payments"),
+            _method_total(PaymentMethod.UPI).label("upi_payments"),
+            _method_total(PaymentMethod.CARD).label("card_payments"),
+            _method_total(PaymentMethod.BANK_TRANSFER).label("bank_transfer_payments"),
+            func.count(MemberFee.id).label("payment_count"),
+            func.count(func.distinct(MemberFee.member_id)).label("member_count"),
         )
-    ).scalar() or Decimal(0)
-
-    # Payment count
-    payment_count = (
-        db.query(func.count(MemberFee.id))
-        .filter(
-            and_(
-                MemberFee.tenant_id == tenant_id,
-                MemberFee.payment_date >= start_date,
-                MemberFee.payment_date <= end_date,
-                MemberFee.payment_status == PaymentStatus.PAID.value,
-            )
-        )
-        .scalar()
-        or 0
-    )
-
-    # Unique members who paid
-    member_count = (
-        db.query(func.count(func.distinct(MemberFee.member_id)))
         .filter(
             and_(
                 MemberFee.tenant_id == tenant_id,
@@ -305,65 +318,54 @@ def get_financial_report(
                 MemberFee.payment_status == PaymentStatus.PAID.value,
             )
         )
-        .scalar()
-        or 0
+        .one()
     )
 
     return {
         "start_date": start_date,
         "end_date": end_date,
-        "total_revenue": total_revenue,
-        "cash_payments": cash_payments,
-        "upi_payments": upi_payments,
-        "card_payments": card_payments,
-        "bank_transfer_payments": bank_transfer_payments,
-        "payment_count": payment_count,
-        "member_count": member_count,
+        "total_revenue": Decimal(row.total_revenue),
+        "cash_payments": Decimal(row.cash_payments),
+        "upi_payments": Decimal(row.upi_payments),
+        "card_payments": Decimal(row.card_payments),
+        "bank_transfer_payments": Decimal(row.bank_transfer_payments),
+        "payment_count": row.payment_count or 0,
+        "member_count": row.member_count or 0,
     }
 
 
 def get_fee_statistics(db: Session, tenant_id: int) -> dict:
-    """Get fee statistics for a tenant."""
-    # Total collected
-    total_collected = db.query(func.sum(MemberFee.amount)).filter(
-        and_(
-            MemberFee.tenant_id == tenant_id,
-            MemberFee.payment_status == PaymentStatus.PAID.value,
-        )
-    ).scalar() or Decimal(0)
-
-    # Total pending
-    total_pending = db.query(func.sum(MemberFee.amount)).filter(
-        and_(
-            MemberFee.tenant_id == tenant_id,
-            MemberFee.payment_status == PaymentStatus.PENDING.value,
+    """
+    Get fee statistics for a tenant.
+
+    Read from the daily ledger rollup, so the cost scales with the number of
+    days with payments rather than the number of payments.
+    """
+    rows = (
+        db.query(
+            TenantDailyLedger.payment_status,
+            func.sum(TenantDailyLedger.total_amount),
+            func.sum(TenantDailyLedger.entry_count),
         )
-    ).scalar() or Decimal(0)
-
-    # Total refunded
-    total_refunded = db.query(func.sum(MemberFee.amount)).filter(
-        and_(
-            MemberFee.tenant_id == tenant_id,
-            MemberFee.payment_status == PaymentStatus.REFUNDED.value,
-        )
-    ).scalar() or Decimal(0)
-
-    # Payment count
-    payment_count = (
-        db.query(func.count(MemberFee.id))
         .filter(
             and_(
-                MemberFee.tenant_id == tenant_id,
-                MemberFee.payment_status == PaymentStatus.PAID.value,
+                TenantDailyLedger.tenant_id == tenant_id,
+                TenantDailyLedger.source == LedgerSource.FEE.value,
             )
         )
-        .scalar()
-        or 0
+        .group_by(TenantDailyLedger.payment_status)
+        .all()
     )
+    by_status = {status: (total, count) for status, total, count in rows}
+
+    def _total(status: PaymentStatus) -> Decimal:
+        return by_status.get(status.value, (None, None))[0] or Decimal(0)
 
     return {
-        "total_collected": total_collected,
-        "total_pending": total_pending,
-        "total_refunded": total_refunded,
-        "payment_count": payment_count,
+        "total_collected": _total(PaymentStatus.PAID),
+        "total_pending": _total(PaymentStatus.PENDING),
+        "total_refunded": _total(PaymentStatus.REFUNDED),
+        "payment_count": int(
+            by_status.get(PaymentStatus.PAID.value, (None, None))[1] or 0
+        ),
     }
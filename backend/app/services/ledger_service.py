@@ -0,0 +1,164 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from typing import Optional
+from decimal import Decimal
+from datetime import date
+
+from app.models.tenant_daily_ledger import TenantDailyLedger, LedgerSource
+from app.models.member_fee import MemberFee
+from app.models.expenses import Expense
+from loguru import logger
+
+
+def _enum_value(value) -> str:
+    """Ledger buckets are stored as plain strings ("" when not applicable)."""
+    if value is None:
+        return ""
+    return value.value if hasattr(value, "value") else str(value)
+
+
+def record_ledger_entry(
+    db: Session,
+    tenant_id: int,
+    ledger_date: date,
+    source: LedgerSource,
+    amount: Decimal,
+    count: int = 1,
+    category: str = "",
+    payment_method: str = "",
+    payment_status: str = "",
+) -> None:
+    """
+    Add (or, with negative values, remove) an entry to a ledger bucket.
+
+    Runs as an upsert inside the caller's transaction; the caller commits.
+    """
+    stmt = insert(TenantDailyLedger).values(
+        tenant_id=tenant_id,
+        ledger_date=ledger_date,
+        source=source.value,
+        category=category,
+        payment_method=payment_method,
+        payment_status=payment_status,
+        total_amount=amount,
+        entry_count=count,
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="unique_ledger_bucket",
+        set_={
+            "total_amount": TenantDailyLedger.total_amount + stmt.excluded.total_amount,
+            "entry_count": TenantDailyLedger.entry_count + stmt.excluded.entry_count,
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+
+
+def record_fee_entry(db: Session, fee: MemberFee, sign: int = 1) -> None:
+    """Apply a fee to the ledger (sign=-1 reverses it)."""
+    record_ledger_entry(
+        db,
+        tenant_id=fee.tenant_id,
+        ledger_date=fee.payment_date,
+        source=LedgerSource.FEE,
+        amount=Decimal(fee.amount_paid) * sign,
+        count=sign,
+        payment_method=_enum_value(fee.payment_method),
+        payment_status=_enum_value(fee.payment_status),
+    )
+
+
+def record_expense_entry(db: Session, expense: Expense, sign: int = 1) -> None:
+    """Apply an expense to the ledger (sign=-1 reverses it)."""
+    record_ledger_entry(
+        db,
+        tenant_id=expense.tenant_id,
+        ledger_date=expense.expense_date,
+        source=LedgerSource.EXPENSE,
+        amount=Decimal(expense.amount) * sign,
+        count=sign,
+        category=_enum_value(expense.category),
+        payment_method=_enum_value(expense.payment_method),
+    )
+
+
+def rebuild_ledger(db: Session, tenant_id: Optional[int] = None) -> int:
+    """
+    Rebuild ledger rows from raw member_fees and expenses.
+
+    Used to backfill the rollup (python manage.py backfill-ledger) and to
+    repair drift. Rebuilds every tenant unless tenant_id is given.
+
+    Returns:
+        Number of ledger rows written
+    """
+    delete_q = db.query(TenantDailyLedger)
+    fee_q = db.query(
+        MemberFee.tenant_id,
+        MemberFee.payment_date,
+        MemberFee.payment_method,
+        MemberFee.payment_status,
+        func.sum(MemberFee.amount_paid),
+        func.count(MemberFee.id),
+    )
+    expense_q = db.query(
+        Expense.tenant_id,
+        Expense.expense_date,
+        Expense.category,
+        Expense.payment_method,
+        func.sum(Expense.amount),
+        func.count(Expense.id),
+    ).filter(Expense.is_deleted == False)
+
+    if tenant_id is not None:
+        delete_q = delete_q.filter(TenantDailyLedger.tenant_id == tenant_id)
+        fee_q = fee_q.filter(MemberFee.tenant_id == tenant_id)
+        expense_q = expense_q.filter(Expense.tenant_id == tenant_id)
+
+    delete_q.delete(synchronize_session=False)
+
+    rows = [
+        {
+            "tenant_id": t_id,
+            "ledger_date": day,
+            "source": LedgerSource.FEE.value,
+            "category": "",
+            "payment_method": _enum_value(method),
+            "payment_status": _enum_value(status),
+            "total_amount": total or Decimal(0),
+            "entry_count": count,
+        }
+        for t_id, day, method, status, total, count in fee_q.group_by(
+            MemberFee.tenant_id,
+            MemberFee.payment_date,
+            MemberFee.payment_method,
+            MemberFee.payment_status,
+        )
+    ]
+    rows += [
+        {
+            "tenant_id": t_id,
+            "ledger_date": day,
+            "source": LedgerSource.EXPENSE.value,
+            "category": _enum_value(category),
+            "payment_method": _enum_value(method),
+            "payment_status": "",
+            "total_amount": total or Decimal(0),
+            "entry_count": count,
+        }
+        for t_id, day, category, method, total, count in expense_q.group_by(
+            Expense.tenant_id,
+            Expense.expense_date,
+            Expense.category,
+            Expense.payment_method,
+        )
+    ]
+
+    if rows:
+        db.execute(insert(TenantDailyLedger), rows)
+    db.commit()
+
+    scope = f"tenant {tenant_id}" if tenant_id is not None else "all tenants"
+    logger.info(f"Rebuilt daily ledger for {scope}: {len(rows)} rows")
+    return len(rows)
@@ -0,0 +1,302 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from pydantic import ValidationError
+from datetime import date, datetime, timedelta
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+import codecs
+import csv
+
+from app.models.member import Member, MemberStatus
+from app.models.membership_plan import MembershipPlan
+from app.schemas.members import MemberCreate
+from app.services.member_service import _get_duration_from_type
+from app.models.tenant_resource_version import TenantResource
+from app.services.resource_version_service import bump_resource_version
+from app.services.usage_service import record_usage
+from loguru import logger
+
+# Rows validated and inserted per transaction
+IMPORT_BATCH_SIZE = 500
+
+IMPORT_COLUMNS = (
+    "first_name",
+    "last_name",
+    "phone_number",
+    "email",
+    "joining_date",
+    "membership_type",
+    "plan_id",
+    "plan_name",
+)
+
+
+def _normalize_header(name: Any) -> str:
+    return str(name or "").strip().lower().replace(" ", "_")
+
+
+def _clean_value(value: Any) -> Any:
+    """Blank cells become None; spreadsheet numbers/dates become plain values."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, int):
+        # Phone numbers and ids typed into spreadsheets come back as numbers
+        return str(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def iter_csv_rows(file: BinaryIO) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Stream (row_number, row) pairs from a CSV upload without loading it whole."""
+    reader = csv.DictReader(codecs.iterdecode(file, "utf-8-sig"))
+    reader.fieldnames = [_normalize_header(h) for h in reader.fieldnames or []]
+    for row_number, row in enumerate(reader, start=2):  # row 1 is the header
+        yield row_number, {k: _clean_value(v) for k, v in row.items() if k}
+
+
+def iter_xlsx_rows(file: BinaryIO) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Stream (row_number, row) pairs from the first sheet of an XLSX upload."""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("XLSX import requires the openpyxl package")
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [_normalize_header(h) for h in next(rows, ())]
+        for row_number, values in enumerate(rows, start=2):
+            if not any(v is not None for v in values):
+                continue
+            yield row_number, {
+                key: _clean_value(value) for key, value in zip(header, values) if key
+            }
+    finally:
+        workbook.close()
+
+
+def iter_import_rows(file: BinaryIO, filename: str):
+    """Pick the row reader from the file extension (.csv or .xlsx)."""
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return iter_csv_rows(file)
+    if name.endswith(".xlsx"):
+        return iter_xlsx_rows(file)
+    raise ValueError("Unsupported file type. Upload a .csv or .xlsx file")
+
+
+def _member_capacity(db: Session, tenant_id: int) -> Optional[int]:
+    """Remaining member slots for the tenant (None means unlimited)."""
+    from app.services.subscription_service import get_current_limits, get_plan_limits
+
+    max_members = get_plan_limits(db, tenant_id)["max_members"]
+    if max_members == -1:
+        return None
+    return max(max_members - get_current_limits(db, tenant_id)["member_count"], 0)
+
+
+def _validation_messages(error: ValidationError) -> List[str]:
+    messages = []
+    for err in error.errors():
+        field = ".".join(str(loc) for loc in err["loc"])
+        message = err["msg"].removeprefix("Value error, ")
+        messages.append(f"{field}: {message}" if field else message)
+    return messages
+
+
+def import_members(
+    db: Session,
+    tenant_id: int,
+    rows: Iterator[Tuple[int, Dict[str, Any]]],
+    dry_run: bool = False,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> dict:
+    """
+    Validate and bulk-insert members from parsed import rows.
+
+    Plans and existing phone numbers are loaded once up front; each batch
+    is validated with MemberCreate, checked against the plan's member limit
+    and inserted with a single executemany INSERT.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant ID
+        rows: (row_number, row) pairs from iter_import_rows
+        dry_run: Validate only, insert nothing
+        batch_size: Rows per batch/transaction
+
+    Returns:
+        Report dict with counts and per-row errors. If an unexpected error
+        stops the import after some batches were committed, the report is
+        returned with aborted set, the error, the row it stopped at and the
+        batch that was rolled back listed in errors; imported counts only
+        committed rows. Errors before any commit are raised.
+    """
+    plans = (
+        db.query(MembershipPlan)
+        .filter(MembershipPlan.tenant_id == tenant_id, MembershipPlan.is_active == True)
+        .all()
+    )
+    plans_by_id = {plan.id: plan for plan in plans}
+    plans_by_name = {plan.name.strip().lower(): plan for plan in plans}
+
+    # unique_member_per_tenant covers soft-deleted members too
+    known_phones = {
+        phone
+        for (phone,) in db.query(Member.phone_number).filter(
+            Member.tenant_id == tenant_id
+        )
+    }
+
+    report = {
+        "total_rows": 0,
+        "imported": 0,
+        "failed": 0,
+        "dry_run": dry_run,
+        "aborted": False,
+        "error": None,
+        "failed_row": None,
+        "errors": [],
+    }
+    # Whether a batch has been committed, and the rows of the batch being
+    # inserted until its commit succeeds
+    committed = False
+    pending: List[int] = []
+
+    def fail(row_number: int, messages: List[str]) -> None:
+        report["failed"] += 1
+        report["errors"].append({"row": row_number, "errors": messages})
+
+    def flush(batch: List[Tuple[int, dict]]) -> None:
+        nonlocal committed
+        if not batch:
+            return
+
+        capacity = _member_capacity(db, tenant_id)
+        if capacity is not None and dry_run:
+            # Nothing was inserted, so count earlier batches against the limit
+            capacity = max(capacity - report["imported"], 0)
+        if capacity is not None and len(batch) > capacity:
+            for row_number, _ in batch[capacity:]:
+                fail(row_number, ["Member limit reached. Upgrade your plan."])
+            batch = batch[:capacity]
+
+        if batch and not dry_run:
+            pending.extend(row_number for row_number, _ in batch)
+            db.execute(insert(Member), [values for _, values in batch])
+            record_usage(db, tenant_id, members=len(batch))
+            bump_resource_version(db, tenant_id, TenantResource.MEMBERS)
+            db.commit()
+            pending.clear()
+            committed = True
+
+        report["imported"] += len(batch)
+
+    today = date.today()
+
+    def build(row_number: int, row: Dict[str, Any]) -> Optional[dict]:
+        """Validate one row into Member insert values (None if it failed)."""
+        data = {key: row.get(key) for key in IMPORT_COLUMNS}
+
+        plan_name = data.pop("plan_name")
+        if plan_name and not data.get("plan_id"):
+            plan = plans_by_name.get(str(plan_name).strip().lower())
+            if not plan:
+                fail(row_number, [f"plan_name: Plan '{plan_name}' not found"])
+                return None
+            data["plan_id"] = plan.id
+
+        try:
+            member = MemberCreate(**{k: v for k, v in data.items() if v is not None})
+        except ValidationError as e:
+            fail(row_number, _validation_messages(e))
+            return None
+
+        if member.phone_number in known_phones:
+            fail(
+                row_number,
+                ["phone_number: A member with this phone number already exists"],
+            )
+            return None
+
+        if member.plan_id:
+            plan = plans_by_id.get(member.plan_id)
+            if not plan:
+                fail(row_number, ["plan_id: Plan not found or not available"])
+                return None
+            duration_days = plan.duration_days
+        elif member.membership_type:
+            duration_days = _get_duration_from_type(member.membership_type)
+        else:
+            fail(
+                row_number,
+                ["Either plan_id, plan_name or membership_type must be provided"],
+            )
+            return None
+
+        known_phones.add(member.phone_number)
+        expiry_date = member.joining_date + timedelta(days=duration_days)
+        return {
+            "tenant_id": tenant_id,
+            "first_name": member.first_name,
+            "last_name": member.last_name,
+            "phone_number": member.phone_number,
+            "email": member.email,
+            "joining_date": member.joining_date,
+            "membership_expiry_date": expiry_date,
+            "plan_id": member.plan_id,
+            "current_plan_start_date": (
+                member.joining_date if member.plan_id else None
+            ),
+            "status": (
+                MemberStatus.EXPIRED if expiry_date < today else MemberStatus.ACTIVE
+            ),
+            "is_active": True,
+        }
+
+    batch: List[Tuple[int, dict]] = []
+    row_number = None
+
+    try:
+        for row_number, row in rows:
+            report["total_rows"] += 1
+            values = build(row_number, row)
+            if values is None:
+                continue
+
+            batch.append((row_number, values))
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+
+        flush(batch)
+    except Exception as e:
+        # Nothing saved yet: the caller can report the error and retry as is
+        if not committed:
+            raise
+
+        # Earlier batches are committed; report them rather than losing track
+        db.rollback()
+        unsaved = pending or [number for number, _ in batch]
+        for number in unsaved:
+            fail(number, ["Not imported: the import stopped at an error"])
+        report["aborted"] = True
+        report["error"] = "The import stopped at an unexpected error"
+        report["failed_row"] = unsaved[0] if unsaved else row_number
+        logger.error(
+            f"Member import for tenant {tenant_id} stopped at row "
+            f"{report['failed_row']} after {report['imported']} rows were "
+            f"imported: {e}"
+        )
+
+    logger.info(
+        f"Member import for tenant {tenant_id}: {report['imported']} imported, "
+        f"{report['failed']} failed of {report['total_rows']} rows"
+        + (" (dry run)" if dry_run else "")
+    )
+    return report
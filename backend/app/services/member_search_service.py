@@ -0,0 +1,123 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func, or_
+from typing import Optional
+import re
+
+from app.models.member import Member, full_name_expression
+from app.schemas.members import MemberSearchResult
+from app.services.member_service import effective_status_expr
+
+# Minimum number of digits before a query is treated as a phone search
+MIN_PHONE_DIGITS = 3
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards in user input (used with escape='\\')."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _normalize_phone_query(term: str) -> Optional[str]:
+    """
+    Return the digits to search for if the query looks like a phone number.
+
+    Phones are stored as 10 digits (see validate_phone_number), so a typed
+    +91/91 country prefix is dropped.
+    """
+    if not re.fullmatch(r"[\d\s+\-()]+", term):
+        return None
+
+    digits = re.sub(r"\D", "", term)
+    if term.startswith("+91") or (len(digits) == 12 and digits.startswith("91")):
+        digits = digits[2:]
+
+    return digits if len(digits) >= MIN_PHONE_DIGITS else None
+
+
+def search_members(
+    db: Session, tenant_id: int, query: str, limit: int = 10
+) -> list[MemberSearchResult]:
+    """
+    Ranked typeahead search over a tenant's active members.
+
+    Digit queries match phone prefixes and suffixes (last digits); other
+    queries match names by prefix, substring and trigram similarity. On
+    PostgreSQL this is served by the pg_trgm and reverse(phone) indexes on
+    members; other databases (SQLite for local testing) fall back to plain
+    LIKE matching with a CASE-based rank.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant ID
+        query: Raw search text
+        limit: Maximum number of results
+
+    Returns:
+        Results ordered best match first
+    """
+    term = query.strip()
+    if not term:
+        return []
+
+    is_postgres = db.get_bind().dialect.name == "postgresql"
+    phone_digits = _normalize_phone_query(term)
+
+    if phone_digits:
+        prefix_match = Member.phone_number.like(f"{phone_digits}%")
+        if is_postgres:
+            # Served by ix_members_phone_suffix (reverse(phone) text_pattern_ops)
+            suffix_match = func.reverse(Member.phone_number).like(
+                f"{phone_digits[::-1]}%"
+            )
+        else:
+            suffix_match = Member.phone_number.like(f"%{phone_digits}")
+
+        match = or_(prefix_match, suffix_match)
+        score = case(
+            (Member.phone_number == phone_digits, 2.0),
+            (prefix_match, 1.0),
+            else_=0.5,
+        )
+    else:
+        escaped = _escape_like(term)
+        full_name = full_name_expression(
+            Member.first_name, Member.last_name
+        ).self_group()
+        name_prefix = or_(
+            Member.first_name.ilike(f"{escaped}%", escape="\\"),
+            Member.last_name.ilike(f"{escaped}%", escape="\\"),
+            full_name.ilike(f"{escaped}%", escape="\\"),
+        )
+        contains = full_name.ilike(f"%{escaped}%", escape="\\")
+
+        if is_postgres:
+            # Substring and fuzzy (typo-tolerant) matches both use the
+            # ix_members_full_name_trgm GIN index
+            match = or_(contains, full_name.op("%")(term))
+            score = case((name_prefix, 1.0), else_=0.0) + func.similarity(
+                full_name, term
+            )
+        else:
+            match = contains
+            score = case((name_prefix, 1.0), else_=0.5)
+
+    score = score.label("score")
+    rows = (
+        db.query(
+            Member.id,
+            Member.first_name,
+            Member.last_name,
+            Member.phone_number,
+            Member.membership_expiry_date,
+            effective_status_expr().label("status"),
+            score,
+        )
+        .filter(
+            and_(Member.tenant_id == tenant_id, Member.is_active == True),
+            match,
+        )
+        .order_by(score.desc(), Member.first_name, Member.last_name, Member.id)
+        .limit(limit)
+        .all()
+    )
+
+    return [MemberSearchResult(**row._mapping) for row in rows]
@@ -1,11 +1,17 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import or_, and_, case, cast, literal
 from datetime import date, timedelta
-from typing import Optional
+from typing import Optional, Sequence
 from app.models.member import Member, MemberStatus
 from app.models.membership_plan import MembershipPlan
 from app.schemas.members import MemberCreate, MemberUpdate, MemberRenew
 from app.core.exceptions import UserAlreadyExistsException
+from app.core.pagination import paginate_keyset
+from app.core.query_options import MEMBER_PROFILE
+from app.models.tenant_resource_version import TenantResource
+from app.services.resource_version_service import bump_resource_version
+from app.services.usage_service import record_usage
 from loguru import logger
 
 
@@ -52,6 +58,77 @@ def update_member_status(member: Member) -> MemberStatus:
         return MemberStatus.ACTIVE
 
 
+def effective_status_expr(today: Optional[date] = None):
+    """
+    SQL expression for a member's status as of today (mirrors update_member_status).
+
+    Lets read paths report the correct status without writing; the stored
+    column is brought up to date by reconcile_member_statuses.
+    """
+    today = today or date.today()
+    status_type = Member.status.type
+    return cast(
+        case(
+            (Member.is_active == False, literal(MemberStatus.INACTIVE, status_type)),
+            (
+                Member.membership_expiry_date < today,
+                literal(MemberStatus.EXPIRED, status_type),
+            ),
+            else_=literal(MemberStatus.ACTIVE, status_type),
+        ),
+        status_type,
+    )
+
+
+def _with_effective_status(rows) -> list[Member]:
+    """Apply the derived status to loaded members without marking them dirty."""
+    members = []
+    for member, effective_status in rows:
+        set_committed_value(member, "status", effective_status)
+        members.append(member)
+    return members
+
+
+def reconcile_member_statuses(db: Session, tenant_id: Optional[int] = None) -> int:
+    """
+    Persist expired/renewed statuses with one set-based UPDATE per tenant.
+
+    Run nightly (python manage.py reconcile-members) or on demand from the
+    admin API. Reconciles every tenant unless tenant_id is given.
+
+    Returns:
+        Number of members whose status changed
+    """
+    from app.models.tenant import Tenant
+
+    if tenant_id is not None:
+        tenant_ids = [tenant_id]
+    else:
+        tenant_ids = [t_id for (t_id,) in db.query(Tenant.id).all()]
+
+    effective_status = effective_status_expr()
+    updated = 0
+    for t_id in tenant_ids:
+        count = (
+            db.query(Member)
+            .filter(
+                Member.tenant_id == t_id,
+                Member.is_active == True,
+                Member.status != effective_status,
+            )
+            .update({Member.status: effective_status}, synchronize_session=False)
+        )
+        if count:
+            bump_resource_version(db, t_id, TenantResource.MEMBERS)
+        # Commit per tenant to keep row locks short
+        db.commit()
+        if count:
+            logger.info(f"Reconciled {count} member statuses for tenant {t_id}")
+        updated += count
+
+    return updated
+
+
 def create_member(db: Session, member_create: MemberCreate, tenant_id: int) -> Member:
     """
     Create a new member.
@@ -135,6 +212,8 @@ def create_member(db: Session, member_create: MemberCreate, tenant_id: int) -> M
     )
 
     db.add(db_member)
+    record_usage(db, tenant_id, members=1)
+    bump_resource_version(db, tenant_id, TenantResource.MEMBERS)
     db.commit()
     db.refresh(db_member)
 
@@ -154,9 +233,13 @@ def _get_duration_from_type(membership_type: str) -> int:
     return duration_map.get(membership_type, 30)
 
 
-def get_member_by_id(db: Session, member_id: int, tenant_id: int) -> Optional[Member]:
-    member = (
-        db.query(Member)
+def get_member_by_id(
+    db: Session, member_id: int, tenant_id: int, options: Sequence = ()
+) -> Optional[Member]:
+    """options: eager-loading preset from app.core.query_options, if any."""
+    row = (
+        db.query(Member, effective_status_expr())
+        .options(*options)
         .filter(
             and_(
                 Member.id == member_id,
@@ -167,15 +250,10 @@ def get_member_by_id(db: Session, member_id: int, tenant_id: int) -> Optional[Me
         .first()
     )
 
-    if member:
-        # Update status based on expiry
-        new_status = update_member_status(member)
-        if member.status != new_status:
-            member.status = new_status
-            db.commit()
-            db.refresh(member)
+    if not row:
+        return None
 
-    return member
+    return _with_effective_status([row])[0]
 
 
 def get_members_by_tenant(
@@ -185,8 +263,17 @@ def get_members_by_tenant(
     limit: int = 100,
     search: Optional[str] = None,
     status: Optional[MemberStatus] = None,
-) -> tuple[list[Member], int]:
-    query = db.query(Member).filter(
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> tuple[list[Member], Optional[int], Optional[str]]:
+    """
+    List active members newest first, keyset-paginated on (created_at, id).
+
+    Returns:
+        Tuple of (members, total or None when include_total is False, next_cursor)
+    """
+    effective_status = effective_status_expr()
+    query = db.query(Member, effective_status).filter(
         and_(Member.tenant_id == tenant_id, Member.is_active == True)
     )
 
@@ -203,24 +290,16 @@ def get_members_by_tenant(
 
     # Apply status filter
     if status:
-        query = query.filter(Member.status == status)
+        query = query.filter(effective_status == status)
 
-    # Get total count
-    total = query.count()
+    # Count only when asked: it scans every matching row
+    total = query.count() if include_total else None
 
-    # Get paginated results
-    members = query.order_by(Member.created_at.desc()).offset(skip).limit(limit).all()
-
-    # Update statuses
-    for member in members:
-        new_status = update_member_status(member)
-        if member.status != new_status:
-            member.status = new_status
-
-    if members:
-        db.commit()
+    rows, next_cursor = paginate_keyset(
+        query, Member.created_at, Member.id, limit, cursor=cursor, skip=skip
+    )
 
-    return members, total
+    return _with_effective_status(rows), total, next_cursor
 
 
 def update_member(
@@ -255,6 +334,7 @@ def update_member(
     for field, value in update_data.items():
         setattr(member, field, value)
 
+    bump_resource_version(db, tenant_id, TenantResource.MEMBERS)
     db.commit()
     db.refresh(member)
 
@@ -271,6 +351,8 @@ def delete_member(db: Session, member_id: int, tenant_id: int) -> bool:
 
     member.is_active = False
     member.status = MemberStatus.INACTIVE
+    record_usage(db, tenant_id, members=-1)
+    bump_resource_version(db, tenant_id, TenantResource.MEMBERS)
     db.commit()
 
     logger.info(
@@ -329,6 +411,7 @@ def renew_membership(
 
     member.membership_expiry_date = new_expiry
     member.status = MemberStatus.ACTIVE
+    bump_resource_version(db, tenant_id, TenantResource.MEMBERS)
 
     db.commit()
     db.refresh(member)
@@ -357,6 +440,7 @@ def update_member_photo(
     else:
         raise ValueError("photo_type must be 'before' or 'after'")
 
+    bump_resource_version(db, tenant_id, TenantResource.MEMBERS)
     db.commit()
     db.refresh(member)
 
@@ -369,7 +453,7 @@ def update_member_photo(
 def get_member_profile_detailed(db: Session, member_id: int, tenant_id: int):
     from app.models.member_fee import MemberFee
 
-    member = get_member_by_id(db, member_id, tenant_id)
+    member = get_member_by_id(db, member_id, tenant_id, options=MEMBER_PROFILE)
     if not member:
         return None
 
@@ -447,7 +531,7 @@ def get_member_profile_detailed(db: Session, member_id: int, tenant_id: int):
 async def send_expiry_reminders(
     db: Session, tenant_id: int, days_before_expiry: int = 7
 ) -> dict:
-    from datetime import timedelta
+    from app.services.whatsapp_service import whatsapp_service
 
     target_date = date.today() + timedelta(days=days_before_expiry)
 
@@ -465,34 +549,29 @@ async def send_expiry_reminders(
         .all()
     )
 
-    sent_count = 0
-    failed_count = 0
-
-    for member in expiring_members:
-        try:
-            result = await whatsapp_service.send_expiry_reminder(
-                db=db,
-                tenant_id=tenant_id,
-                phone_number=member.phone_number,
+    messages = [
+        {
+            "phone_number": member.phone_number,
+            "message": whatsapp_service.render_expiry_reminder(
                 member_name=f"{member.first_name} {member.last_name}",
                 expiry_date=member.membership_expiry_date,
                 days_remaining=days_before_expiry,
-            )
-
-            if result.get("success"):
-                sent_count += 1
-                logger.info(
-                    f"Sent expiry reminder to {member.first_name} {member.last_name} (ID: {member.id})"
-                )
-            else:
-                failed_count += 1
-                logger.warning(
-                    f"Failed to send expiry reminder to {member.first_name} {member.last_name} (ID: {member.id})"
-                )
-        except Exception as e:
-            failed_count += 1
-            logger.error(
-                f"Error sending expiry reminder to {member.first_name} {member.last_name} (ID: {member.id}): {e}"
+            ),
+            "ref": member.id,
+        }
+        for member in expiring_members
+    ]
+
+    # Sent concurrently over the pooled client (bounded per tenant session)
+    batch = await whatsapp_service.send_batch(db, tenant_id, messages)
+    sent_count = batch["sent_count"]
+    failed_count = batch["failed_count"]
+
+    for result in batch["results"]:
+        if not result["success"]:
+            logger.warning(
+                f"Failed to send expiry reminder to member ID {result['ref']}: "
+                f"{result.get('error')}"
             )
 
     logger.info(
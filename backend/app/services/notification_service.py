@@ -0,0 +1,155 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+import random
+
+from app.core.config import settings
+from app.models.diet_plan import DietPlanAssignment
+from app.models.notification_outbox import NotificationOutbox, NotificationStatus
+from loguru import logger
+
+
+def enqueue_notification(
+    db: Session,
+    tenant_id: int,
+    phone_number: str,
+    idempotency_key: str,
+    message: Optional[str] = None,
+    image_url: Optional[str] = None,
+    caption: Optional[str] = None,
+    source_type: Optional[str] = None,
+    source_id: Optional[int] = None,
+) -> None:
+    """
+    Queue a WhatsApp message for the notification worker.
+
+    Runs inside the caller's transaction (the caller commits), so the
+    message is only queued if the triggering change is saved. A second
+    enqueue with the same idempotency_key is ignored.
+    """
+    stmt = insert(NotificationOutbox).values(
+        tenant_id=tenant_id,
+        idempotency_key=idempotency_key,
+        channel="whatsapp",
+        phone_number=phone_number,
+        message=message,
+        image_url=image_url,
+        caption=caption,
+        source_type=source_type,
+        source_id=source_id,
+        status=NotificationStatus.PENDING.value,
+        attempts=0,
+    )
+    db.execute(stmt.on_conflict_do_nothing(index_elements=["idempotency_key"]))
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff with jitter for the given number of attempts."""
+    delay = min(
+        settings.NOTIFICATION_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0),
+        settings.NOTIFICATION_RETRY_MAX_SECONDS,
+    )
+    return timedelta(seconds=delay * random.uniform(0.9, 1.1))
+
+
+def claim_due_notifications(db: Session, limit: int) -> List[NotificationOutbox]:
+    """
+    Claim up to limit due notifications and commit the claim.
+
+    Rows are locked with SKIP LOCKED so several workers can drain the
+    outbox in parallel. Claimed rows have their attempt counted and
+    next_attempt_at pushed out by the claim lease, so a row whose worker
+    dies mid-send is picked up again later.
+    """
+    now = datetime.now(timezone.utc)
+    rows = (
+        db.query(NotificationOutbox)
+        .filter(
+            NotificationOutbox.status == NotificationStatus.PENDING.value,
+            NotificationOutbox.next_attempt_at <= now,
+        )
+        .order_by(NotificationOutbox.next_attempt_at, NotificationOutbox.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+    lease_until = now + timedelta(seconds=settings.NOTIFICATION_CLAIM_LEASE_SECONDS)
+    for row in rows:
+        row.attempts += 1
+        row.next_attempt_at = lease_until
+
+    db.commit()
+    return rows
+
+
+def _mark_delivered_sources(db: Session, rows: List[NotificationOutbox]) -> None:
+    """Update the records that triggered delivered notifications."""
+    assignment_ids = [
+        row.source_id
+        for row in rows
+        if row.source_type == "diet_plan_assignment" and row.source_id
+    ]
+    if assignment_ids:
+        db.query(DietPlanAssignment).filter(
+            DietPlanAssignment.id.in_(assignment_ids)
+        ).update(
+            {
+                DietPlanAssignment.sent_via_whatsapp: True,
+                DietPlanAssignment.whatsapp_sent_at: datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+
+
+def record_delivery_results(
+    db: Session, results: Dict[int, Dict[str, Any]], rows: List[NotificationOutbox]
+) -> Dict[str, int]:
+    """
+    Store send results for claimed rows and commit.
+
+    Args:
+        db: Database session
+        results: Send result per outbox row id ({"success": ..., "error": ...},
+            plus "refused" when the tenant's batch was refused)
+        rows: Claimed outbox rows
+
+    Returns:
+        Counts of sent, retrying, failed and skipped rows
+    """
+    now = datetime.now(timezone.utc)
+    counts = {"sent": 0, "retrying": 0, "failed": 0, "skipped": 0}
+    delivered = []
+
+    for row in rows:
+        result = results.get(row.id) or {"success": False, "error": "Not sent"}
+
+        if result.get("success"):
+            row.status = NotificationStatus.SENT.value
+            row.sent_at = now
+            row.last_error = None
+            delivered.append(row)
+            counts["sent"] += 1
+            continue
+
+        row.last_error = str(result.get("error") or "Unknown error")[:1000]
+        if result.get("refused"):
+            # No WhatsApp access (disabled or not on the plan); retrying
+            # would be refused the same way
+            row.status = NotificationStatus.SKIPPED.value
+            counts["skipped"] += 1
+        elif row.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+            row.status = NotificationStatus.FAILED.value
+            counts["failed"] += 1
+            logger.error(
+                f"Notification {row.id} ({row.idempotency_key}) failed after "
+                f"{row.attempts} attempts: {row.last_error}"
+            )
+        else:
+            row.next_attempt_at = now + retry_delay(row.attempts)
+            counts["retrying"] += 1
+
+    _mark_delivered_sources(db, delivered)
+    db.commit()
+    return counts
@@ -0,0 +1,105 @@
+from sqlalchemy.orm import Session
+from dataclasses import dataclass, fields
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+import threading
+import time
+
+from app.core.config import settings
+from app.models.subscription_plans import SubscriptionPlan
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class PlanSnapshot:
+    """Read-only copy of a SubscriptionPlan row, safe to share across sessions."""
+
+    id: int
+    name: str
+    price_monthly: Decimal
+    max_members: int
+    max_staff: int
+    max_plans: int
+    max_diet_templates: int
+    whatsapp_enabled: bool
+    advanced_analytics: bool
+    description: Optional[str]
+    is_active: bool
+
+
+_SNAPSHOT_FIELDS = [f.name for f in fields(PlanSnapshot)]
+
+
+class PlanCatalog:
+    """
+    In-memory, versioned copy of the subscription_plans table.
+
+    The catalog changes a few times a year, so it is loaded once (at startup,
+    or on first use) and re-read every PLAN_CATALOG_TTL_SECONDS; the table
+    holds a handful of rows, so a reload costs one tiny query. version is
+    bumped whenever a reload finds different content. Call invalidate()
+    after changing plans to pick the change up immediately in this process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._plans: Tuple[PlanSnapshot, ...] = ()
+        self._by_id: Dict[int, PlanSnapshot] = {}
+        self._by_name: Dict[str, PlanSnapshot] = {}
+        self._loaded_at: Optional[float] = None
+        self.version = 0
+
+    def load(self, db: Session) -> None:
+        """(Re)load the catalog from the database."""
+        rows = db.query(SubscriptionPlan).order_by(SubscriptionPlan.id).all()
+        plans = tuple(
+            PlanSnapshot(**{name: getattr(row, name) for name in _SNAPSHOT_FIELDS})
+            for row in rows
+        )
+
+        with self._lock:
+            if plans != self._plans:
+                self._plans = plans
+                self._by_id = {plan.id: plan for plan in plans}
+                self._by_name = {plan.name: plan for plan in plans}
+                self.version += 1
+                logger.info(
+                    f"Loaded subscription plan catalog v{self.version} "
+                    f"({len(plans)} plans)"
+                )
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Force a reload on next access."""
+        with self._lock:
+            self._loaded_at = None
+
+    def _ensure_fresh(self, db: Session) -> None:
+        loaded_at = self._loaded_at
+        if (
+            loaded_at is None
+            or time.monotonic() - loaded_at > settings.PLAN_CATALOG_TTL_SECONDS
+        ):
+            self.load(db)
+
+    def get(self, db: Session, plan_id: int) -> Optional[PlanSnapshot]:
+        """Active plan by id."""
+        self._ensure_fresh(db)
+        plan = self._by_id.get(plan_id)
+        return plan if plan and plan.is_active else None
+
+    def by_name(self, db: Session, name: str) -> Optional[PlanSnapshot]:
+        """Plan by name (active or not)."""
+        self._ensure_fresh(db)
+        return self._by_name.get(name)
+
+    def active_plans(self, db: Session) -> List[PlanSnapshot]:
+        """Active plans, cheapest first."""
+        self._ensure_fresh(db)
+        return sorted(
+            (plan for plan in self._plans if plan.is_active),
+            key=lambda plan: plan.price_monthly,
+        )
+
+
+plan_catalog = PlanCatalog()
@@ -7,6 +7,9 @@ import json
 from app.models.membership_plan import MembershipPlan
 from app.models.member import Member
 from app.core.exceptions import UserAlreadyExistsException
+from app.models.tenant_resource_version import TenantResource
+from app.services.resource_version_service import bump_resource_version
+from app.services.usage_service import record_usage
 from loguru import logger
 
 
@@ -43,6 +46,8 @@ def create_plan(db: Session, plan_data, tenant_id: int) -> MembershipPlan:
     )
 
     db.add(db_plan)
+    record_usage(db, tenant_id, plans=1)
+    bump_resource_version(db, tenant_id, TenantResource.PLANS)
     db.commit()
     db.refresh(db_plan)
 
@@ -155,9 +160,14 @@ def update_plan(
     if "features" in update_data and update_data["features"] is not None:
         update_data["features"] = json.dumps(update_data["features"])
 
+    was_active = plan.is_active
     for field, value in update_data.items():
         setattr(plan, field, value)
 
+    if plan.is_active != was_active:
+        record_usage(db, tenant_id, plans=1 if plan.is_active else -1)
+    bump_resource_version(db, tenant_id, TenantResource.PLANS)
+
     db.commit()
     db.refresh(plan)
 
@@ -190,6 +200,9 @@ def delete_plan(db: Session, plan_id: int, tenant_id: int) -> bool:
             f"Cannot delete plan. {members_count} active members are using this plan."
         )
 
+    if plan.is_active:
+        record_usage(db, tenant_id, plans=-1)
+    bump_resource_version(db, tenant_id, TenantResource.PLANS)
     db.delete(plan)
     db.refresh(plan)
     db.commit()
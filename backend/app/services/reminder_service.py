@@ -0,0 +1,348 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.models.member import Member, MemberStatus
+from app.models.member_fee import MemberFee
+from app.models.scheduler_checkpoint import SchedulerCheckpoint
+from app.models.tenant import Tenant
+from app.services.notification_service import enqueue_notification
+from app.services.whatsapp_service import whatsapp_service
+from loguru import logger
+
+
+def _shard_filter(query, shard_index: int, shard_count: int):
+    """Restrict a members query to the tenants owned by this shard."""
+    if shard_count > 1:
+        query = query.filter(Member.tenant_id % shard_count == shard_index)
+    return query
+
+
+def _lock_checkpoint(
+    db: Session, job_name: str, run_date: date, shard_index: int, shard_count: int
+) -> SchedulerCheckpoint:
+    """Get (creating if needed) and row-lock the checkpoint for a job run."""
+    db.execute(
+        insert(SchedulerCheckpoint)
+        .values(
+            job_name=job_name,
+            run_date=run_date,
+            shard_index=shard_index,
+            shard_count=shard_count,
+            last_member_id=0,
+            processed_count=0,
+        )
+        .on_conflict_do_nothing(constraint="unique_scheduler_checkpoint")
+    )
+    return (
+        db.query(SchedulerCheckpoint)
+        .filter(
+            SchedulerCheckpoint.job_name == job_name,
+            SchedulerCheckpoint.run_date == run_date,
+            SchedulerCheckpoint.shard_index == shard_index,
+            SchedulerCheckpoint.shard_count == shard_count,
+        )
+        .with_for_update()
+        .one()
+    )
+
+
+def _run_checkpointed(
+    db: Session,
+    job_name: str,
+    run_date: date,
+    shard_index: int,
+    shard_count: int,
+    fetch_page: Callable[[int, int], List[Any]],
+    enqueue_page: Callable[[List[Any]], int],
+    page_size: Optional[int] = None,
+) -> int:
+    """
+    Walk members in id order, one checkpointed transaction per page.
+
+    Each page's notifications and the advanced checkpoint are committed
+    together, so a crashed run resumes after the last committed page. The
+    outbox idempotency keys make re-processing a page harmless as well.
+
+    Returns:
+        Number of notifications enqueued by this call
+    """
+    page_size = page_size or settings.SCHEDULER_PAGE_SIZE
+    enqueued = 0
+
+    while True:
+        checkpoint = _lock_checkpoint(db, job_name, run_date, shard_index, shard_count)
+        if checkpoint.completed_at:
+            db.commit()
+            return enqueued
+
+        rows = fetch_page(checkpoint.last_member_id, page_size)
+        if rows:
+            enqueued += enqueue_page(rows)
+            checkpoint.last_member_id = rows[-1].id
+            checkpoint.processed_count += len(rows)
+        if len(rows) < page_size:
+            checkpoint.completed_at = datetime.now(timezone.utc)
+
+        db.commit()
+
+        if len(rows) < page_size:
+            logger.info(
+                f"Scheduler job {job_name} for {run_date} (shard {shard_index}/{shard_count}) "
+                f"completed: {checkpoint.processed_count} members processed"
+            )
+            return enqueued
+
+
+def _tenant_access(db: Session) -> Callable[[int], bool]:
+    """
+    Memoised per-run check of whether a tenant can send WhatsApp messages.
+
+    Checked in a separate session: loading an entitlement may commit (to
+    write back a lapsed subscription), which in db would commit a partly
+    enqueued page and release the checkpoint lock.
+    """
+    allowed: Dict[int, bool] = {}
+
+    def check(tenant_id: int) -> bool:
+        if tenant_id not in allowed:
+            with Session(bind=db.get_bind()) as access_db:
+                error = whatsapp_service.access_error(access_db, tenant_id)
+            allowed[tenant_id] = error is None
+        return allowed[tenant_id]
+
+    return check
+
+
+def run_expiry_reminders(
+    db: Session,
+    run_date: date,
+    days_before_expiry: int,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    page_size: Optional[int] = None,
+) -> int:
+    """
+    Queue expiry reminders for every tenant's members expiring in N days.
+
+    One query per page across all tenants of the shard, served by
+    ix_members_status_expiry. Tenants without WhatsApp access are skipped.
+
+    Returns:
+        Number of reminders enqueued
+    """
+    target_date = run_date + timedelta(days=days_before_expiry)
+    has_access = _tenant_access(db)
+
+    def fetch_page(after_id: int, limit: int):
+        query = (
+            db.query(
+                Member.id,
+                Member.tenant_id,
+                Member.first_name,
+                Member.last_name,
+                Member.phone_number,
+                Member.membership_expiry_date,
+                Tenant.name.label("gym_name"),
+            )
+            .join(Tenant, Tenant.id == Member.tenant_id)
+            .filter(
+                Member.status == MemberStatus.ACTIVE,
+                Member.membership_expiry_date == target_date,
+                Member.is_active == True,
+                Member.id > after_id,
+            )
+        )
+        return (
+            _shard_filter(query, shard_index, shard_count)
+            .order_by(Member.id)
+            .limit(limit)
+            .all()
+        )
+
+    def enqueue_page(rows) -> int:
+        count = 0
+        for row in rows:
+            if not has_access(row.tenant_id):
+                continue
+            enqueue_notification(
+                db,
+                tenant_id=row.tenant_id,
+                phone_number=row.phone_number,
+                idempotency_key=(
+                    f"expiry_reminder:{row.id}:{row.membership_expiry_date.isoformat()}"
+                    f":{days_before_expiry}"
+                ),
+                message=whatsapp_service.render_expiry_reminder(
+                    member_name=f"{row.first_name} {row.last_name}",
+                    expiry_date=row.membership_expiry_date,
+                    days_remaining=days_before_expiry,
+                    gym_name=row.gym_name,
+                ),
+                source_type="member",
+                source_id=row.id,
+            )
+            count += 1
+        return count
+
+    return _run_checkpointed(
+        db,
+        f"expiry_reminder:{days_before_expiry}",
+        run_date,
+        shard_index,
+        shard_count,
+        fetch_page,
+        enqueue_page,
+        page_size,
+    )
+
+
+def run_due_reminders(
+    db: Session,
+    run_date: date,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    page_size: Optional[int] = None,
+) -> int:
+    """
+    Queue outstanding-dues reminders for every tenant of the shard.
+
+    Each reminder quotes the member's latest payment; members without a
+    recorded payment are skipped. At most one reminder per member per month.
+
+    Returns:
+        Number of reminders enqueued
+    """
+    has_access = _tenant_access(db)
+
+    def fetch_page(after_id: int, limit: int):
+        query = (
+            db.query(
+                Member.id,
+                Member.tenant_id,
+                Member.first_name,
+                Member.last_name,
+                Member.phone_number,
+                Member.outstanding_dues,
+                Tenant.name.label("gym_name"),
+            )
+            .join(Tenant, Tenant.id == Member.tenant_id)
+            .filter(
+                Member.outstanding_dues > 0,
+                Member.is_active == True,
+                Member.id > after_id,
+            )
+        )
+        return (
+            _shard_filter(query, shard_index, shard_count)
+            .order_by(Member.id)
+            .limit(limit)
+            .all()
+        )
+
+    def enqueue_page(rows) -> int:
+        member_ids = [row.id for row in rows if has_access(row.tenant_id)]
+        if not member_ids:
+            return 0
+
+        latest_fee_ids = (
+            db.query(func.max(MemberFee.id))
+            .filter(MemberFee.member_id.in_(member_ids))
+            .group_by(MemberFee.member_id)
+        )
+        latest_fees = {
+            fee.member_id: fee
+            for fee in db.query(MemberFee).filter(MemberFee.id.in_(latest_fee_ids))
+        }
+
+        count = 0
+        for row in rows:
+            fee = latest_fees.get(row.id)
+            if not fee:
+                continue
+            enqueue_notification(
+                db,
+                tenant_id=row.tenant_id,
+                phone_number=row.phone_number,
+                idempotency_key=f"due_reminder:{row.id}:{run_date:%Y-%m}",
+                message=whatsapp_service.render_due_reminder(
+                    member_name=f"{row.first_name} {row.last_name}",
+                    original_amount=float(fee.original_amount),
+                    amount_paid=float(fee.amount_paid),
+                    outstanding_dues=float(row.outstanding_dues),
+                    payment_date=fee.payment_date,
+                    gym_name=row.gym_name,
+                ),
+                source_type="member",
+                source_id=row.id,
+            )
+            count += 1
+        return count
+
+    return _run_checkpointed(
+        db,
+        "due_reminder",
+        run_date,
+        shard_index,
+        shard_count,
+        fetch_page,
+        enqueue_page,
+        page_size,
+    )
+
+
+def run_member_reconciliation(db: Session, run_date: date) -> int:
+    """Reconcile stored member statuses once per day (checkpointed)."""
+    from app.services.member_service import reconcile_member_statuses
+
+    checkpoint = _lock_checkpoint(db, "reconcile_members", run_date, 0, 1)
+    if checkpoint.completed_at:
+        db.commit()
+        return 0
+    db.commit()
+
+    # Commits per tenant; safe to repeat if interrupted
+    updated = reconcile_member_statuses(db)
+
+    checkpoint = _lock_checkpoint(db, "reconcile_members", run_date, 0, 1)
+    checkpoint.processed_count = updated
+    checkpoint.completed_at = datetime.now(timezone.utc)
+    db.commit()
+    return updated
+
+
+def run_daily_jobs(
+    db: Session,
+    run_date: Optional[date] = None,
+    shard_index: int = 0,
+    shard_count: int = 1,
+) -> Dict[str, int]:
+    """
+    Run today's scheduled jobs for one shard; completed jobs are no-ops.
+
+    Shard 0 also reconciles member statuses first, so reminders see
+    up-to-date stored statuses.
+
+    Returns:
+        Counts per job
+    """
+    run_date = run_date or date.today()
+    results: Dict[str, int] = {}
+
+    if shard_index == 0:
+        results["reconcile_members"] = run_member_reconciliation(db, run_date)
+
+    for days in settings.EXPIRY_REMINDER_DAYS:
+        results[f"expiry_reminder:{days}"] = run_expiry_reminders(
+            db, run_date, days, shard_index, shard_count
+        )
+
+    if run_date.day == settings.DUE_REMINDER_DAY_OF_MONTH:
+        results["due_reminder"] = run_due_reminders(
+            db, run_date, shard_index, shard_count
+        )
+
+    return results
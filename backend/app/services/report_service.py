@@ -1,13 +1,13 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract, and_, case, desc
-from datetime import date, timedelta
-from typing import List, Tuple, Dict
+from sqlalchemy import func, extract, and_, or_, case, desc
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple, Dict
 from decimal import Decimal
 
-from app.models.member_fee import MemberFee
-from app.models.expenses import Expense
 from app.models.member import Member, MemberStatus
+from app.models.member_fee import MemberFee
 from app.models.membership_plan import MembershipPlan
+from app.models.tenant_daily_ledger import TenantDailyLedger, LedgerSource
 from app.schemas.reports import (
     FinancialSummary,
     ChartPoint,
@@ -16,8 +16,69 @@ from app.schemas.reports import (
     DuesReportItem,
     FinancialReportResponse,
     MemberReportResponse,
+    TrendGranularity,
 )
 
+# Longest trend series a date range may produce (a year of days)
+MAX_TREND_BUCKETS = 366
+
+
+def _paid_fee_bucket():
+    """Ledger filter for paid member fees (what reports count as revenue)."""
+    return and_(
+        TenantDailyLedger.source == LedgerSource.FEE.value,
+        TenantDailyLedger.payment_status == "paid",
+    )
+
+
+def _as_date(value) -> date:
+    """date_trunc returns a timestamp; normalise bucket keys to dates."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _bucket_starts(
+    end_date: date, periods: int, granularity: TrendGranularity
+) -> List[date]:
+    """Start dates of the last `periods` buckets ending with end_date's bucket."""
+    if granularity == TrendGranularity.DAY:
+        return [end_date - timedelta(days=i) for i in range(periods - 1, -1, -1)]
+
+    if granularity == TrendGranularity.WEEK:
+        # date_trunc('week') truncates to Monday
+        current = end_date - timedelta(days=end_date.weekday())
+        return [current - timedelta(weeks=i) for i in range(periods - 1, -1, -1)]
+
+    current = end_date.replace(day=1)
+    starts = [current]
+    for _ in range(periods - 1):
+        current = (current - timedelta(days=1)).replace(day=1)
+        starts.append(current)
+    return starts[::-1]
+
+
+def _bucket_range(
+    start_date: date, end_date: date, granularity: TrendGranularity
+) -> List[date]:
+    """Start dates of every bucket from start_date's bucket to end_date's."""
+    last = _bucket_starts(end_date, 1, granularity)[0]
+    current = _bucket_starts(start_date, 1, granularity)[0]
+    starts = []
+    while current <= last:
+        starts.append(current)
+        if granularity == TrendGranularity.DAY:
+            current += timedelta(days=1)
+        elif granularity == TrendGranularity.WEEK:
+            current += timedelta(weeks=1)
+        else:
+            current = (current + timedelta(days=32)).replace(day=1)
+    return starts
+
+
+def _bucket_label(bucket: date, granularity: TrendGranularity) -> str:
+    if granularity == TrendGranularity.MONTH:
+        return bucket.strftime("%b %Y")  # e.g. "Jan 2024"
+    return bucket.strftime("%d %b %Y")  # day, or first day of the week
+
 
 class ReportService:
     """Service for Advanced Analytics & Reporting"""
@@ -28,23 +89,34 @@ class ReportService:
         """
         Calculate generic financial stats for a given period.
         """
-        # Total Revenue (Sum of MemberFees paid)
-        revenue_q = db.query(func.sum(MemberFee.amount_paid)).filter(
-            MemberFee.tenant_id == tenant_id,
-            MemberFee.payment_date >= start_date,
-            MemberFee.payment_date <= end_date,
-            MemberFee.payment_status == "paid",  # Assume "paid" string based on model
-        )
-        total_revenue = revenue_q.scalar() or Decimal(0)
-
-        # Total Expenses
-        expense_q = db.query(func.sum(Expense.amount)).filter(
-            Expense.tenant_id == tenant_id,
-            Expense.expense_date >= start_date,
-            Expense.expense_date <= end_date,
-            Expense.is_deleted == False,
+        # Revenue (paid fees) and expenses from the daily ledger in one pass
+        totals = (
+            db.query(
+                func.sum(
+                    case(
+                        (_paid_fee_bucket(), TenantDailyLedger.total_amount),
+                        else_=0,
+                    )
+                ).label("revenue"),
+                func.sum(
+                    case(
+                        (
+                            TenantDailyLedger.source == LedgerSource.EXPENSE.value,
+                            TenantDailyLedger.total_amount,
+                        ),
+                        else_=0,
+                    )
+                ).label("expenses"),
+            )
+            .filter(
+                TenantDailyLedger.tenant_id == tenant_id,
+                TenantDailyLedger.ledger_date >= start_date,
+                TenantDailyLedger.ledger_date <= end_date,
+            )
+            .one()
         )
-        total_expenses = expense_q.scalar() or Decimal(0)
+        total_revenue = totals.revenue or Decimal(0)
+        total_expenses = totals.expenses or Decimal(0)
 
         # Net Profit
         net_profit = total_revenue - total_expenses
@@ -77,47 +149,87 @@ class ReportService:
         """
         Get last N months revenue vs expense line chart data.
         """
-        end_date = date.today()
-        start_date = (end_date.replace(day=1) - timedelta(days=1)).replace(day=1)
-        # Adjust start date to N months ago roughly
-        # Better approach: Iterate backwards N times
-
-        revenue_points = []
-        expense_points = []
-
-        # Iterate last 6 months
-        curr = end_date
-        for _ in range(months):
-            # Define month range
-            m_end = curr
-            m_start = curr.replace(day=1)
-            label = m_start.strftime("%b %Y")  # e.g. "Jan 2024"
-
-            # Query Month Revenue
-            m_rev = db.query(func.sum(MemberFee.amount_paid)).filter(
-                MemberFee.tenant_id == tenant_id,
-                MemberFee.payment_date >= m_start,
-                MemberFee.payment_date <= m_end,
-                MemberFee.payment_status == "paid",
-            ).scalar() or Decimal(0)
+        return self.get_trends(
+            db, tenant_id, periods=months, granularity=TrendGranularity.MONTH
+        )
 
-            revenue_points.append(ChartPoint(label=label, value=m_rev))
+    def get_trends(
+        self,
+        db: Session,
+        tenant_id: int,
+        periods: int = 6,
+        granularity: TrendGranularity = TrendGranularity.MONTH,
+        end_date: Optional[date] = None,
+        start_date: Optional[date] = None,
+    ) -> Tuple[List[ChartPoint], List[ChartPoint]]:
+        """
+        Get revenue vs expense series for the last N buckets ending at end_date.
 
-            # Query Month Expenses
-            m_exp = db.query(func.sum(Expense.amount)).filter(
-                Expense.tenant_id == tenant_id,
-                Expense.expense_date >= m_start,
-                Expense.expense_date <= m_end,
-                Expense.is_deleted == False,
-            ).scalar() or Decimal(0)
+        With a start_date the series instead covers every bucket from
+        start_date to end_date, counting only ledger days inside the range
+        (periods is ignored). Both series come from one grouped query over
+        the daily ledger (date_trunc on the bucket size); empty buckets are
+        zero-filled.
+        """
+        end_date = end_date or date.today()
+        if start_date is not None:
+            if start_date > end_date:
+                raise ValueError("start_date must be on or before end_date")
+            buckets = _bucket_range(start_date, end_date, granularity)
+            if len(buckets) > MAX_TREND_BUCKETS:
+                raise ValueError(
+                    f"Date range spans {len(buckets)} {granularity.value} buckets; "
+                    f"use a coarser granularity (max {MAX_TREND_BUCKETS})"
+                )
+        else:
+            buckets = _bucket_starts(end_date, periods, granularity)
+            start_date = buckets[0]
+        unit = granularity.value
+
+        bucket = func.date_trunc(unit, TenantDailyLedger.ledger_date).label("bucket")
+        rows = (
+            db.query(
+                bucket,
+                TenantDailyLedger.source,
+                func.sum(TenantDailyLedger.total_amount),
+            )
+            .filter(
+                TenantDailyLedger.tenant_id == tenant_id,
+                TenantDailyLedger.ledger_date >= start_date,
+                TenantDailyLedger.ledger_date <= end_date,
+                or_(
+                    _paid_fee_bucket(),
+                    TenantDailyLedger.source == LedgerSource.EXPENSE.value,
+                ),
+            )
+            .group_by(bucket, TenantDailyLedger.source)
+            .all()
+        )
 
-            expense_points.append(ChartPoint(label=label, value=m_exp))
+        revenue_by_bucket = {}
+        expense_by_bucket = {}
+        for b, source, amt in rows:
+            if source == LedgerSource.FEE.value:
+                revenue_by_bucket[_as_date(b)] = amt
+            else:
+                expense_by_bucket[_as_date(b)] = amt
 
-            # Move to previous month
-            curr = m_start - timedelta(days=1)
+        revenue_points = []
+        expense_points = []
+        for bucket in buckets:
+            label = _bucket_label(bucket, granularity)
+            revenue_points.append(
+                ChartPoint(
+                    label=label, value=revenue_by_bucket.get(bucket) or Decimal(0)
+                )
+            )
+            expense_points.append(
+                ChartPoint(
+                    label=label, value=expense_by_bucket.get(bucket) or Decimal(0)
+                )
+            )
 
-        # Reverse to show chronological order
-        return revenue_points[::-1], expense_points[::-1]
+        return revenue_points, expense_points
 
     def get_category_breakdown(
         self, db: Session, tenant_id: int
@@ -127,9 +239,14 @@ class ReportService:
         """
         # Aggregation
         results = (
-            db.query(Expense.category, func.sum(Expense.amount))
-            .filter(Expense.tenant_id == tenant_id, Expense.is_deleted == False)
-            .group_by(Expense.category)
+            db.query(
+                TenantDailyLedger.category, func.sum(TenantDailyLedger.total_amount)
+            )
+            .filter(
+                TenantDailyLedger.tenant_id == tenant_id,
+                TenantDailyLedger.source == LedgerSource.EXPENSE.value,
+            )
+            .group_by(TenantDailyLedger.category)
             .all()
         )
 
@@ -141,7 +258,7 @@ class ReportService:
                 continue
             items.append(
                 BreakdownItem(
-                    label=cat.value.title(),
+                    label=cat.title(),
                     value=amt,
                     percentage=round((float(amt) / float(total_expenses)) * 100, 1),
                 )
@@ -156,11 +273,12 @@ class ReportService:
         Breakdown of revenue by payment method.
         """
         results = (
-            db.query(MemberFee.payment_method, func.sum(MemberFee.amount_paid))
-            .filter(
-                MemberFee.tenant_id == tenant_id, MemberFee.payment_status == "paid"
+            db.query(
+                TenantDailyLedger.payment_method,
+                func.sum(TenantDailyLedger.total_amount),
             )
-            .group_by(MemberFee.payment_method)
+            .filter(TenantDailyLedger.tenant_id == tenant_id, _paid_fee_bucket())
+            .group_by(TenantDailyLedger.payment_method)
             .all()
         )
 
@@ -281,43 +399,73 @@ class ReportService:
 
         return sorted(items, key=lambda x: x.count or 0, reverse=True)
 
-    def get_outstanding_dues(self, db: Session, tenant_id: int) -> List[DuesReportItem]:
+    def outstanding_dues_query(self, db: Session, tenant_id: int):
         """
-        List of members who owe money.
+        Members who owe money, with their plan and last payment, as one query.
+
+        The plan is outer-joined and the last paid fee date comes from a
+        grouped subquery (served by ix_fees_tenant_status_date), so the cost
+        does not grow with the number of debtors. Shared with the export.
         """
-        members = (
-            db.query(Member)
+        last_payment = (
+            db.query(
+                MemberFee.member_id,
+                func.max(MemberFee.payment_date).label("last_payment_date"),
+            )
+            .filter(
+                MemberFee.tenant_id == tenant_id,
+                MemberFee.payment_status == "paid",
+            )
+            .group_by(MemberFee.member_id)
+            .subquery()
+        )
+
+        return (
+            db.query(
+                Member.id,
+                Member.first_name,
+                Member.last_name,
+                Member.phone_number,
+                Member.status,
+                Member.membership_expiry_date,
+                Member.outstanding_dues,
+                MembershipPlan.name.label("plan_name"),
+                last_payment.c.last_payment_date,
+            )
+            .outerjoin(MembershipPlan, MembershipPlan.id == Member.plan_id)
+            .outerjoin(last_payment, last_payment.c.member_id == Member.id)
             .filter(
                 Member.tenant_id == tenant_id,
                 Member.outstanding_dues > 0,
                 Member.is_active == True,
             )
-            .order_by(desc(Member.outstanding_dues))
-            .all()
+            .order_by(desc(Member.outstanding_dues), Member.id)
         )
 
-        report = []
+    def days_overdue(self, row, today: date) -> int:
+        """Days since expiry if the member has expired, else 0."""
+        if row.status == MemberStatus.EXPIRED and row.membership_expiry_date < today:
+            return (today - row.membership_expiry_date).days
+        return 0
+
+    def get_outstanding_dues(self, db: Session, tenant_id: int) -> List[DuesReportItem]:
+        """
+        List of members who owe money, with their plan and last payment.
+        """
         today = date.today()
 
-        for m in members:
-            # Calc days overdue (if expired)
-            days = 0
-            if m.status == MemberStatus.EXPIRED and m.membership_expiry_date < today:
-                days = (today - m.membership_expiry_date).days
-
-            report.append(
-                DuesReportItem(
-                    member_id=m.id,
-                    member_name=f"{m.first_name} {m.last_name}",
-                    phone_number=m.phone_number,
-                    plan_name=m.plan.name if m.plan else None,
-                    amount_due=m.outstanding_dues,
-                    last_payment_date=None,  # Optimization: skip querying last payment for now or add separate join
-                    days_overdue=days,
-                )
+        return [
+            DuesReportItem(
+                member_id=m.id,
+                member_name=f"{m.first_name} {m.last_name}",
+                phone_number=m.phone_number,
+                plan_name=m.plan_name,
+                amount_due=m.outstanding_dues,
+                last_payment_date=m.last_payment_date,
+                days_overdue=self.days_overdue(m, today),
             )
-
-        return report
+            for m in self.outstanding_dues_query(db, tenant_id)
+        ]
 
 
 report_service = ReportService()
@@ -0,0 +1,55 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from typing import Dict, Iterable, Tuple
+from datetime import datetime
+
+from app.models.tenant_resource_version import TenantResource, TenantResourceVersion
+
+
+def bump_resource_version(
+    db: Session, tenant_id: int, resource: TenantResource
+) -> None:
+    """
+    Record a write to a tenant resource.
+
+    Runs as an upsert inside the caller's transaction; the caller commits,
+    so readers only see the new version together with the new data.
+    """
+    stmt = insert(TenantResourceVersion).values(
+        tenant_id=tenant_id, resource=resource.value, version=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            TenantResourceVersion.tenant_id,
+            TenantResourceVersion.resource,
+        ],
+        set_={
+            "version": TenantResourceVersion.version + 1,
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+
+
+def get_resource_versions(
+    db: Session, tenant_id: int, resources: Iterable[TenantResource]
+) -> Dict[TenantResource, Tuple[int, datetime]]:
+    """
+    Current (version, updated_at) of tenant resources, in one query.
+
+    Resources never written since versioning started are left out.
+    """
+    resources = list(resources)
+    rows = db.query(
+        TenantResourceVersion.resource,
+        TenantResourceVersion.version,
+        TenantResourceVersion.updated_at,
+    ).filter(
+        TenantResourceVersion.tenant_id == tenant_id,
+        TenantResourceVersion.resource.in_([r.value for r in resources]),
+    )
+    return {
+        TenantResource(resource): (version, updated_at)
+        for resource, version, updated_at in rows
+    }
@@ -1,16 +1,25 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_
+from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from decimal import Decimal
+import hashlib
+import json
+import threading
 
-from app.models.subscription_plans import SubscriptionPlan
 from app.models.tenant_subscription import TenantSubscription, SubscriptionStatus
 from app.models.subscription_payment import SubscriptionPayment, PaymentStatus
 from app.models.tenant import Tenant
-from app.models.member import Member
-from app.models.users import User
-from app.models.membership_plan import MembershipPlan
+from app.models.subscription_plans import SubscriptionPlan
+from app.models.tenant_usage import TenantUsage
+from app.services.entitlement_service import (
+    TenantEntitlement,
+    get_tenant_entitlement,
+    invalidate_entitlement,
+)
+from app.services.plan_catalog import PlanSnapshot, plan_catalog
+from app.services.usage_service import get_usage
 from loguru import logger
 
 
@@ -54,6 +63,7 @@ def start_trial(db: Session, tenant_id: int) -> TenantSubscription:
     db.add(subscription)
     db.commit()
     db.refresh(subscription)
+    invalidate_entitlement(tenant_id)
 
     logger.info(f"✅ Started 7-day trial for tenant {tenant_id} (expires: {trial_end})")
     return subscription
@@ -108,6 +118,7 @@ def expire_trial(db: Session, tenant_id: int) -> bool:
 
     subscription.status = SubscriptionStatus.EXPIRED
     db.commit()
+    invalidate_entitlement(tenant_id)
 
     logger.info(f"Trial expired for tenant {tenant_id}")
     return True
@@ -129,25 +140,14 @@ def get_current_subscription(
     )
 
 
-def get_subscription_plan(db: Session, plan_id: int) -> Optional[SubscriptionPlan]:
-    """Get subscription plan by ID"""
-    return (
-        db.query(SubscriptionPlan)
-        .filter(
-            and_(SubscriptionPlan.id == plan_id, SubscriptionPlan.is_active == True)
-        )
-        .first()
-    )
+def get_subscription_plan(db: Session, plan_id: int) -> Optional[PlanSnapshot]:
+    """Get active subscription plan by ID (from the in-memory catalog)"""
+    return plan_catalog.get(db, plan_id)
 
 
-def get_all_plans(db: Session) -> list[SubscriptionPlan]:
-    """Get all active subscription plans"""
-    return (
-        db.query(SubscriptionPlan)
-        .filter(SubscriptionPlan.is_active == True)
-        .order_by(SubscriptionPlan.price_monthly)
-        .all()
-    )
+def get_all_plans(db: Session) -> list[PlanSnapshot]:
+    """Get all active subscription plans (from the in-memory catalog)"""
+    return plan_catalog.active_plans(db)
 
 
 def activate_subscription(
@@ -184,6 +184,7 @@ def activate_subscription(
 
     db.commit()
     db.refresh(subscription)
+    invalidate_entitlement(tenant_id)
 
     logger.info(
         f"✅ Activated {plan.name} subscription for tenant {tenant_id} (expires: {subscription.subscription_end_date})"
@@ -203,6 +204,7 @@ def cancel_subscription(db: Session, tenant_id: int) -> bool:
 
     subscription.auto_renew = False
     db.commit()
+    invalidate_entitlement(tenant_id)
 
     logger.info(f"Cancelled auto-renewal for tenant {tenant_id}")
     return True
@@ -217,38 +219,19 @@ def get_current_limits(db: Session, tenant_id: int) -> dict:
     """
     Get current usage counts for tenant.
 
+    Read from the tenant_usage counters (one row), not counted per call.
+
     Returns:
         Dict with member_count, staff_count, plan_count
     """
-    member_count = (
-        db.query(func.count(Member.id))
-        .filter(and_(Member.tenant_id == tenant_id, Member.is_active == True))
-        .scalar()
-        or 0
-    )
+    return get_usage(db, tenant_id)
 
-    staff_count = (
-        db.query(func.count(User.id))
-        .filter(and_(User.tenant_id == tenant_id, User.is_active == True))
-        .scalar()
-        or 0
-    )
-
-    plan_count = (
-        db.query(func.count(MembershipPlan.id))
-        .filter(
-            and_(
-                MembershipPlan.tenant_id == tenant_id, MembershipPlan.is_active == True
-            )
-        )
-        .scalar()
-        or 0
-    )
 
+def _limits(plan) -> dict:
     return {
-        "member_count": member_count,
-        "staff_count": staff_count,
-        "plan_count": plan_count,
+        "max_members": plan.max_members,
+        "max_staff": plan.max_staff,
+        "max_plans": plan.max_plans,
     }
 
 
@@ -259,49 +242,33 @@ def get_plan_limits(db: Session, tenant_id: int) -> dict:
     During trial: Pro plan limits (unlimited members, 5 staff, unlimited plans)
     After subscription: Based on subscribed plan
 
+    Subscription state comes from the cached entitlement and plans from the
+    plan catalog, so this normally runs no query.
+
     Returns:
         Dict with max_members, max_staff, max_plans (-1 means unlimited)
     """
-    subscription = get_current_subscription(db, tenant_id)
+    return _plan_limits(db, get_tenant_entitlement(db, tenant_id))
 
-    if not subscription:
-        # No subscription record - return Trial limits (Pro plan features)
-        pro_plan = (
-            db.query(SubscriptionPlan).filter(SubscriptionPlan.name == "Pro").first()
-        )
-
-        if pro_plan:
-            return {
-                "max_members": pro_plan.max_members,
-                "max_staff": pro_plan.max_staff,
-                "max_plans": pro_plan.max_plans,
-            }
-
-        # Fallback if Pro plan doesn't exist
-        return {"max_members": -1, "max_staff": 5, "max_plans": -1}
-
-    # During trial: Pro plan limits
-    if subscription.status == SubscriptionStatus.TRIAL:
-        pro_plan = (
-            db.query(SubscriptionPlan).filter(SubscriptionPlan.name == "Pro").first()
-        )
 
+def _plan_limits(db: Session, entitlement: TenantEntitlement) -> dict:
+    # No subscription record or trial: Trial limits (Pro plan features)
+    if (
+        not entitlement.has_subscription
+        or entitlement.status == SubscriptionStatus.TRIAL
+    ):
+        pro_plan = plan_catalog.by_name(db, "Pro")
         if pro_plan:
-            return {
-                "max_members": pro_plan.max_members,
-                "max_staff": pro_plan.max_staff,
-                "max_plans": pro_plan.max_plans,
-            }
+            return _limits(pro_plan)
+        if not entitlement.has_subscription:
+            # Fallback if Pro plan doesn't exist
+            return {"max_members": -1, "max_staff": 5, "max_plans": -1}
 
     # Active subscription: Use plan limits
-    if subscription.plan_id and subscription.status == SubscriptionStatus.ACTIVE:
-        plan = get_subscription_plan(db, subscription.plan_id)
+    if entitlement.plan_id and entitlement.status == SubscriptionStatus.ACTIVE:
+        plan = get_subscription_plan(db, entitlement.plan_id)
         if plan:
-            return {
-                "max_members": plan.max_members,
-                "max_staff": plan.max_staff,
-                "max_plans": plan.max_plans,
-            }
+            return _limits(plan)
 
     # Expired/suspended: Return 0 limits
     return {"max_members": 0, "max_staff": 0, "max_plans": 0}
@@ -394,28 +361,7 @@ def check_feature_access(db: Session, tenant_id: int, feature: str) -> bool:
     Returns:
         True if feature is available, False otherwise
     """
-    subscription = get_current_subscription(db, tenant_id)
-
-    if not subscription:
-        return False
-
-    # During trial: WhatsApp is disabled, analytics available
-    if subscription.status == SubscriptionStatus.TRIAL:
-        if feature == "whatsapp":
-            return False  # WhatsApp disabled during trial
-        if feature == "advanced_analytics":
-            return True  # Analytics available during trial (Pro features)
-
-    # Active subscription: Check plan features
-    if subscription.plan_id and subscription.status == SubscriptionStatus.ACTIVE:
-        plan = get_subscription_plan(db, subscription.plan_id)
-        if plan:
-            if feature == "whatsapp":
-                return plan.whatsapp_enabled
-            if feature == "advanced_analytics":
-                return plan.advanced_analytics
-
-    return False
+    return get_tenant_entitlement(db, tenant_id).has_feature(feature)
 
 
 # ============================================================================
@@ -430,35 +376,7 @@ def is_subscription_active(db: Session, tenant_id: int) -> bool:
     Returns:
         True if active, False if expired/suspended
     """
-    subscription = get_current_subscription(db, tenant_id)
-
-    if not subscription:
-        return False
-
-    # Trial active?
-    if subscription.status == SubscriptionStatus.TRIAL:
-        if subscription.trial_end_date and date.today() <= subscription.trial_end_date:
-            return True
-        else:
-            # Trial expired, update status
-            expire_trial(db, tenant_id)
-            return False
-
-    # Subscription active?
-    if subscription.status == SubscriptionStatus.ACTIVE:
-        if (
-            subscription.subscription_end_date
-            and date.today() <= subscription.subscription_end_date
-        ):
-            return True
-        else:
-            # Subscription expired
-            subscription.status = SubscriptionStatus.EXPIRED
-            db.commit()
-            logger.info(f"Subscription expired for tenant {tenant_id}")
-            return False
-
-    return False
+    return get_tenant_entitlement(db, tenant_id).is_active
 
 
 def should_block_access(db: Session, tenant_id: int) -> Tuple[bool, str]:
@@ -468,42 +386,76 @@ def should_block_access(db: Session, tenant_id: int) -> Tuple[bool, str]:
     Returns:
         Tuple of (should_block, reason)
     """
-    subscription = get_current_subscription(db, tenant_id)
-
-    if not subscription:
-        return (True, "No subscription found")
+    return get_tenant_entitlement(db, tenant_id).block_reason()
 
-    # Check if active
-    if is_subscription_active(db, tenant_id):
-        return (False, "")
 
-    # Subscription is not active
-    if subscription.status == SubscriptionStatus.EXPIRED:
-        return (True, "Subscription expired. Please renew to continue.")
-
-    if subscription.status == SubscriptionStatus.SUSPENDED:
-        return (True, "Account suspended. Please contact support.")
-
-    if subscription.status == SubscriptionStatus.CANCELLED:
-        return (True, "Subscription cancelled. Please reactivate to continue.")
+def _load_status_row(db: Session, tenant_id: int):
+    """
+    Subscription, active plan and usage counters for a tenant in one query.
 
-    return (True, "Subscription inactive")
+    The tenant CTE anchors the row so a tenant without a subscription (or
+    without a usage row yet) still comes back, with NULLs for the rest.
+    """
+    tenant = (
+        db.query(Tenant.id.label("tenant_id"))
+        .filter(Tenant.id == tenant_id)
+        .cte("status_tenant")
+    )
+    return (
+        db.query(
+            TenantSubscription.id.label("subscription_id"),
+            TenantSubscription.status,
+            TenantSubscription.trial_end_date,
+            TenantSubscription.subscription_end_date,
+            TenantSubscription.auto_renew,
+            SubscriptionPlan.id.label("plan_id"),
+            SubscriptionPlan.name.label("plan_name"),
+            SubscriptionPlan.price_monthly,
+            TenantUsage.member_count,
+            TenantUsage.staff_count,
+            TenantUsage.plan_count,
+        )
+        .select_from(tenant)
+        .outerjoin(
+            TenantSubscription, TenantSubscription.tenant_id == tenant.c.tenant_id
+        )
+        .outerjoin(
+            SubscriptionPlan,
+            and_(
+                SubscriptionPlan.id == TenantSubscription.plan_id,
+                SubscriptionPlan.is_active == True,
+            ),
+        )
+        .outerjoin(TenantUsage, TenantUsage.tenant_id == tenant.c.tenant_id)
+        .first()
+    )
 
 
-def get_subscription_status_detail(db: Session, tenant_id: int) -> dict:
+def build_subscription_status(
+    db: Session, tenant_id: int, entitlement: TenantEntitlement
+) -> dict:
     """
-    Get detailed subscription status with all information.
+    Build the detailed subscription status from a single query.
 
-    Returns comprehensive status dict for frontend display.
+    Status, activity and features come from the entitlement (which has
+    already written back a lapsed trial/subscription), limits from the plan
+    catalog.
     """
-    subscription = get_current_subscription(db, tenant_id)
+    row = _load_status_row(db, tenant_id)
+
+    if row is not None and row.member_count is not None:
+        current_usage = {
+            "member_count": row.member_count,
+            "staff_count": row.staff_count,
+            "plan_count": row.plan_count,
+        }
+    else:
+        current_usage = get_usage(db, tenant_id)
 
     # If no subscription exists, return Trial defaults
-    if not subscription:
+    if row is None or row.subscription_id is None:
         # Get Pro plan limits for Trial users
-        pro_plan = (
-            db.query(SubscriptionPlan).filter(SubscriptionPlan.name == "Pro").first()
-        )
+        pro_plan = plan_catalog.by_name(db, "Pro")
 
         trial_limits = {
             "max_members": pro_plan.max_members if pro_plan else -1,
@@ -511,8 +463,6 @@ def get_subscription_status_detail(db: Session, tenant_id: int) -> dict:
             "max_plans": pro_plan.max_plans if pro_plan else -1,
         }
 
-        current_usage = get_current_limits(db, tenant_id)
-
         return {
             "has_subscription": False,
             "is_active": True,  # Trial is considered active
@@ -528,48 +478,104 @@ def get_subscription_status_detail(db: Session, tenant_id: int) -> dict:
             },
         }
 
-    is_active = is_subscription_active(db, tenant_id)
-    current_limits = get_current_limits(db, tenant_id)
-    plan_limits = get_plan_limits(db, tenant_id)
+    subscription_status = entitlement.status or row.status
 
     # Calculate days remaining
     days_remaining = None
-    if subscription.status == SubscriptionStatus.TRIAL and subscription.trial_end_date:
-        days_remaining = (subscription.trial_end_date - date.today()).days
+    if subscription_status == SubscriptionStatus.TRIAL and row.trial_end_date:
+        days_remaining = (row.trial_end_date - date.today()).days
     elif (
-        subscription.status == SubscriptionStatus.ACTIVE
-        and subscription.subscription_end_date
+        subscription_status == SubscriptionStatus.ACTIVE
+        and row.subscription_end_date
     ):
-        days_remaining = (subscription.subscription_end_date - date.today()).days
+        days_remaining = (row.subscription_end_date - date.today()).days
 
     # Get plan details
     plan_details = None
     plan_name = "Trial"
-    if subscription.plan_id:
-        plan = get_subscription_plan(db, subscription.plan_id)
-        if plan:
-            plan_name = plan.name
-            plan_details = {
-                "id": plan.id,
-                "name": plan.name,
-                "price": float(plan.price_monthly),
-            }
+    if row.plan_id:
+        plan_name = row.plan_name
+        plan_details = {
+            "id": row.plan_id,
+            "name": row.plan_name,
+            "price": float(row.price_monthly),
+        }
 
     return {
         "has_subscription": True,
-        "is_active": is_active,
-        "status": subscription.status.value,
-        "is_trial": subscription.status == SubscriptionStatus.TRIAL,
+        "is_active": entitlement.is_active,
+        "status": subscription_status.value,
+        "is_trial": subscription_status == SubscriptionStatus.TRIAL,
         "days_remaining": days_remaining,
         "plan_name": plan_name,
         "plan": plan_details,
-        "current_usage": current_limits,
-        "plan_limits": plan_limits,
+        "current_usage": current_usage,
+        "plan_limits": _plan_limits(db, entitlement),
         "features": {
-            "whatsapp_enabled": check_feature_access(db, tenant_id, "whatsapp"),
-            "analytics_enabled": check_feature_access(
-                db, tenant_id, "advanced_analytics"
-            ),
+            "whatsapp_enabled": entitlement.has_feature("whatsapp"),
+            "analytics_enabled": entitlement.has_feature("advanced_analytics"),
         },
-        "auto_renew": subscription.auto_renew,
+        "auto_renew": row.auto_renew,
     }
+
+
+@dataclass(frozen=True)
+class SubscriptionStatusSnapshot:
+    """A built status response with its ETag."""
+
+    etag: str
+    body: dict
+    entitlement: TenantEntitlement
+    built_on: date
+
+
+# Process-wide cache: tenant_id -> snapshot
+_status_cache: Dict[int, SubscriptionStatusSnapshot] = {}
+_status_cache_lock = threading.Lock()
+
+
+def get_subscription_status_snapshot(
+    db: Session, tenant_id: int
+) -> SubscriptionStatusSnapshot:
+    """
+    Get the detailed subscription status with its ETag, cached per tenant.
+
+    A cached status is reused while the tenant's cached entitlement is the
+    one it was built from (so subscription changes and the entitlement TTL
+    refresh it), it was built today (days_remaining) and no usage counter
+    changed since (see invalidate_subscription_status).
+    """
+    entitlement = get_tenant_entitlement(db, tenant_id)
+    today = date.today()
+
+    with _status_cache_lock:
+        cached = _status_cache.get(tenant_id)
+    if cached and cached.entitlement is entitlement and cached.built_on == today:
+        return cached
+
+    body = build_subscription_status(db, tenant_id, entitlement)
+    digest = hashlib.sha1(
+        json.dumps(body, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    snapshot = SubscriptionStatusSnapshot(
+        etag=f'"{digest}"', body=body, entitlement=entitlement, built_on=today
+    )
+
+    with _status_cache_lock:
+        _status_cache[tenant_id] = snapshot
+    return snapshot
+
+
+def get_subscription_status_detail(db: Session, tenant_id: int) -> dict:
+    """
+    Get detailed subscription status with all information.
+
+    Returns comprehensive status dict for frontend display.
+    """
+    return get_subscription_status_snapshot(db, tenant_id).body
+
+
+def invalidate_subscription_status(tenant_id: int) -> None:
+    """Drop the cached status after a usage change."""
+    with _status_cache_lock:
+        _status_cache.pop(tenant_id, None)
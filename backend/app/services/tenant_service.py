@@ -6,6 +6,9 @@ from app.models.tenant import Tenant
 from app.models.member import Member, MemberStatus
 from app.schemas.tenant import TenantCreate, TenantUpdate
 from app.core.exceptions import TenantAlreadyExistsException
+from app.models.tenant_resource_version import TenantResource
+from app.services.entitlement_service import invalidate_entitlement
+from app.services.resource_version_service import bump_resource_version
 from loguru import logger
 
 
@@ -139,6 +142,7 @@ def update_tenant(
     for field, value in update_data.items():
         setattr(tenant, field, value)
     
+    bump_resource_version(db, tenant_id, TenantResource.TENANT)
     db.commit()
     db.refresh(tenant)
     
@@ -162,6 +166,7 @@ def delete_tenant(db: Session, tenant_id: int) -> bool:
         return False
     
     tenant.is_active = False
+    bump_resource_version(db, tenant_id, TenantResource.TENANT)
     db.commit()
     
     logger.info(f"Tenant deleted: {tenant.name} (ID: {tenant.id})")
@@ -189,8 +194,10 @@ def update_subscription(
         return None
     
     tenant.paid_until = paid_until
+    bump_resource_version(db, tenant_id, TenantResource.TENANT)
     db.commit()
     db.refresh(tenant)
+    invalidate_entitlement(tenant_id)
     logger.info(f"Subscription updated for tenant {tenant.name} (ID: {tenant.id}) until {paid_until}")
     return tenant
 
@@ -0,0 +1,166 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from typing import Dict, Optional
+
+from app.core.database import after_commit
+from app.models.tenant_usage import TenantUsage
+from app.models.member import Member
+from app.models.membership_plan import MembershipPlan
+from app.models.users import User
+from loguru import logger
+
+
+def record_usage(
+    db: Session,
+    tenant_id: Optional[int],
+    members: int = 0,
+    staff: int = 0,
+    plans: int = 0,
+) -> None:
+    """
+    Adjust a tenant's usage counters (negative values to decrement).
+
+    Runs as an upsert inside the caller's transaction; the caller commits,
+    and the cached subscription status is dropped once it has. Users
+    without a tenant (superadmins) are not counted.
+    """
+    if tenant_id is None:
+        return
+
+    stmt = insert(TenantUsage).values(
+        tenant_id=tenant_id,
+        member_count=members,
+        staff_count=staff,
+        plan_count=plans,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TenantUsage.tenant_id],
+        set_={
+            "member_count": TenantUsage.member_count + stmt.excluded.member_count,
+            "staff_count": TenantUsage.staff_count + stmt.excluded.staff_count,
+            "plan_count": TenantUsage.plan_count + stmt.excluded.plan_count,
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+
+    from app.services.subscription_service import invalidate_subscription_status
+
+    after_commit(db, lambda: invalidate_subscription_status(tenant_id))
+
+
+def _empty_usage(tenant_id: int) -> dict:
+    return {
+        "tenant_id": tenant_id,
+        "member_count": 0,
+        "staff_count": 0,
+        "plan_count": 0,
+    }
+
+
+def _count_usage(db: Session, tenant_id: Optional[int] = None) -> Dict[int, dict]:
+    """Count active members, staff and plans per tenant from the raw tables."""
+    usage: Dict[int, dict] = {}
+    sources = (
+        ("member_count", Member.tenant_id, Member.is_active),
+        ("staff_count", User.tenant_id, User.is_active),
+        ("plan_count", MembershipPlan.tenant_id, MembershipPlan.is_active),
+    )
+
+    for key, tenant_column, active_column in sources:
+        query = db.query(tenant_column, func.count()).filter(
+            tenant_column.isnot(None), active_column == True
+        )
+        if tenant_id is not None:
+            query = query.filter(tenant_column == tenant_id)
+
+        for t_id, count in query.group_by(tenant_column):
+            usage.setdefault(t_id, _empty_usage(t_id))[key] = count
+
+    return usage
+
+
+def reconcile_usage(db: Session, tenant_id: Optional[int] = None) -> int:
+    """
+    Recompute usage counters from members, users and membership_plans.
+
+    Used to backfill the counters (python manage.py reconcile-usage) and to
+    repair drift from writes that bypass the services. Reconciles every
+    tenant unless tenant_id is given.
+
+    Returns:
+        Number of counter rows that were out of date
+    """
+    actual = _count_usage(db, tenant_id)
+
+    stored_q = db.query(TenantUsage)
+    if tenant_id is not None:
+        stored_q = stored_q.filter(TenantUsage.tenant_id == tenant_id)
+        actual.setdefault(tenant_id, _empty_usage(tenant_id))
+    stored = {
+        row.tenant_id: (row.member_count, row.staff_count, row.plan_count)
+        for row in stored_q
+    }
+
+    # Tenants whose rows all went away still need their counters zeroed
+    for t_id in stored.keys() - actual.keys():
+        actual[t_id] = _empty_usage(t_id)
+
+    rows = [
+        row
+        for t_id, row in actual.items()
+        if stored.get(t_id)
+        != (row["member_count"], row["staff_count"], row["plan_count"])
+    ]
+
+    if rows:
+        stmt = insert(TenantUsage)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TenantUsage.tenant_id],
+            set_={
+                "member_count": stmt.excluded.member_count,
+                "staff_count": stmt.excluded.staff_count,
+                "plan_count": stmt.excluded.plan_count,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt, rows)
+    db.commit()
+
+    from app.services.subscription_service import invalidate_subscription_status
+
+    for row in rows:
+        invalidate_subscription_status(row["tenant_id"])
+        if row["tenant_id"] in stored:
+            logger.warning(
+                f"Usage counters drifted for tenant {row['tenant_id']}: "
+                f"stored {stored[row['tenant_id']]}, actual "
+                f"({row['member_count']}, {row['staff_count']}, {row['plan_count']})"
+            )
+
+    scope = f"tenant {tenant_id}" if tenant_id is not None else "all tenants"
+    logger.info(f"Reconciled usage counters for {scope}: {len(rows)} rows updated")
+    return len(rows)
+
+
+def get_usage(db: Session, tenant_id: int) -> dict:
+    """
+    Get current usage counts for a tenant with a single-row read.
+
+    A tenant without a counter row yet (before the backfill) is counted
+    once and its row written.
+
+    Returns:
+        Dict with member_count, staff_count, plan_count
+    """
+    usage_q = db.query(
+        TenantUsage.member_count, TenantUsage.staff_count, TenantUsage.plan_count
+    ).filter(TenantUsage.tenant_id == tenant_id)
+
+    usage = usage_q.first()
+    if usage is None:
+        reconcile_usage(db, tenant_id)
+        usage = usage_q.first()
+
+    return usage._asdict()
@@ -3,8 +3,10 @@ from sqlalchemy import and_, or_
 from typing import Optional
 from app.models.users import User, UserRole
 from app.schemas.users import UserCreate, UserUpdate
-from app.core.security import hash_password, pwd_context
+from app.core.security import hash_password, verify_password
 from app.core.exceptions import UserAlreadyExistsException
+from app.services.auth_service import revoke_user_tokens
+from app.services.usage_service import record_usage
 from loguru import logger
 
 
@@ -32,6 +34,7 @@ def create_user(
     )
 
     db.add(db_user)
+    record_usage(db, final_tenant_id, staff=1)
     db.commit()
     db.refresh(db_user)
 
@@ -185,6 +188,13 @@ def update_user(
         if existing:
             raise UserAlreadyExistsException("Phone number already exists")
 
+    # Role is carried in the token: a change must revoke issued tokens
+    new_role = update_data.get("role")
+    if new_role is not None:
+        role_value = new_role.value if hasattr(new_role, "value") else new_role
+        if role_value != user.role:
+            revoke_user_tokens(db, user)
+
     # Update fields
     for field, value in update_data.items():
         if field == "role" and hasattr(value, "value"):
@@ -216,6 +226,8 @@ def delete_user(db: Session, user_id: int, tenant_id: Optional[int] = None) -> b
         return False
 
     user.is_active = False
+    revoke_user_tokens(db, user)
+    record_usage(db, user.tenant_id, staff=-1)
     db.commit()
 
     logger.info(f"User deleted: {user.username} (ID: {user.id})")
@@ -247,7 +259,7 @@ def change_password(
         return False
 
     # Verify old password
-    if not pwd_context.verify(old_password, str(user.hashed_password)):
+    if not verify_password(old_password, str(user.hashed_password)):
         logger.warning(
             f"Failed password change attempt for user {user.username}: incorrect old password"
         )
@@ -255,6 +267,7 @@ def change_password(
 
     # Set new password
     user.hashed_password = hash_password(new_password)
+    revoke_user_tokens(db, user)
     db.commit()
 
     logger.info(
@@ -284,6 +297,7 @@ def update_user_role(
 
     role_value = new_role.value if hasattr(new_role, "value") else new_role
     user.role = role_value
+    revoke_user_tokens(db, user)
     db.commit()
     db.refresh(user)
 
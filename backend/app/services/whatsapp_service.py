@@ -1,8 +1,11 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable, Iterable, List
+import asyncio
 import httpx
 from datetime import date
 from loguru import logger
 from app.core.config import settings
+from app.core.resilience import CircuitBreaker, CircuitState, TokenBucket
+from app.services.entitlement_service import TenantEntitlement, get_tenant_entitlement
 
 
 class WhatsAppService:
@@ -11,6 +14,16 @@ class WhatsAppService:
         self.secret_key = settings.WPPCONNECT_SECRET_KEY
         self.enabled = settings.WHATSAPP_ENABLED
 
+        # Shared keep-alive client and per-session send limits, bound to the
+        # event loop they were created on
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_limits: Dict[str, asyncio.Semaphore] = {}
+        # Per-session pacing and failure isolation (loop independent)
+        self._rate_limiters: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._in_flight: Dict[str, int] = {}
+
         if not self.base_url:
             logger.warning(
                 "WPPConnect base URL not configured. Service will be disabled."
@@ -21,62 +34,152 @@ class WhatsAppService:
         """Construct WPPConnect API URL for a given session and endpoint."""
         return f"{self.base_url}/api/{session}/{endpoint}"
 
-    def format_phone_number(self, phone: str) -> str:
-        phone = "".join(filter(str.isdigit, phone))
+    def _session_name(self, tenant_id: int) -> str:
+        return f"tenant-{tenant_id}"
 
-        if not phone.startswith("91") and len(phone) == 10:
-            phone = "91" + phone
-
-        return phone
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled HTTP client, creating it on first use.
 
-    async def send_text_message(
-        self, db, tenant_id: int, phone_number: str, message: str
-    ) -> Dict[str, Any]:
-        """Send a text message via WPPConnect Server.
+        A new client is created if the running event loop changed (e.g. a
+        management command calling asyncio.run more than once).
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            http2 = settings.WHATSAPP_HTTP2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning(
+                        "WHATSAPP_HTTP2 is enabled but the h2 package is not installed. "
+                        "Falling back to HTTP/1.1."
+                    )
+                    http2 = False
+
+            self._client = httpx.AsyncClient(
+                timeout=settings.WHATSAPP_HTTP_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=settings.WHATSAPP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.WHATSAPP_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                http2=http2,
+            )
+            self._client_loop = loop
+            self._session_limits = {}
+        return self._client
+
+    def _session_semaphore(self, session: str) -> asyncio.Semaphore:
+        """Bound concurrent requests per WPPConnect session (one per tenant)."""
+        semaphore = self._session_limits.get(session)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(settings.WHATSAPP_SESSION_CONCURRENCY)
+            self._session_limits[session] = semaphore
+        return semaphore
+
+    def _rate_limiter(self, session: str) -> TokenBucket:
+        bucket = self._rate_limiters.get(session)
+        if bucket is None:
+            bucket = TokenBucket(
+                settings.WHATSAPP_RATE_PER_SECOND, settings.WHATSAPP_RATE_BURST
+            )
+            self._rate_limiters[session] = bucket
+        return bucket
+
+    def _breaker(self, session: str) -> CircuitBreaker:
+        breaker = self._breakers.get(session)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                settings.WHATSAPP_BREAKER_FAILURE_THRESHOLD,
+                settings.WHATSAPP_BREAKER_COOLDOWN_SECONDS,
+            )
+            self._breakers[session] = breaker
+        return breaker
 
-        Args:
-            db: Database session for subscription checking
-            tenant_id: Tenant ID for session naming and subscription verification
-            phone_number: Recipient's phone number
-            message: Message text to send
+    def session_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-session send metrics for this process.
 
-        Returns:
-            Dict with success status and data/error
+        rate_limit.waiting is the number of sends queued on the token bucket;
+        circuit.state is closed, open (failing fast) or half_open.
         """
-        if not self.enabled:
-            logger.warning("WPPConnect service is disabled. Message not sent.")
-            return {"success": False, "error": "WhatsApp service disabled"}
+        return {
+            session: {
+                "in_flight": self._in_flight.get(session, 0),
+                "rate_limit": self._rate_limiter(session).snapshot(),
+                "circuit": self._breaker(session).snapshot(),
+            }
+            for session in sorted(set(self._rate_limiters) | set(self._breakers))
+        }
 
-        # Check if tenant has WhatsApp feature access (Pro plan)
-        from app.services.subscription_service import check_feature_access
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (called on application shutdown)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+        self._session_limits = {}
 
-        if not check_feature_access(db, tenant_id, "whatsapp"):
-            logger.warning(
-                f"Tenant {tenant_id} does not have WhatsApp access. Message not sent."
-            )
-            return {
-                "success": False,
-                "error": "WhatsApp not available for your subscription plan",
-            }
+    def format_phone_number(self, phone: str) -> str:
+        phone = "".join(filter(str.isdigit, phone))
 
-        try:
-            formatted_phone = self.format_phone_number(phone_number)
-            session = f"tenant-{tenant_id}"
-            url = self._get_api_url(session, "send-message")
+        if not phone.startswith("91") and len(phone) == 10:
+            phone = "91" + phone
 
-            payload = {"phone": formatted_phone, "message": message}
+        return phone
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
+    def _circuit_open_result(self, breaker: CircuitBreaker) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": "WhatsApp session unavailable, retry in "
+            f"{max(breaker.retry_after(), 1):.0f}s",
+        }
 
-                result = response.json()
-                logger.info(
-                    f"WPPConnect message sent to {phone_number} (tenant {tenant_id}): {result}"
-                )
-                return {"success": True, "data": result}
+    async def _post(
+        self,
+        tenant_id: int,
+        endpoint: str,
+        payload: Dict[str, Any],
+        phone_number: str,
+        kind: str,
+    ) -> Dict[str, Any]:
+        """POST to the tenant's WPPConnect session over the pooled client."""
+        session = self._session_name(tenant_id)
+        url = self._get_api_url(session, endpoint)
+
+        # Fail fast while the session's circuit is open (e.g. phone
+        # disconnected) instead of waiting for the timeout on every send.
+        # Checked again after pacing, since the circuit may open meanwhile.
+        breaker = self._breaker(session)
+        if breaker.retry_after() > 0:
+            return self._circuit_open_result(breaker)
+        await self._rate_limiter(session).acquire()
+        if not breaker.allow_request():
+            return self._circuit_open_result(breaker)
+
+        unreachable = False
+        try:
+            client = self._get_client()
+            async with self._session_semaphore(session):
+                self._in_flight[session] = self._in_flight.get(session, 0) + 1
+                try:
+                    response = await client.post(url, json=payload)
+                finally:
+                    self._in_flight[session] -= 1
+            response.raise_for_status()
+
+            result = response.json()
+            logger.info(
+                f"WPPConnect {kind} sent to {phone_number} (tenant {tenant_id}): {result}"
+            )
+            return {"success": True, "data": result}
 
         except httpx.ConnectError as e:
+            unreachable = True
             logger.error(
                 f"WPPConnect server connection error for tenant {tenant_id}: {e}"
             )
@@ -85,107 +188,244 @@ class WhatsAppService:
                 "error": "WhatsApp server is currently unavailable",
             }
         except httpx.TimeoutException as e:
+            unreachable = True
             logger.error(
-                f"WPPConnect timeout sending message to {phone_number} (tenant {tenant_id}): {e}"
+                f"WPPConnect timeout sending {kind} to {phone_number} (tenant {tenant_id}): {e}"
             )
             return {"success": False, "error": "WhatsApp server timeout"}
         except httpx.HTTPStatusError as e:
             logger.error(
-                f"HTTP error sending WPPConnect message to {phone_number} (tenant {tenant_id}): {e}"
+                f"HTTP error sending WPPConnect {kind} to {phone_number} (tenant {tenant_id}): {e}"
             )
             return {"success": False, "error": str(e)}
         except Exception as e:
             logger.error(
-                f"Error sending WPPConnect message to {phone_number} (tenant {tenant_id}): {e}"
+                f"Error sending WPPConnect {kind} to {phone_number} (tenant {tenant_id}): {e}"
             )
             return {"success": False, "error": str(e)}
+        finally:
+            # Only connection failures/timeouts count against the session
+            if unreachable:
+                was_open = breaker.state == CircuitState.OPEN
+                breaker.record_failure()
+                if breaker.state == CircuitState.OPEN and not was_open:
+                    logger.warning(
+                        f"WPPConnect circuit opened for {session} after "
+                        f"{breaker.consecutive_failures} consecutive failures"
+                    )
+            else:
+                breaker.record_success()
+
+    async def _deliver_text(
+        self, tenant_id: int, phone_number: str, message: str
+    ) -> Dict[str, Any]:
+        payload = {"phone": self.format_phone_number(phone_number), "message": message}
+        return await self._post(
+            tenant_id, "send-message", payload, phone_number, "message"
+        )
 
-    async def send_image_message(
+    async def _deliver_image(
         self,
-        db,
         tenant_id: int,
         phone_number: str,
         image_url: str,
         caption: Optional[str] = None,
     ) -> Dict[str, Any]:
+        payload = {
+            "phone": self.format_phone_number(phone_number),
+            "path": image_url,
+        }
+
+        if caption:
+            payload["caption"] = caption
+
+        return await self._post(tenant_id, "send-image", payload, phone_number, "image")
+
+    async def _deliver(self, tenant_id: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one batch item (text, or image when image_url is set)."""
+        if item.get("image_url"):
+            return await self._deliver_image(
+                tenant_id, item["phone_number"], item["image_url"], item.get("caption")
+            )
+        return await self._deliver_text(
+            tenant_id, item["phone_number"], item["message"]
+        )
+
+    def access_error(
+        self, db, tenant_id: int, entitlement: Optional[TenantEntitlement] = None
+    ) -> Optional[str]:
+        """
+        Return why the tenant cannot send WhatsApp messages, or None.
 
+        Uses the cached tenant entitlement (see entitlement_service), so a
+        check costs no queries while the cache is warm.
+        """
         if not self.enabled:
-            logger.warning("WPPConnect service is disabled. Image not sent.")
-            return {"success": False, "error": "WhatsApp service disabled"}
+            return "WhatsApp service disabled"
 
         # Check if tenant has WhatsApp feature access (Pro plan)
-        from app.services.subscription_service import check_feature_access
+        if entitlement is None:
+            entitlement = get_tenant_entitlement(db, tenant_id)
 
-        if not check_feature_access(db, tenant_id, "whatsapp"):
-            logger.warning(
-                f"Tenant {tenant_id} does not have WhatsApp access. Image not sent."
-            )
+        if not entitlement.has_feature("whatsapp"):
+            return "WhatsApp not available for your subscription plan"
+        return None
+
+    async def send_text_message(
+        self, db, tenant_id: int, phone_number: str, message: str
+    ) -> Dict[str, Any]:
+        """Send a text message via WPPConnect Server.
+
+        Args:
+            db: Database session for subscription checking
+            tenant_id: Tenant ID for session naming and subscription verification
+            phone_number: Recipient's phone number
+            message: Message text to send
+
+        Returns:
+            Dict with success status and data/error
+        """
+        error = self.access_error(db, tenant_id)
+        if error:
+            logger.warning(f"Message not sent for tenant {tenant_id}: {error}")
+            return {"success": False, "error": error}
+
+        return await self._deliver_text(tenant_id, phone_number, message)
+
+    async def send_image_message(
+        self,
+        db,
+        tenant_id: int,
+        phone_number: str,
+        image_url: str,
+        caption: Optional[str] = None,
+    ) -> Dict[str, Any]:
+
+        error = self.access_error(db, tenant_id)
+        if error:
+            logger.warning(f"Image not sent for tenant {tenant_id}: {error}")
+            return {"success": False, "error": error}
+
+        return await self._deliver_image(tenant_id, phone_number, image_url, caption)
+
+    # ==================== Batch Dispatch ====================
+
+    async def _fan_out(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        send: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Run send for the items concurrently and collect per-message results."""
+
+        async def run(item: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                result = await send(item)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
             return {
-                "success": False,
-                "error": "WhatsApp not available for your subscription plan",
+                "phone_number": item["phone_number"],
+                "ref": item.get("ref"),
+                **result,
             }
 
-        try:
-            formatted_phone = self.format_phone_number(phone_number)
-            session = f"tenant-{tenant_id}"
-            url = self._get_api_url(session, "send-image")
+        # Pull items lazily so large batches (or generators) never have more
+        # than WHATSAPP_BATCH_WINDOW messages in flight
+        window = asyncio.Semaphore(settings.WHATSAPP_BATCH_WINDOW)
+        tasks: List[asyncio.Task] = []
+        for item in messages:
+            await window.acquire()
+            task = asyncio.create_task(run(item))
+            task.add_done_callback(lambda _: window.release())
+            tasks.append(task)
+
+        results: List[Dict[str, Any]] = await asyncio.gather(*tasks)
+        sent_count = sum(1 for r in results if r["success"])
+
+        return {
+            "total": len(results),
+            "sent_count": sent_count,
+            "failed_count": len(results) - sent_count,
+            "results": results,
+        }
+
+    async def dispatch(
+        self, tenant_id: int, messages: Iterable[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Send messages over the tenant's session without subscription checks.
 
-            payload = {
-                "phone": formatted_phone,
-                "path": image_url,
-            }
+        Concurrency is bounded by WHATSAPP_SESSION_CONCURRENCY per session;
+        callers are responsible for checking WhatsApp access.
+        """
+        return await self._fan_out(
+            messages, lambda item: self._deliver(tenant_id, item)
+        )
 
-            if caption:
-                payload["caption"] = caption
+    async def send_batch(
+        self,
+        db,
+        tenant_id: int,
+        messages: Iterable[Dict[str, Any]],
+        entitlement: Optional[TenantEntitlement] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send many messages for one tenant concurrently.
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
+        WhatsApp access is resolved once for the whole batch (from the
+        entitlement cache, or the entitlement passed in) instead of per
+        message; if the tenant lacks access the batch is refused before
+        anything is sent. The session is not used after that check, so the
+        batch never shares it across tasks.
 
-                result = response.json()
-                logger.info(
-                    f"WPPConnect image sent to {phone_number} (tenant {tenant_id}): {result}"
-                )
-                return {"success": True, "data": result}
+        Args:
+            db: Database session for subscription checking
+            tenant_id: Tenant ID
+            messages: Dicts with phone_number and message (or image_url and
+                optional caption), plus an optional ref echoed in the result;
+                may be a generator
+            entitlement: Pre-resolved tenant entitlement (optional)
 
-        except httpx.ConnectError as e:
-            logger.error(
-                f"WPPConnect server connection error for tenant {tenant_id}: {e}"
+        Returns:
+            Dict with total/sent_count/failed_count, refused, and per-message
+            results (in input order)
+        """
+        error = self.access_error(db, tenant_id, entitlement)
+        if error:
+            results = [
+                {
+                    "phone_number": item["phone_number"],
+                    "ref": item.get("ref"),
+                    "success": False,
+                    "error": error,
+                }
+                for item in messages
+            ]
+            logger.warning(
+                f"WhatsApp batch of {len(results)} refused for tenant {tenant_id}: {error}"
             )
             return {
-                "success": False,
-                "error": "WhatsApp server is currently unavailable",
+                "total": len(results),
+                "sent_count": 0,
+                "failed_count": len(results),
+                "refused": True,
+                "error": error,
+                "results": results,
             }
-        except httpx.TimeoutException as e:
-            logger.error(
-                f"WPPConnect timeout sending image to {phone_number} (tenant {tenant_id}): {e}"
-            )
-            return {"success": False, "error": "WhatsApp server timeout"}
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                f"HTTP error sending WPPConnect image to {phone_number} (tenant {tenant_id}): {e}"
-            )
-            return {"success": False, "error": str(e)}
-        except Exception as e:
-            logger.error(
-                f"Error sending WPPConnect image to {phone_number} (tenant {tenant_id}): {e}"
-            )
-            return {"success": False, "error": str(e)}
+
+        batch = await self.dispatch(tenant_id, messages)
+        batch["refused"] = False
+        return batch
 
     # ==================== Message Templates ====================
 
-    async def send_welcome_message(
+    def render_welcome_message(
         self,
-        db,
-        tenant_id: int,
-        phone_number: str,
         member_name: str,
         membership_type: str,
         joining_date: date,
         expiry_date: date,
         gym_name: str = "Our Gym",
-    ) -> Dict[str, Any]:
-
+    ) -> str:
         message = f"""🎉 *Welcome to {gym_name}!* 🎉
 
 Hello {member_name}! 👋
@@ -206,19 +446,35 @@ Let's achieve your fitness goals together! 🏋️‍♂️
 Best regards,
 {gym_name} Team"""
 
-        return await self.send_text_message(db, tenant_id, phone_number, message)
+        return message
 
-    async def send_renewal_confirmation(
+    async def send_welcome_message(
         self,
         db,
         tenant_id: int,
         phone_number: str,
         member_name: str,
         membership_type: str,
-        new_expiry_date: date,
+        joining_date: date,
+        expiry_date: date,
         gym_name: str = "Our Gym",
     ) -> Dict[str, Any]:
+        message = self.render_welcome_message(
+            member_name=member_name,
+            membership_type=membership_type,
+            joining_date=joining_date,
+            expiry_date=expiry_date,
+            gym_name=gym_name,
+        )
+        return await self.send_text_message(db, tenant_id, phone_number, message)
 
+    def render_renewal_confirmation(
+        self,
+        member_name: str,
+        membership_type: str,
+        new_expiry_date: date,
+        gym_name: str = "Our Gym",
+    ) -> str:
         message = f"""✅ *Membership Renewed Successfully!* ✅
 
 Hello {member_name}! 👋
@@ -234,19 +490,34 @@ Keep up the great work! We're excited to see you achieve your fitness goals.
 Best regards,
 {gym_name} Team"""
 
-        return await self.send_text_message(db, tenant_id, phone_number, message)
+        return message
 
-    async def send_payment_confirmation(
+    async def send_renewal_confirmation(
         self,
         db,
         tenant_id: int,
         phone_number: str,
         member_name: str,
+        membership_type: str,
+        new_expiry_date: date,
+        gym_name: str = "Our Gym",
+    ) -> Dict[str, Any]:
+        message = self.render_renewal_confirmation(
+            member_name=member_name,
+            membership_type=membership_type,
+            new_expiry_date=new_expiry_date,
+            gym_name=gym_name,
+        )
+        return await self.send_text_message(db, tenant_id, phone_number, message)
+
+    def render_payment_confirmation(
+        self,
+        member_name: str,
         amount: float,
         payment_method: str,
         payment_date: date,
         gym_name: str = "Our Gym",
-    ) -> Dict[str, Any]:
+    ) -> str:
         message = f"""💰 *Payment Received* 💰
 
 Hello {member_name}! 👋
@@ -263,18 +534,35 @@ This is your payment confirmation. Please keep this for your records.
 Best regards,
 {gym_name} Team"""
 
-        return await self.send_text_message(db, tenant_id, phone_number, message)
+        return message
 
-    async def send_expiry_reminder(
+    async def send_payment_confirmation(
         self,
         db,
         tenant_id: int,
         phone_number: str,
         member_name: str,
+        amount: float,
+        payment_method: str,
+        payment_date: date,
+        gym_name: str = "Our Gym",
+    ) -> Dict[str, Any]:
+        message = self.render_payment_confirmation(
+            member_name=member_name,
+            amount=amount,
+            payment_method=payment_method,
+            payment_date=payment_date,
+            gym_name=gym_name,
+        )
+        return await self.send_text_message(db, tenant_id, phone_number, message)
+
+    def render_expiry_reminder(
+        self,
+        member_name: str,
         expiry_date: date,
         days_remaining: int,
         gym_name: str = "Our Gym",
-    ) -> Dict[str, Any]:
+    ) -> str:
         message = f"""⏰ *Membership Expiry Reminder* ⏰
 
 Hello {member_name}! 👋
@@ -292,14 +580,29 @@ Contact us today to renew! 📞
 Best regards,
 {gym_name} Team"""
 
-        return await self.send_text_message(db, tenant_id, phone_number, message)
+        return message
 
-    async def send_payment_receipt(
+    async def send_expiry_reminder(
         self,
         db,
         tenant_id: int,
         phone_number: str,
         member_name: str,
+        expiry_date: date,
+        days_remaining: int,
+        gym_name: str = "Our Gym",
+    ) -> Dict[str, Any]:
+        message = self.render_expiry_reminder(
+            member_name=member_name,
+            expiry_date=expiry_date,
+            days_remaining=days_remaining,
+            gym_name=gym_name,
+        )
+        return await self.send_text_message(db, tenant_id, phone_number, message)
+
+    def render_payment_receipt(
+        self,
+        member_name: str,
         amount_paid: float,
         original_amount: float,
         outstanding_dues: float,
@@ -307,7 +610,7 @@ Best regards,
         payment_date: date,
         transaction_id: Optional[str] = None,
         gym_name: str = "Our Gym",
-    ) -> Dict[str, Any]:
+    ) -> str:
         payment_status = (
             "✅ *PAID IN FULL*" if outstanding_dues == 0 else "⚠️ *PARTIAL PAYMENT*"
         )
@@ -346,20 +649,43 @@ Thank you for being a valued member! 💪
 Best regards,
 {gym_name} Team"""
 
-        return await self.send_text_message(db, tenant_id, phone_number, message)
+        return message
 
-    async def send_due_reminder(
+    async def send_payment_receipt(
         self,
         db,
         tenant_id: int,
         phone_number: str,
         member_name: str,
-        original_amount: float,
         amount_paid: float,
+        original_amount: float,
         outstanding_dues: float,
+        payment_method: str,
         payment_date: date,
+        transaction_id: Optional[str] = None,
         gym_name: str = "Our Gym",
     ) -> Dict[str, Any]:
+        message = self.render_payment_receipt(
+            member_name=member_name,
+            amount_paid=amount_paid,
+            original_amount=original_amount,
+            outstanding_dues=outstanding_dues,
+            payment_method=payment_method,
+            payment_date=payment_date,
+            transaction_id=transaction_id,
+            gym_name=gym_name,
+        )
+        return await self.send_text_message(db, tenant_id, phone_number, message)
+
+    def render_due_reminder(
+        self,
+        member_name: str,
+        original_amount: float,
+        amount_paid: float,
+        outstanding_dues: float,
+        payment_date: date,
+        gym_name: str = "Our Gym",
+    ) -> str:
         message = f"""🔔 *Payment Reminder* 🔔
 
 Hello {member_name}! 👋
@@ -380,6 +706,28 @@ Thank you for your cooperation! 💪
 Best regards,
 {gym_name} Team"""
 
+        return message
+
+    async def send_due_reminder(
+        self,
+        db,
+        tenant_id: int,
+        phone_number: str,
+        member_name: str,
+        original_amount: float,
+        amount_paid: float,
+        outstanding_dues: float,
+        payment_date: date,
+        gym_name: str = "Our Gym",
+    ) -> Dict[str, Any]:
+        message = self.render_due_reminder(
+            member_name=member_name,
+            original_amount=original_amount,
+            amount_paid=amount_paid,
+            outstanding_dues=outstanding_dues,
+            payment_date=payment_date,
+            gym_name=gym_name,
+        )
         return await self.send_text_message(db, tenant_id, phone_number, message)
 
     async def send_diet_plan(
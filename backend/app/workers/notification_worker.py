@@ -0,0 +1,110 @@
+"""
+Drain the notification outbox and deliver messages through WPPConnect.
+
+Run one or more workers alongside the API:
+    python manage.py notification-worker
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Dict, List
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.notification_outbox import NotificationOutbox
+from app.services.notification_service import (
+    claim_due_notifications,
+    record_delivery_results,
+)
+from app.services.whatsapp_service import whatsapp_service
+from loguru import logger
+
+
+async def process_batch(db, batch_size: int = None) -> int:
+    """
+    Claim one batch of due notifications, send them and store the results.
+
+    Messages are grouped by tenant and each tenant's group is sent with
+    WhatsAppService.send_batch; tenants are sent concurrently. db should not
+    expire on commit: the claim commits, and expired rows would each be
+    reloaded when read.
+
+    Returns:
+        Number of notifications claimed (0 when the outbox is idle)
+    """
+    rows = claim_due_notifications(db, batch_size or settings.NOTIFICATION_BATCH_SIZE)
+    if not rows:
+        return 0
+
+    by_tenant: Dict[int, List[NotificationOutbox]] = defaultdict(list)
+    for row in rows:
+        by_tenant[row.tenant_id].append(row)
+
+    async def send_tenant(tenant_id: int, tenant_rows: List[NotificationOutbox]):
+        items = [
+            {
+                "phone_number": row.phone_number,
+                "message": row.message,
+                "image_url": row.image_url,
+                "caption": row.caption,
+                "ref": row.id,
+            }
+            for row in tenant_rows
+        ]
+        return await whatsapp_service.send_batch(db, tenant_id, items)
+
+    batches = await asyncio.gather(
+        *(send_tenant(tenant_id, group) for tenant_id, group in by_tenant.items())
+    )
+    results = {
+        r["ref"]: {**r, "refused": batch["refused"]}
+        for batch in batches
+        for r in batch["results"]
+    }
+
+    counts = record_delivery_results(db, results, rows)
+    logger.info(
+        f"Notification batch: {len(rows)} claimed, {counts['sent']} sent, "
+        f"{counts['retrying']} retrying, {counts['failed']} failed, "
+        f"{counts['skipped']} skipped"
+    )
+
+    unhealthy = {
+        session: metrics
+        for session, metrics in whatsapp_service.session_metrics().items()
+        if metrics["circuit"]["state"] != "closed" or metrics["rate_limit"]["waiting"]
+    }
+    if unhealthy:
+        logger.warning(f"WPPConnect sessions degraded: {unhealthy}")
+    return len(rows)
+
+
+async def run_worker(once: bool = False) -> None:
+    """Poll the outbox until cancelled (or until it is empty when once=True)."""
+    logger.info("Notification worker started")
+    try:
+        while True:
+            # Claimed rows stay loaded across the claim's commit, so a batch
+            # costs a fixed number of queries
+            db = SessionLocal(expire_on_commit=False)
+            try:
+                claimed = await process_batch(db)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Notification worker error: {e}")
+                claimed = 0
+            finally:
+                db.close()
+
+            if claimed:
+                continue
+            if once:
+                break
+            await asyncio.sleep(settings.NOTIFICATION_POLL_INTERVAL_SECONDS)
+    finally:
+        await whatsapp_service.aclose()
+        logger.info("Notification worker stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_worker())
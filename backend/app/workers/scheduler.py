@@ -0,0 +1,58 @@
+"""
+Cross-tenant reminder scheduler.
+
+Sweeps all tenants (or one shard of them) for expiry and due reminders and
+queues them in the notification outbox; the notification worker delivers
+them. Run one process per shard:
+    python manage.py scheduler --shard 0/2
+    python manage.py scheduler --shard 1/2
+"""
+
+import time
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.reminder_service import run_daily_jobs
+from loguru import logger
+
+
+def parse_shard(value: str):
+    """Parse "index/count" (e.g. "1/4") into (index, count)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError("Shard must look like INDEX/COUNT, e.g. 0/2")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError("Shard index must be between 0 and COUNT-1")
+    return index, count
+
+
+def run_scheduler(
+    shard_index: int = 0, shard_count: int = 1, once: bool = False
+) -> None:
+    """Run the daily jobs every SCHEDULER_INTERVAL_SECONDS until stopped."""
+    logger.info(f"Scheduler started (shard {shard_index}/{shard_count})")
+    while True:
+        db = SessionLocal()
+        try:
+            results = run_daily_jobs(
+                db, shard_index=shard_index, shard_count=shard_count
+            )
+            enqueued = {job: count for job, count in results.items() if count}
+            if enqueued:
+                logger.info(
+                    f"Scheduler run (shard {shard_index}/{shard_count}): {enqueued}"
+                )
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Scheduler error (shard {shard_index}/{shard_count}): {e}")
+        finally:
+            db.close()
+
+        if once:
+            break
+        time.sleep(settings.SCHEDULER_INTERVAL_SECONDS)
+
+
+if __name__ == "__main__":
+    run_scheduler()
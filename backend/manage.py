@@ -10,7 +10,7 @@ def run_command(command):
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python manage.py [makemigrations|migrate]")
+        print("Usage: python manage.py [makemigrations|migrate|backfill-ledger|reconcile-members|reconcile-usage|notification-worker|scheduler|seed-bench]")
         sys.exit(1)
 
     action = sys.argv[1]
@@ -25,12 +25,99 @@ def main():
         run_command(f'alembic revision --autogenerate -m "{message}"')
 
     elif action == "migrate":
+        # Extensions can't be autogenerated; member search indexes need pg_trgm
+        from sqlalchemy import text
+        from app.core.database import engine
+
+        if engine.dialect.name == "postgresql":
+            print("Ensuring PostgreSQL extensions...")
+            with engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
         print("Applying migrations...")
         run_command("alembic upgrade head")
 
+    elif action == "backfill-ledger":
+        # Optional tenant id; rebuilds every tenant when omitted
+        from app.core.database import SessionLocal
+        from app.services.ledger_service import rebuild_ledger
+
+        tenant_id = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        db = SessionLocal()
+        try:
+            rows = rebuild_ledger(db, tenant_id)
+            print(f"Daily ledger rebuilt ({rows} rows).")
+        finally:
+            db.close()
+
+    elif action == "reconcile-members":
+        # Nightly cron job; optional tenant id
+        from app.core.database import SessionLocal
+        from app.services.member_service import reconcile_member_statuses
+
+        tenant_id = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        db = SessionLocal()
+        try:
+            updated = reconcile_member_statuses(db, tenant_id)
+            print(f"Member statuses reconciled ({updated} updated).")
+        finally:
+            db.close()
+
+    elif action == "reconcile-usage":
+        # Backfill/repair plan-limit usage counters; optional tenant id
+        from app.core.database import SessionLocal
+        from app.services.usage_service import reconcile_usage
+
+        tenant_id = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        db = SessionLocal()
+        try:
+            updated = reconcile_usage(db, tenant_id)
+            print(f"Usage counters reconciled ({updated} updated).")
+        finally:
+            db.close()
+
+    elif action == "notification-worker":
+        # Long-running; pass --once to drain the outbox and exit
+        import asyncio
+        from app.workers.notification_worker import run_worker
+
+        asyncio.run(run_worker(once="--once" in sys.argv[2:]))
+
+    elif action == "scheduler":
+        # Long-running; --shard INDEX/COUNT splits tenants across processes,
+        # --once runs today's jobs and exits (e.g. from cron)
+        from app.workers.scheduler import parse_shard, run_scheduler
+
+        args = sys.argv[2:]
+        shard_index, shard_count = 0, 1
+        if "--shard" in args:
+            shard_index, shard_count = parse_shard(args[args.index("--shard") + 1])
+        run_scheduler(shard_index, shard_count, once="--once" in args)
+
+    elif action == "seed-bench":
+        # Synthetic dataset: [tenants] [members_per_tenant] [fees_per_member]
+        from app.core.database import SessionLocal
+        from app.core.seed_bench import BENCH_PASSWORD, seed_bench
+
+        args = [int(arg) for arg in sys.argv[2:5]]
+        db = SessionLocal()
+        try:
+            summary = seed_bench(db, *args)
+            print(
+                f"Seeded {len(summary['tenants'])} tenants, {summary['members']} members, "
+                f"{summary['fees']} fees, {summary['expenses']} expenses."
+            )
+            if summary["usernames"]:
+                print(
+                    f"Log in as {summary['usernames'][0]}..{summary['usernames'][-1]} "
+                    f"with password '{BENCH_PASSWORD}'."
+                )
+        finally:
+            db.close()
+
     else:
         print(f"Unknown command: {action}")
-        print("Available commands: makemigrations, migrate")
+        print("Available commands: makemigrations, migrate, backfill-ledger, reconcile-members, reconcile-usage, notification-worker, scheduler, seed-bench")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
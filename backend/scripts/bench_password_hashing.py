@@ -0,0 +1,62 @@
+"""
+Login-style bcrypt throughput: inline vs the hashing process pool.
+
+Fires --requests concurrent verifies from a thread pool (like the sync
+login handler under a burst of logins) and reports verifies/second for
+inline bcrypt and for the pool at 1..N workers. From backend/:
+    python -m scripts.bench_password_hashing --requests 64 --concurrency 32
+
+Inline throughput stays at one core's worth however many threads wait;
+the pool should scale roughly with the number of workers up to the cores.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.password_hasher import PasswordHasher, pwd_context
+
+
+def run(verify, hashed: str, requests: int, concurrency: int) -> float:
+    """Verifies per second for a burst of requests."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as threads:
+        results = list(
+            threads.map(lambda _: verify("benchpass123", hashed), range(requests))
+        )
+    elapsed = time.perf_counter() - started
+    assert all(results)
+    return requests / elapsed
+
+
+def main() -> None:
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--max-workers", type=int, default=cores)
+    args = parser.parse_args()
+
+    hashed = pwd_context.hash("benchpass123")
+    print(f"{cores} CPU cores, {args.requests} verifies, {args.concurrency} threads\n")
+
+    inline = run(pwd_context.verify, hashed, args.requests, args.concurrency)
+    print(f"{'inline':<12} {inline:>8.1f} verifies/s")
+
+    counts = {args.max_workers}
+    counts.update(2**n for n in range(8) if 2**n < args.max_workers)
+    for workers in sorted(counts):
+        hasher = PasswordHasher(workers=workers, max_pending=args.requests)
+        hasher.verify("benchpass123", hashed)  # start the workers
+        try:
+            rate = run(hasher.verify, hashed, args.requests, args.concurrency)
+        finally:
+            hasher.shutdown()
+        print(
+            f"{f'pool x{workers}':<12} {rate:>8.1f} verifies/s  ({rate / inline:.1f}x inline)"
+        )
+
+
+if __name__ == "__main__":
+    main()
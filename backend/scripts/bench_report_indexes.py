@@ -0,0 +1,210 @@
+"""
+EXPLAIN ANALYZE the report/dues query shapes without and with their indexes.
+
+Seeds synthetic tenants/members/fees (PostgreSQL only, generate_series),
+drops the composite/partial report indexes, times each query shape, creates
+the indexes from the model definitions and times them again. From backend/:
+    python -m scripts.bench_report_indexes --members 200000 --fees-per-member 6
+
+Seeded rows belong to tenants named "bench-tenant-<n>" and are removed at
+the end unless --keep is given. Do not run against production.
+"""
+
+import argparse
+import statistics
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.models.member import Member
+from app.models.member_fee import MemberFee
+
+INDEXES = [
+    index
+    for table in (Member.__table__, MemberFee.__table__)
+    for index in table.indexes
+    if index.name
+    in (
+        "ix_fees_tenant_status_date",
+        "ix_members_tenant_status_expiry",
+        "ix_members_tenant_dues",
+    )
+]
+
+# Mirrors fee_service.get_financial_report (per-method totals over paid fees;
+# fee_service.get_fee_statistics reads the daily ledger instead), report dues
+# and member growth stats
+QUERIES = {
+    "fee_summary_by_method": """
+        SELECT payment_method, sum(amount_paid), count(id), count(DISTINCT member_id)
+        FROM member_fees
+        WHERE tenant_id = :tenant_id AND payment_status = 'paid'
+          AND payment_date BETWEEN :start AND :end
+        GROUP BY payment_method
+    """,
+    "outstanding_dues": """
+        SELECT id, first_name, last_name, phone_number, outstanding_dues
+        FROM members
+        WHERE tenant_id = :tenant_id AND outstanding_dues > 0 AND is_active = true
+        ORDER BY outstanding_dues DESC
+    """,
+    "expiring_soon_count": """
+        SELECT count(id) FROM members
+        WHERE tenant_id = :tenant_id AND status = 'ACTIVE'
+          AND membership_expiry_date BETWEEN :today AND :week AND is_active = true
+    """,
+}
+
+
+def seed(conn, tenants: int, members: int, fees_per_member: int) -> int:
+    """Insert bench tenants, members and fees; returns the first tenant id."""
+    conn.execute(
+        text("""
+            INSERT INTO tenants (name, is_active, created_at, updated_at)
+            SELECT 'bench-tenant-' || t, true, now(), now()
+            FROM generate_series(1, :tenants) AS t
+            """),
+        {"tenants": tenants},
+    )
+    first_tenant = conn.execute(
+        text("SELECT min(id) FROM tenants WHERE name LIKE 'bench-tenant-%'")
+    ).scalar()
+
+    conn.execute(
+        text("""
+            INSERT INTO members (tenant_id, first_name, last_name, phone_number,
+                joining_date, membership_expiry_date, status, total_fees_paid,
+                outstanding_dues, is_active, created_at, updated_at)
+            SELECT :first_tenant + (m % :tenants),
+                   'Bench' || m, 'Member' || m,
+                   lpad((9000000000 + m)::text, 10, '0'),
+                   current_date - (m % 720),
+                   current_date - (m % 720) + 30 * (1 + m % 12),
+                   CASE WHEN current_date - (m % 720) + 30 * (1 + m % 12) < current_date
+                        THEN 'EXPIRED'::memberstatus ELSE 'ACTIVE'::memberstatus END,
+                   0,
+                   CASE WHEN m % 20 = 0 THEN (m % 5000) + 100 ELSE 0 END,
+                   m % 50 <> 0,
+                   now(), now()
+            FROM generate_series(1, :members) AS m
+            """),
+        {"first_tenant": first_tenant, "tenants": tenants, "members": members},
+    )
+
+    conn.execute(
+        text("""
+            INSERT INTO member_fees (member_id, tenant_id, original_amount,
+                amount_paid, payment_method, payment_date, payment_status, created_at)
+            SELECT m.id, m.tenant_id, 2000, 500 + (f * 137 + m.id) % 2500,
+                   (ARRAY['cash', 'upi', 'card', 'bank_transfer'])[1 + (m.id + f) % 4],
+                   current_date - ((m.id * 7 + f * 53) % 730),
+                   CASE WHEN (m.id + f) % 25 = 0 THEN 'pending' ELSE 'paid' END,
+                   now()
+            FROM members m
+            CROSS JOIN generate_series(1, :fees_per_member) AS f
+            WHERE m.tenant_id >= :first_tenant
+              AND m.tenant_id < :first_tenant + :tenants
+            """),
+        {
+            "first_tenant": first_tenant,
+            "tenants": tenants,
+            "fees_per_member": fees_per_member,
+        },
+    )
+    return first_tenant
+
+
+def cleanup(conn) -> None:
+    bench = "SELECT id FROM tenants WHERE name LIKE 'bench-tenant-%'"
+    conn.execute(text(f"DELETE FROM member_fees WHERE tenant_id IN ({bench})"))
+    conn.execute(text(f"DELETE FROM members WHERE tenant_id IN ({bench})"))
+    conn.execute(text("DELETE FROM tenants WHERE name LIKE 'bench-tenant-%'"))
+
+
+def analyze(conn) -> None:
+    conn.execute(text("ANALYZE members"))
+    conn.execute(text("ANALYZE member_fees"))
+
+
+def explain(conn, sql: str, params: dict, runs: int):
+    """Median execution time (ms) and top plan node over several runs."""
+    timings = []
+    plan = None
+    for _ in range(runs):
+        result = conn.execute(
+            text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"), params
+        ).scalar()
+        timings.append(result[0]["Execution Time"])
+        plan = result[0]["Plan"]
+
+    # First scan node, for a one-word summary of the access path
+    node = plan
+    while node.get("Plans") and "Scan" not in node["Node Type"]:
+        node = node["Plans"][0]
+    access = node["Node Type"]
+    if node.get("Index Name"):
+        access += f" using {node['Index Name']}"
+    return statistics.median(timings), access
+
+
+def run_queries(conn, tenant_id: int, runs: int) -> dict:
+    today = date.today()
+    params = {
+        "tenant_id": tenant_id,
+        "start": today - timedelta(days=30),
+        "end": today,
+        "today": today,
+        "week": today + timedelta(days=7),
+    }
+    return {name: explain(conn, sql, params, runs) for name, sql in QUERIES.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tenants", type=int, default=20)
+    parser.add_argument("--members", type=int, default=200_000)
+    parser.add_argument("--fees-per-member", type=int, default=6)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="Keep seeded data")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("This benchmark needs PostgreSQL")
+
+    with engine.begin() as conn:
+        print(
+            f"Seeding {args.tenants} tenants, {args.members} members, "
+            f"{args.members * args.fees_per_member} fees..."
+        )
+        tenant_id = seed(conn, args.tenants, args.members, args.fees_per_member)
+
+    try:
+        with engine.begin() as conn:
+            for index in INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+            analyze(conn)
+            before = run_queries(conn, tenant_id, args.runs)
+
+        with engine.begin() as conn:
+            for index in INDEXES:
+                index.create(bind=conn)
+            analyze(conn)
+            after = run_queries(conn, tenant_id, args.runs)
+
+        print(f"\n{'query':<24} {'before ms':>10} {'after ms':>10}  plan (after)")
+        for name in QUERIES:
+            (before_ms, _), (after_ms, access) = before[name], after[name]
+            print(f"{name:<24} {before_ms:>10.2f} {after_ms:>10.2f}  {access}")
+        print("\nBefore plans:")
+        for name, (_, access) in before.items():
+            print(f"  {name}: {access}")
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                cleanup(conn)
+                analyze(conn)
+
+
+if __name__ == "__main__":
+    main()
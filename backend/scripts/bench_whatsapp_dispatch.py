@@ -0,0 +1,77 @@
+"""
+Compare serial per-message clients with the pooled concurrent dispatcher.
+
+Run the stub first (see scripts/wppconnect_stub.py), then from backend/:
+    WPPCONNECT_BASE_URL=http://localhost:21465 python -m scripts.bench_whatsapp_dispatch 2000
+
+The serial run mirrors the old behaviour: a new httpx.AsyncClient per
+message, awaited one at a time. Use --skip-serial for large counts, and
+WHATSAPP_RATE_PER_SECOND=0 to measure without per-session pacing.
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.services.whatsapp_service import whatsapp_service
+
+TENANT_ID = 1
+
+
+def _messages(count: int):
+    return [
+        {
+            "phone_number": f"98{i:08d}",
+            "message": f"Benchmark reminder {i}",
+            "ref": i,
+        }
+        for i in range(count)
+    ]
+
+
+async def run_serial(count: int) -> float:
+    started = time.perf_counter()
+    for item in _messages(count):
+        url = whatsapp_service._get_api_url(f"tenant-{TENANT_ID}", "send-message")
+        payload = {
+            "phone": whatsapp_service.format_phone_number(item["phone_number"]),
+            "message": item["message"],
+        }
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            await client.post(url, json=payload)
+    return time.perf_counter() - started
+
+
+async def run_pooled(count: int) -> float:
+    started = time.perf_counter()
+    result = await whatsapp_service.dispatch(TENANT_ID, _messages(count))
+    elapsed = time.perf_counter() - started
+    print(f"  pooled: {result['sent_count']} sent, {result['failed_count']} failed")
+    return elapsed
+
+
+async def main(count: int, skip_serial: bool) -> None:
+    print(
+        f"Sending {count} messages to {settings.WPPCONNECT_BASE_URL} "
+        f"(session concurrency {settings.WHATSAPP_SESSION_CONCURRENCY})"
+    )
+    try:
+        if not skip_serial:
+            elapsed = await run_serial(count)
+            print(f"  serial: {elapsed:.2f}s ({count / elapsed:.1f} msg/s)")
+
+        elapsed = await run_pooled(count)
+        print(f"  pooled: {elapsed:.2f}s ({count / elapsed:.1f} msg/s)")
+    finally:
+        await whatsapp_service.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("count", type=int, nargs="?", default=500)
+    parser.add_argument("--skip-serial", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.skip_serial))
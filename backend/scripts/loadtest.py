@@ -0,0 +1,208 @@
+"""
+Asyncio/httpx load test against a running API seeded with seed-bench data.
+
+    python manage.py seed-bench 10 2000
+    uvicorn app.main:app --workers 4
+    python -m scripts.loadtest --tenants 10 --concurrency 50 --duration 60
+
+Each virtual user logs in as one bench owner and loops over a weighted mix
+of member, fee, report and subscription endpoints. Prints per-endpoint
+p50/p95/p99 latency and throughput; --json saves the results and
+--compare fails (exit 1) when p95 regressed against a saved run.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import httpx
+
+from app.core.seed_bench import BENCH_PASSWORD, BENCH_USERNAME_PREFIX, FIRST_NAMES
+
+# (name, weight, path); {q} is replaced by a random search prefix
+SCENARIO = [
+    ("members.list", 20, "/api/members/?limit=20"),
+    ("members.list_total", 5, "/api/members/?limit=20&include_total=true"),
+    ("members.search", 15, "/api/members/search?q={q}"),
+    ("fees.list", 15, "/api/fees/?limit=20"),
+    ("fees.stats", 5, "/api/fees/stats"),
+    ("reports.financial", 10, "/api/reports/financial"),
+    ("reports.members", 10, "/api/reports/members"),
+    ("reports.dues", 10, "/api/reports/dues"),
+    ("subscriptions.status", 10, "/api/subscriptions/me/status"),
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str) -> str:
+    response = await client.post(
+        "/api/auth/login", data={"username": username, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def virtual_user(
+    client: httpx.AsyncClient,
+    token: str,
+    deadline: float,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int],
+    rng: random.Random,
+) -> None:
+    names = [name for name, _, _ in SCENARIO]
+    weights = [weight for _, weight, _ in SCENARIO]
+    paths = {name: path for name, _, path in SCENARIO}
+    headers = {"Authorization": f"Bearer {token}"}
+
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        path = paths[name].format(q=rng.choice(FIRST_NAMES)[: rng.randint(2, 4)])
+
+        started = time.perf_counter()
+        try:
+            response = await client.get(path, headers=headers)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        latencies[name].append((time.perf_counter() - started) * 1000)
+        if not ok:
+            errors[name] += 1
+
+
+def summarize(
+    latencies: Dict[str, List[float]], errors: Dict[str, int], elapsed: float
+) -> dict:
+    results = {}
+    for name, _, _ in SCENARIO:
+        values = sorted(latencies.get(name, []))
+        results[name] = {
+            "requests": len(values),
+            "errors": errors.get(name, 0),
+            "rps": round(len(values) / elapsed, 1),
+            "p50_ms": round(percentile(values, 50), 1),
+            "p95_ms": round(percentile(values, 95), 1),
+            "p99_ms": round(percentile(values, 99), 1),
+            "max_ms": round(values[-1], 1) if values else 0.0,
+        }
+
+    everything = sorted(v for values in latencies.values() for v in values)
+    results["total"] = {
+        "requests": len(everything),
+        "errors": sum(errors.values()),
+        "rps": round(len(everything) / elapsed, 1),
+        "p50_ms": round(percentile(everything, 50), 1),
+        "p95_ms": round(percentile(everything, 95), 1),
+        "p99_ms": round(percentile(everything, 99), 1),
+        "max_ms": round(everything[-1], 1) if everything else 0.0,
+    }
+    return results
+
+
+def print_table(results: dict) -> None:
+    print(
+        f"\n{'endpoint':<24} {'reqs':>7} {'errs':>5} {'rps':>7} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:<24} {r['requests']:>7} {r['errors']:>5} {r['rps']:>7} "
+            f"{r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8} {r['max_ms']:>8}"
+        )
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> List[str]:
+    """Endpoints whose p95 got worse than the baseline by more than max_regression %."""
+    regressions = []
+    for name, r in results.items():
+        before = baseline.get(name, {}).get("p95_ms")
+        if (
+            before
+            and r["requests"]
+            and r["p95_ms"] > before * (1 + max_regression / 100)
+        ):
+            regressions.append(f"{name}: p95 {before}ms -> {r['p95_ms']}ms")
+    return regressions
+
+
+async def main(args) -> int:
+    usernames = [f"{BENCH_USERNAME_PREFIX}{n}" for n in range(1, args.tenants + 1)]
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url, timeout=args.timeout, limits=limits
+    ) as client:
+        tokens = await asyncio.gather(
+            *(login(client, username, args.password) for username in usernames)
+        )
+        print(
+            f"Logged in {len(tokens)} bench owners; running {args.concurrency} "
+            f"virtual users for {args.duration}s against {args.base_url}"
+        )
+
+        latencies: Dict[str, List[float]] = defaultdict(list)
+        errors: Dict[str, int] = defaultdict(int)
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                virtual_user(
+                    client,
+                    tokens[i % len(tokens)],
+                    deadline,
+                    latencies,
+                    errors,
+                    random.Random(args.seed + i),
+                )
+                for i in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    results = summarize(latencies, errors, elapsed)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            return 1
+        print("\nNo p95 regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--tenants", type=int, default=10, help="bench owners to use")
+    parser.add_argument("--password", default=BENCH_PASSWORD)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline results file (from --json)")
+    parser.add_argument(
+        "--max-regression", type=float, default=20.0, help="allowed p95 increase, %%"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
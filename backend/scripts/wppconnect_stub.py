@@ -0,0 +1,70 @@
+"""
+Minimal WPPConnect server stand-in for local testing and benchmarks.
+
+Accepts send-message/send-image calls for any session, waits a configurable
+latency and answers like WPPConnect. Nothing is delivered.
+
+Usage:
+    WPPCONNECT_STUB_LATENCY_MS=150 uvicorn scripts.wppconnect_stub:app --port 21465
+
+Point the backend at it with WPPCONNECT_BASE_URL=http://localhost:21465.
+"""
+
+import asyncio
+import itertools
+import os
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+LATENCY_SECONDS = float(os.getenv("WPPCONNECT_STUB_LATENCY_MS", "150")) / 1000
+# Every Nth request fails with 500 (0 disables)
+FAIL_EVERY = int(os.getenv("WPPCONNECT_STUB_FAIL_EVERY", "0"))
+
+app = FastAPI(title="WPPConnect stub")
+_counter = itertools.count(1)
+stats = {"requests": 0, "in_flight": 0, "max_in_flight": 0}
+
+
+async def _handle(session: str, request: Request, kind: str):
+    payload = await request.json()
+    request_number = next(_counter)
+
+    stats["requests"] += 1
+    stats["in_flight"] += 1
+    stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+    try:
+        await asyncio.sleep(LATENCY_SECONDS)
+    finally:
+        stats["in_flight"] -= 1
+
+    if FAIL_EVERY and request_number % FAIL_EVERY == 0:
+        return JSONResponse(
+            status_code=500, content={"status": "error", "message": "stub failure"}
+        )
+
+    return {
+        "status": "success",
+        "response": [
+            {
+                "id": f"true_{payload.get('phone')}@c.us_{request_number}",
+                "session": session,
+                "type": kind,
+            }
+        ],
+    }
+
+
+@app.post("/api/{session}/send-message")
+async def send_message(session: str, request: Request):
+    return await _handle(session, request, "chat")
+
+
+@app.post("/api/{session}/send-image")
+async def send_image(session: str, request: Request):
+    return await _handle(session, request, "image")
+
+
+@app.get("/stats")
+async def get_stats():
+    return stats
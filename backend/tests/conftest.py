@@ -0,0 +1,181 @@
+import os
+import socket
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+# Settings are read at import time; point them at throwaway values so the
+# app modules import without a real deployment environment
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'gym_test.db')}"
+)
+os.environ.setdefault("DATABASE_NAME", "gym_test")
+os.environ.setdefault("DATABASE_USER", "test")
+os.environ.setdefault("DATABASE_PASSWORD", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("WPPCONNECT_STUB_LATENCY_MS", "20")
+
+import pytest
+import uvicorn
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base, get_async_db, get_db
+from app.core.security import create_access_token
+from app.models import SubscriptionPlan, Tenant, TenantSubscription, User, UserRole
+from app.models.tenant_subscription import SubscriptionStatus
+from app.services.auth_service import _auth_state_cache
+from app.services.entitlement_service import invalidate_entitlement
+from app.services.plan_catalog import plan_catalog
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "gym.db"
+
+
+@pytest.fixture
+def db(db_path):
+    """SQLite session with the full schema (a file, so API tests can share it)."""
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    # Plans and auth state are cached process-wide; each test starts from its own rows
+    plan_catalog.invalidate()
+    _auth_state_cache.clear()
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def client(db, db_path):
+    """TestClient whose sync and async sessions use the test database."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    engine = db.get_bind()
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool
+    )
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    async_session_factory = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    async def override_get_async_db():
+        async with async_session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def owner_headers(db, whatsapp_tenant):
+    """Authorization header for a gym owner of whatsapp_tenant."""
+    user = User(
+        username="owner",
+        email="owner@example.com",
+        phone_number="9000000001",
+        hashed_password="x",
+        role=UserRole.GYMOWNER.value,
+        tenant_id=whatsapp_tenant,
+    )
+    db.add(user)
+    db.commit()
+    token = create_access_token(
+        data={
+            "sub": user.username,
+            "uid": user.id,
+            "ver": user.token_version,
+            "role": user.role,
+            "tenant_id": user.tenant_id,
+        }
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _add_tenant(db, name: str, whatsapp_enabled: bool) -> int:
+    plan = SubscriptionPlan(
+        name=f"{name} plan",
+        price_monthly=999,
+        max_members=-1,
+        max_staff=5,
+        max_plans=-1,
+        max_diet_templates=-1,
+        whatsapp_enabled=whatsapp_enabled,
+        advanced_analytics=True,
+        is_active=True,
+    )
+    tenant = Tenant(name=name)
+    db.add_all([plan, tenant])
+    db.flush()
+    db.add(
+        TenantSubscription(
+            tenant_id=tenant.id,
+            plan_id=plan.id,
+            status=SubscriptionStatus.ACTIVE,
+            subscription_start_date=date.today(),
+            subscription_end_date=date.today() + timedelta(days=30),
+        )
+    )
+    db.commit()
+    invalidate_entitlement(tenant.id)
+    return tenant.id
+
+
+@pytest.fixture
+def whatsapp_tenant(db) -> int:
+    """Tenant on an active plan that includes WhatsApp."""
+    return _add_tenant(db, "Stub Gym", whatsapp_enabled=True)
+
+
+@pytest.fixture
+def basic_tenant(db) -> int:
+    """Tenant on an active plan without WhatsApp."""
+    return _add_tenant(db, "Basic Gym", whatsapp_enabled=False)
+
+
+@pytest.fixture(scope="session")
+def wppconnect_stub():
+    """scripts/wppconnect_stub.py served on a free local port."""
+    from scripts import wppconnect_stub
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(wppconnect_stub.app, port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    yield wppconnect_stub, f"http://127.0.0.1:{port}"
+
+    server.should_exit = True
+    thread.join(timeout=5)
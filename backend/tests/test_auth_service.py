@@ -0,0 +1,42 @@
+from app.models import User
+from app.services.auth_service import get_user_auth_state, revoke_user_tokens
+
+
+def _add_user(db) -> User:
+    user = User(
+        username="coach",
+        email="coach@example.com",
+        phone_number="9876543210",
+        hashed_password="x",
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_revoked_tokens_are_seen_after_commit(db):
+    user = _add_user(db)
+    assert get_user_auth_state(db, user.id).token_version == 0
+
+    revoke_user_tokens(db, user)
+    # Uncommitted: other requests still see (and may cache) the old version
+    assert get_user_auth_state(db, user.id).token_version == 0
+
+    db.commit()
+    assert get_user_auth_state(db, user.id).token_version == 1
+
+
+def test_rolled_back_revoke_keeps_cached_state(db, monkeypatch):
+    user = _add_user(db)
+    get_user_auth_state(db, user.id)
+
+    revoke_user_tokens(db, user)
+    db.rollback()
+
+    calls = []
+    monkeypatch.setattr(
+        "app.services.auth_service.invalidate_user_auth_state", calls.append
+    )
+    db.commit()
+    assert calls == []
+    assert get_user_auth_state(db, user.id).token_version == 0
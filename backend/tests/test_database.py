@@ -0,0 +1,34 @@
+import pytest
+
+from app.core.config import settings
+from app.core.database import get_async_database_url
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("postgresql://u:p@db/gym", "postgresql+asyncpg://u:p@db/gym"),
+        ("postgresql+psycopg2://u:p@db/gym", "postgresql+asyncpg://u:p@db/gym"),
+        ("sqlite:///./gym.db", "sqlite+aiosqlite:///./gym.db"),
+    ],
+)
+def test_async_url_uses_backend_driver(monkeypatch, url, expected):
+    monkeypatch.setattr(settings, "ASYNC_DATABASE_URL", None)
+    monkeypatch.setattr(settings, "DATABASE_URL", url)
+
+    assert get_async_database_url() == expected
+
+
+def test_async_url_explicit_setting_wins(monkeypatch):
+    monkeypatch.setattr(settings, "ASYNC_DATABASE_URL", "sqlite+aiosqlite:///x.db")
+    monkeypatch.setattr(settings, "DATABASE_URL", "mysql://u:p@db/gym")
+
+    assert get_async_database_url() == "sqlite+aiosqlite:///x.db"
+
+
+def test_async_url_rejects_unknown_backend(monkeypatch):
+    monkeypatch.setattr(settings, "ASYNC_DATABASE_URL", None)
+    monkeypatch.setattr(settings, "DATABASE_URL", "mysql+pymysql://u:p@db/gym")
+
+    with pytest.raises(ValueError, match="ASYNC_DATABASE_URL"):
+        get_async_database_url()
@@ -0,0 +1,62 @@
+import functools
+import io
+
+import pytest
+
+from app.models import Member
+from app.services import member_import_service
+from app.services.member_import_service import import_members, iter_import_rows
+
+
+def _csv(count: int) -> bytes:
+    lines = ["first_name,last_name,phone_number,joining_date,membership_type"]
+    lines += [f"Asha,Rao,98{i:08d},2026-01-01,Monthly" for i in range(count)]
+    return "\n".join(lines).encode()
+
+
+def _fail_on_call(monkeypatch, call: int):
+    """Make record_usage raise on its call-th use (i.e. in that batch)."""
+    real = member_import_service.record_usage
+    calls = []
+
+    def record_usage(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == call:
+            raise RuntimeError("connection lost")
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(member_import_service, "record_usage", record_usage)
+
+
+def test_import_reports_committed_rows_when_a_batch_fails(
+    client, db, owner_headers, whatsapp_tenant, monkeypatch
+):
+    _fail_on_call(monkeypatch, 2)
+    monkeypatch.setattr(
+        "app.routers.members.import_members",
+        functools.partial(import_members, batch_size=2),
+    )
+
+    response = client.post(
+        "/api/members/import",
+        headers=owner_headers,
+        files={"file": ("members.csv", _csv(5), "text/csv")},
+    )
+
+    assert response.status_code == 500
+    report = response.json()
+    assert report["aborted"] is True
+    assert report["imported"] == 2
+    assert report["failed_row"] == 4  # header is row 1
+    assert [e["row"] for e in report["errors"]] == [4, 5]
+    assert db.query(Member).count() == 2
+
+
+def test_import_raises_when_nothing_was_committed(db, whatsapp_tenant, monkeypatch):
+    _fail_on_call(monkeypatch, 1)
+    rows = iter_import_rows(io.BytesIO(_csv(3)), "members.csv")
+
+    with pytest.raises(RuntimeError):
+        import_members(db, whatsapp_tenant, rows, batch_size=2)
+    db.rollback()
+    assert db.query(Member).count() == 0
@@ -0,0 +1,39 @@
+from datetime import date, timedelta
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.models import Member
+from app.models.member import full_name_expression
+from app.services.member_search_service import search_members
+
+
+def test_full_name_expression_matches_index_without_binds():
+    index = next(
+        i for i in Member.__table__.indexes if i.name == "ix_members_full_name_trgm"
+    )
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    query = full_name_expression(Member.first_name, Member.last_name).compile(
+        dialect=postgresql.dialect()
+    )
+
+    assert "(first_name || ' ' || last_name)" in ddl
+    assert query.params == {}
+
+
+def test_search_matches_full_name(db, whatsapp_tenant):
+    db.add(
+        Member(
+            tenant_id=whatsapp_tenant,
+            first_name="Asha",
+            last_name="Rao",
+            phone_number="9876543210",
+            joining_date=date.today(),
+            membership_expiry_date=date.today() + timedelta(days=30),
+        )
+    )
+    db.commit()
+
+    results = search_members(db, whatsapp_tenant, "sha ra")
+
+    assert [(r.first_name, r.last_name) for r in results] == [("Asha", "Rao")]
@@ -0,0 +1,105 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.core.config import settings
+from app.models import Member, NotificationOutbox, NotificationStatus
+from app.schemas.member_fee import FeeCreate, PaymentMethod
+from app.services.fee_service import record_fee
+from app.services.notification_service import (
+    claim_due_notifications,
+    record_delivery_results,
+)
+
+
+def _add_member(db, tenant_id: int) -> Member:
+    member = Member(
+        tenant_id=tenant_id,
+        first_name="Asha",
+        last_name="Rao",
+        phone_number="9876543210",
+        joining_date=date.today(),
+        membership_expiry_date=date.today() + timedelta(days=30),
+        outstanding_dues=Decimal("500"),
+    )
+    db.add(member)
+    db.commit()
+    return member
+
+
+def _record_fee(db, member: Member):
+    fee_data = FeeCreate(
+        amount=Decimal("500"),
+        payment_method=PaymentMethod.CASH,
+        payment_date=date.today(),
+    )
+    return record_fee(db, member.id, member.tenant_id, fee_data, user_id=None)
+
+
+def test_record_fee_queues_confirmation_and_receipt(db, whatsapp_tenant):
+    fee = _record_fee(db, _add_member(db, whatsapp_tenant))
+
+    keys = {row.idempotency_key for row in db.query(NotificationOutbox)}
+    assert keys == {
+        f"fee:{fee.id}:payment_confirmation",
+        f"fee:{fee.id}:payment_receipt",
+    }
+
+
+def test_record_fee_queues_nothing_without_whatsapp(db, basic_tenant):
+    _record_fee(db, _add_member(db, basic_tenant))
+
+    assert db.query(NotificationOutbox).count() == 0
+
+
+def test_record_fee_queues_nothing_when_service_disabled(
+    db, whatsapp_tenant, monkeypatch
+):
+    from app.services.whatsapp_service import whatsapp_service
+
+    monkeypatch.setattr(whatsapp_service, "enabled", False)
+    _record_fee(db, _add_member(db, whatsapp_tenant))
+
+    assert db.query(NotificationOutbox).count() == 0
+
+
+@pytest.mark.parametrize(
+    "result, status, counted",
+    [
+        ({"success": True}, NotificationStatus.SENT, "sent"),
+        (
+            {"success": False, "error": "timeout"},
+            NotificationStatus.PENDING,
+            "retrying",
+        ),
+        (
+            {"success": False, "error": "not on plan", "refused": True},
+            NotificationStatus.SKIPPED,
+            "skipped",
+        ),
+    ],
+)
+def test_record_delivery_results(db, whatsapp_tenant, result, status, counted):
+    _record_fee(db, _add_member(db, whatsapp_tenant))
+    rows = claim_due_notifications(db, limit=10)
+
+    counts = record_delivery_results(db, {row.id: result for row in rows}, rows)
+
+    assert counts[counted] == len(rows) == 2
+    assert {row.status for row in rows} == {status.value}
+
+
+def test_record_delivery_results_fails_after_max_attempts(
+    db, whatsapp_tenant, monkeypatch
+):
+    monkeypatch.setattr(settings, "NOTIFICATION_MAX_ATTEMPTS", 1)
+    _record_fee(db, _add_member(db, whatsapp_tenant))
+    rows = claim_due_notifications(db, limit=10)
+
+    counts = record_delivery_results(
+        db, {row.id: {"success": False, "error": "timeout"} for row in rows}, rows
+    )
+
+    assert counts["failed"] == 2
+    assert {row.status for row in rows} == {NotificationStatus.FAILED.value}
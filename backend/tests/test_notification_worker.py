@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.models import NotificationOutbox, NotificationStatus
+from app.services.notification_service import enqueue_notification
+from app.services.whatsapp_service import whatsapp_service
+from app.workers.notification_worker import process_batch
+
+
+@pytest.fixture
+def stub_whatsapp(wppconnect_stub, monkeypatch):
+    _, base_url = wppconnect_stub
+    monkeypatch.setattr(settings, "WHATSAPP_RATE_PER_SECOND", 0)
+    monkeypatch.setattr(whatsapp_service, "base_url", base_url)
+    monkeypatch.setattr(whatsapp_service, "enabled", True)
+
+
+def _run_batch(db, tenant_id: int, count: int) -> int:
+    """Queue count messages, process them and return the queries issued."""
+    for i in range(count):
+        enqueue_notification(
+            db,
+            tenant_id=tenant_id,
+            phone_number=f"98{i:08d}",
+            idempotency_key=f"test:{count}:{i}",
+            message="Hello",
+        )
+    db.commit()
+
+    worker_db = sessionmaker(
+        bind=db.get_bind(), autoflush=False, expire_on_commit=False
+    )()
+    statements = []
+
+    def count_statement(*args):
+        statements.append(args[2])
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", count_statement)
+
+    async def main():
+        try:
+            return await process_batch(worker_db, batch_size=100)
+        finally:
+            await whatsapp_service.aclose()
+
+    try:
+        assert asyncio.run(main()) == count
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+        worker_db.close()
+    return len(statements)
+
+
+def test_batch_costs_fixed_queries(db, whatsapp_tenant, stub_whatsapp):
+    _run_batch(db, whatsapp_tenant, 1)  # warms the entitlement cache
+    small = _run_batch(db, whatsapp_tenant, 2)
+    large = _run_batch(db, whatsapp_tenant, 12)
+
+    assert small == large
+    statuses = {row.status for row in db.query(NotificationOutbox)}
+    assert statuses == {NotificationStatus.SENT.value}
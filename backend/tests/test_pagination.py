@@ -0,0 +1,110 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from app.models import Member, MemberFee
+
+
+def _add_members(db, tenant_id: int, count: int):
+    # Inserted in one statement batch, so created_at (server default) ties
+    members = [
+        Member(
+            tenant_id=tenant_id,
+            first_name=f"Member{chr(ord('a') + i)}",
+            last_name="Test",
+            phone_number=f"98{i:08d}",
+            joining_date=date.today(),
+            membership_expiry_date=date.today() + timedelta(days=30),
+        )
+        for i in range(count)
+    ]
+    db.add_all(members)
+    db.commit()
+    return members
+
+
+def _add_fees(db, member: Member, count: int):
+    fees = [
+        MemberFee(
+            member_id=member.id,
+            tenant_id=member.tenant_id,
+            original_amount=Decimal("100"),
+            amount_paid=Decimal("100"),
+            payment_method="cash",
+            # Two fees per day, so pages split inside a payment_date
+            payment_date=date(2026, 1, 1) + timedelta(days=i // 2),
+            payment_status="paid",
+        )
+        for i in range(count)
+    ]
+    db.add_all(fees)
+    db.commit()
+    return fees
+
+
+def _follow(client, headers, url: str, key: str, page_size: int = 2):
+    """Collect item ids page by page through next_cursor."""
+    pages = []
+    params = {"page_size": page_size}
+    while True:
+        response = client.get(url, headers=headers, params=params)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        pages.append([item["id"] for item in body[key]])
+        if not body["next_cursor"]:
+            return pages
+        assert len(pages) < 10, f"cursor paging does not advance: {pages}"
+        params = {"page_size": page_size, "cursor": body["next_cursor"]}
+
+
+def test_fee_list_follows_cursor(client, db, owner_headers, whatsapp_tenant):
+    member = _add_members(db, whatsapp_tenant, 1)[0]
+    fees = _add_fees(db, member, 5)
+
+    pages = _follow(client, owner_headers, "/api/fees/", "fees")
+
+    expected = sorted(fees, key=lambda f: (f.payment_date, f.id), reverse=True)
+    assert pages == [
+        [f.id for f in expected[0:2]],
+        [f.id for f in expected[2:4]],
+        [f.id for f in expected[4:5]],
+    ]
+
+
+def test_member_fee_history_follows_cursor(client, db, owner_headers, whatsapp_tenant):
+    member = _add_members(db, whatsapp_tenant, 1)[0]
+    _add_fees(db, member, 3)
+
+    pages = _follow(client, owner_headers, f"/api/fees/members/{member.id}", "fees")
+
+    assert [len(page) for page in pages] == [2, 1]
+    assert len({fee_id for page in pages for fee_id in page}) == 3
+
+
+def test_member_list_follows_cursor(client, db, owner_headers, whatsapp_tenant):
+    members = _add_members(db, whatsapp_tenant, 5)
+
+    pages = _follow(client, owner_headers, "/api/members/", "members")
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert sorted(i for page in pages for i in page) == sorted(m.id for m in members)
+
+
+def test_member_cursor_mixes_stored_timestamp_formats(db, whatsapp_tenant):
+    from app.services.member_service import get_members_by_tenant
+
+    members = _add_members(db, whatsapp_tenant, 4)
+    # Python-side values are stored with microseconds, server defaults without
+    members[0].created_at = members[1].created_at.replace(microsecond=250000)
+    members[2].created_at = members[1].created_at.replace(microsecond=0)
+    db.commit()
+
+    seen, cursor = [], None
+    for _ in range(4):
+        page, _, cursor = get_members_by_tenant(
+            db, whatsapp_tenant, limit=1, cursor=cursor, include_total=False
+        )
+        seen += [m.id for m in page]
+        if not cursor:
+            break
+
+    assert sorted(seen) == sorted(m.id for m in members)
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from app.core.exceptions import ServiceOverloadedException
+from app.core.password_hasher import PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(workers=1, max_pending=2, timeout=0.2)
+    yield hasher
+    hasher.shutdown(wait=False)
+
+
+def _wait_for(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_timed_out_calls_stay_pending_while_running(hasher):
+    assert hasher._run(sum, [1, 2]) == 3  # starts the pool
+
+    for _ in range(2):
+        with pytest.raises(ServiceOverloadedException):
+            hasher._run(time.sleep, 1.0)
+
+    # Both sleeps still occupy the pool: new work is refused at once
+    assert hasher._pending == 2
+    started = time.perf_counter()
+    with pytest.raises(ServiceOverloadedException):
+        hasher._run(sum, [1, 2])
+    assert time.perf_counter() - started < 0.1
+
+    assert _wait_for(lambda: hasher._pending == 0)
+    assert hasher._run(sum, [1, 2]) == 3
+
+
+def test_inline_mode_runs_without_pool():
+    assert PasswordHasher(workers=-1)._run(sum, [1, 2]) == 3
@@ -0,0 +1,39 @@
+from datetime import date, timedelta
+
+from app.models import Member, NotificationOutbox
+from app.services import reminder_service
+from app.services.reminder_service import run_expiry_reminders
+
+
+def test_tenant_access_does_not_commit_the_page(db, whatsapp_tenant, monkeypatch):
+    run_date = date.today()
+    for i in range(3):
+        db.add(
+            Member(
+                tenant_id=whatsapp_tenant,
+                first_name="Asha",
+                last_name="Rao",
+                phone_number=f"98{i:08d}",
+                joining_date=run_date,
+                membership_expiry_date=run_date + timedelta(days=3),
+            )
+        )
+    db.commit()
+
+    sessions = []
+    real_access_error = reminder_service.whatsapp_service.access_error
+
+    def access_error(access_db, tenant_id, entitlement=None):
+        # Entitlement loads may commit (lapsed subscription write-back)
+        sessions.append(access_db)
+        error = real_access_error(access_db, tenant_id, entitlement)
+        access_db.commit()
+        return error
+
+    monkeypatch.setattr(reminder_service.whatsapp_service, "access_error", access_error)
+
+    enqueued = run_expiry_reminders(db, run_date, days_before_expiry=3)
+
+    assert enqueued == 3
+    assert sessions and all(s is not db for s in sessions)
+    assert db.query(NotificationOutbox).count() == 3
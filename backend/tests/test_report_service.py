@@ -0,0 +1,48 @@
+from datetime import date
+
+import pytest
+
+from app.schemas.reports import TrendGranularity
+from app.services.report_service import _bucket_range, report_service
+
+
+@pytest.mark.parametrize(
+    "granularity, end_date, expected",
+    [
+        (
+            TrendGranularity.MONTH,
+            date(2026, 1, 20),
+            [date(2025, 11, 1), date(2025, 12, 1), date(2026, 1, 1)],
+        ),
+        (
+            TrendGranularity.WEEK,
+            date(2025, 11, 19),
+            [date(2025, 11, 10), date(2025, 11, 17)],
+        ),
+        (
+            TrendGranularity.DAY,
+            date(2025, 11, 17),
+            [date(2025, 11, 15), date(2025, 11, 16), date(2025, 11, 17)],
+        ),
+    ],
+)
+def test_bucket_range_covers_requested_dates(granularity, end_date, expected):
+    assert _bucket_range(date(2025, 11, 15), end_date, granularity) == expected
+
+
+def test_trends_reject_inverted_range(db):
+    with pytest.raises(ValueError, match="start_date"):
+        report_service.get_trends(
+            db, 1, start_date=date(2026, 2, 1), end_date=date(2026, 1, 1)
+        )
+
+
+def test_trends_reject_too_many_buckets(db):
+    with pytest.raises(ValueError, match="coarser granularity"):
+        report_service.get_trends(
+            db,
+            1,
+            granularity=TrendGranularity.DAY,
+            start_date=date(2024, 1, 1),
+            end_date=date(2026, 1, 1),
+        )
@@ -0,0 +1,60 @@
+from app.core import resilience
+from app.core.resilience import CircuitBreaker, CircuitState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(monkeypatch) -> tuple[CircuitBreaker, FakeClock]:
+    clock = FakeClock()
+    monkeypatch.setattr(resilience.time, "monotonic", clock)
+    return CircuitBreaker(failure_threshold=2, cooldown_seconds=30), clock
+
+
+def test_late_failures_do_not_extend_cooldown(monkeypatch):
+    breaker, clock = _breaker(monkeypatch)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    # Calls that were already in flight fail later on
+    clock.now += 20
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.retry_after() == 10
+    clock.now += 10
+    assert breaker.allow_request() is True
+    assert breaker.state == CircuitState.HALF_OPEN
+
+
+def test_failed_trial_reopens_with_fresh_cooldown(monkeypatch):
+    breaker, clock = _breaker(monkeypatch)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now += 30
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False  # one trial at a time
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.retry_after() == 30
+
+
+def test_success_closes_circuit(monkeypatch):
+    breaker, clock = _breaker(monkeypatch)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now += 30
+    assert breaker.allow_request() is True
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.consecutive_failures == 0
@@ -0,0 +1,25 @@
+from app.services.subscription_service import get_subscription_status_snapshot
+from app.services.usage_service import get_usage, record_usage
+
+
+def test_status_refreshes_after_usage_commit(db, whatsapp_tenant):
+    before = get_subscription_status_snapshot(db, whatsapp_tenant)
+
+    record_usage(db, whatsapp_tenant, members=3)
+    # Not committed yet: the cached status stays in place
+    assert get_subscription_status_snapshot(db, whatsapp_tenant) is before
+
+    db.commit()
+    after = get_subscription_status_snapshot(db, whatsapp_tenant)
+    assert after is not before
+    assert get_usage(db, whatsapp_tenant)["member_count"] == 3
+
+
+def test_rolled_back_usage_keeps_cached_status(db, whatsapp_tenant):
+    before = get_subscription_status_snapshot(db, whatsapp_tenant)
+
+    record_usage(db, whatsapp_tenant, members=3)
+    db.rollback()
+    db.commit()
+
+    assert get_subscription_status_snapshot(db, whatsapp_tenant) is before
@@ -0,0 +1,151 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.services.whatsapp_service import WhatsAppService
+
+
+@pytest.fixture
+def service(wppconnect_stub, monkeypatch):
+    """A fresh WhatsAppService whose pooled client talks to the stub."""
+    _, base_url = wppconnect_stub
+    monkeypatch.setattr(settings, "WHATSAPP_RATE_PER_SECOND", 0)
+    svc = WhatsAppService()
+    svc.base_url = base_url
+    svc.enabled = True
+    return svc
+
+
+def _run(svc: WhatsAppService, coro):
+    async def main():
+        try:
+            return await coro
+        finally:
+            await svc.aclose()
+
+    return asyncio.run(main())
+
+
+def test_send_text_message(service, db, whatsapp_tenant, wppconnect_stub):
+    stub, _ = wppconnect_stub
+    before = stub.stats["requests"]
+
+    result = _run(
+        service,
+        service.send_text_message(db, whatsapp_tenant, "9876543210", "Hello"),
+    )
+
+    assert result["success"] is True
+    assert result["data"]["response"][0]["type"] == "chat"
+    assert result["data"]["response"][0]["session"] == f"tenant-{whatsapp_tenant}"
+    assert stub.stats["requests"] == before + 1
+
+
+def test_send_image_message(service, db, whatsapp_tenant):
+    result = _run(
+        service,
+        service.send_image_message(
+            db,
+            whatsapp_tenant,
+            "9876543210",
+            "https://example.com/plan.png",
+            caption="Your plan",
+        ),
+    )
+
+    assert result["success"] is True
+    assert result["data"]["response"][0]["type"] == "image"
+
+
+def test_send_welcome_message_sends(service, db, whatsapp_tenant, wppconnect_stub):
+    stub, _ = wppconnect_stub
+    before = stub.stats["requests"]
+
+    result = _run(
+        service,
+        service.send_welcome_message(
+            db,
+            whatsapp_tenant,
+            "9876543210",
+            member_name="Asha",
+            membership_type="Monthly",
+            joining_date=date.today(),
+            expiry_date=date.today() + timedelta(days=30),
+            gym_name="Stub Gym",
+        ),
+    )
+
+    assert result["success"] is True
+    assert stub.stats["requests"] == before + 1
+
+
+def test_render_welcome_message():
+    message = WhatsAppService().render_welcome_message(
+        member_name="Asha",
+        membership_type="Monthly",
+        joining_date=date(2026, 1, 1),
+        expiry_date=date(2026, 1, 31),
+        gym_name="Stub Gym",
+    )
+
+    assert "Welcome to Stub Gym" in message
+    assert "31 January 2026" in message
+
+
+def test_send_batch_bounds_session_concurrency(
+    service, db, whatsapp_tenant, wppconnect_stub, monkeypatch
+):
+    stub, _ = wppconnect_stub
+    monkeypatch.setattr(settings, "WHATSAPP_SESSION_CONCURRENCY", 4)
+    stub.stats["max_in_flight"] = 0
+    messages = [
+        {"phone_number": f"98{i:08d}", "message": f"Reminder {i}", "ref": i}
+        for i in range(40)
+    ]
+
+    batch = _run(service, service.send_batch(db, whatsapp_tenant, iter(messages)))
+
+    assert batch["refused"] is False
+    assert (batch["total"], batch["sent_count"], batch["failed_count"]) == (40, 40, 0)
+    assert [r["ref"] for r in batch["results"]] == list(range(40))
+    assert 1 < stub.stats["max_in_flight"] <= 4
+
+
+def test_send_batch_reports_stub_failures(
+    service, db, whatsapp_tenant, wppconnect_stub, monkeypatch
+):
+    stub, _ = wppconnect_stub
+    monkeypatch.setattr(stub, "FAIL_EVERY", 1)
+
+    batch = _run(
+        service,
+        service.send_batch(
+            db,
+            whatsapp_tenant,
+            [{"phone_number": "9876543210", "message": "Hi", "ref": 1}],
+        ),
+    )
+
+    assert batch["refused"] is False
+    assert batch["failed_count"] == 1
+    assert batch["results"][0]["success"] is False
+
+
+def test_send_batch_refused_without_entitlement(
+    service, db, basic_tenant, wppconnect_stub
+):
+    stub, _ = wppconnect_stub
+    before = stub.stats["requests"]
+
+    batch = _run(
+        service,
+        service.send_batch(
+            db, basic_tenant, [{"phone_number": "9876543210", "message": "Hi"}]
+        ),
+    )
+
+    assert batch["refused"] is True
+    assert batch["sent_count"] == 0
+    assert stub.stats["requests"] == before